@@ -2,3 +2,12 @@ from .__version__ import __version__
 from .config import *
 from .configs import *
 from .cjapy import *
+from .asynccja import AsyncCJA
+from .connector import RateLimiter, RetryPolicy
+from .tokencache import TokenCache
+from .componentstore import ComponentStore
+from .reportcache import ReportCache, MemoryReportBackend, DiskReportBackend
+from .arrowutils import toArrowTable, writeParquet, arrowToDataFrame
+from .componentmatcher import ComponentMatcher
+from .componentindex import ComponentUsageIndex
+from .componentgraph import ComponentDependencyGraph
@@ -0,0 +1,127 @@
+import json
+import time
+from typing import Union
+
+import pandas as pd
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def _requirePyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError(
+            "The Arrow and Parquet outputs require the optional pyarrow library: pip install cjapy[parquet] (or pip install pyarrow)"
+        )
+
+
+def isArrowOutput(output: str = None) -> bool:
+    """
+    Return True if the output parameter of a list method asks for an Arrow table or a Parquet file.
+    Arguments:
+        output : REQUIRED : value of the output parameter ("arrow", "parquet" or a path ending with .parquet)
+    """
+    return isinstance(output, str) and (
+        output in ("arrow", "parquet") or output.lower().endswith(".parquet")
+    )
+
+
+def _arrowColumn(column: pd.Series) -> "pyarrow.Array":
+    """
+    Convert a column of the dataframe into an Arrow array.
+    The nested elements (dictionaries, lists) are serialized in JSON, the columns mixing types are stored as strings.
+    """
+    if column.dtype == object:
+        values = column.dropna()
+        if values.map(lambda value: isinstance(value, (dict, list))).any():
+            column = column.map(
+                lambda value: json.dumps(value) if isinstance(value, (dict, list)) else value
+            )
+    try:
+        return pyarrow.array(column, from_pandas=True)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return pyarrow.array(
+            column.map(lambda value: None if pd.isna(value) else str(value)),
+            type=pyarrow.string(),
+            from_pandas=True,
+        )
+
+
+def toArrowTable(data: Union[list, pd.DataFrame] = None) -> "pyarrow.Table":
+    """
+    Return an Arrow table from a list of elements returned by the API or from a dataframe.
+    The dtypes of the dataframe are kept (categorical columns become dictionary arrays), the nested elements are serialized in JSON.
+    Duplicated columns names get a suffix (name.1, name.2).
+    Arguments:
+        data : REQUIRED : list of dictionaries or dataframe
+    """
+    _requirePyarrow()
+    if data is None:
+        raise ValueError("Require data to convert")
+    if isinstance(data, pd.DataFrame) == False:
+        data = pd.DataFrame(data)
+    ## the columns names need to be unique for Parquet
+    names = []
+    for col in data.columns:
+        name, index = str(col), 1
+        while name in names:
+            name = f"{col}.{index}"
+            index += 1
+        names.append(name)
+    arrays = [_arrowColumn(data.iloc[:, index]) for index in range(len(names))]
+    return pyarrow.Table.from_arrays(arrays, names=names)
+
+
+def writeParquet(
+    data: Union[list, pd.DataFrame, "pyarrow.Table"] = None,
+    filename: str = None,
+    compression: str = "snappy",
+) -> str:
+    """
+    Write the data in a Parquet file and return the name of the file.
+    Arguments:
+        data : REQUIRED : list of dictionaries, dataframe or Arrow table
+        filename : OPTIONAL : name of the file (default cjapy_<timestamp>.parquet)
+        compression : OPTIONAL : compression codec (default "snappy")
+    """
+    _requirePyarrow()
+    if isinstance(data, pyarrow.Table) == False:
+        data = toArrowTable(data)
+    if filename is None:
+        filename = f"cjapy_{int(time.time())}.parquet"
+    pyarrow.parquet.write_table(data, str(filename), compression=compression)
+    return str(filename)
+
+
+def arrowToDataFrame(table: "pyarrow.Table" = None, zeroCopy: bool = True) -> pd.DataFrame:
+    """
+    Return a dataframe from an Arrow table.
+    Arguments:
+        table : REQUIRED : the Arrow table
+        zeroCopy : OPTIONAL : if True (default), the columns of the dataframe use the Arrow buffers (ArrowDtype) instead of copying them into numpy arrays.
+    """
+    _requirePyarrow()
+    if table is None:
+        raise ValueError("Require an Arrow table")
+    if zeroCopy:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    return table.to_pandas()
+
+
+def formatArrowOutput(data: Union[list, pd.DataFrame] = None, output: str = "arrow", name: str = "cjapy"):
+    """
+    Return the Arrow table when output is "arrow", otherwise write the Parquet file and return its name.
+    Arguments:
+        data : REQUIRED : list of dictionaries or dataframe
+        output : REQUIRED : "arrow", "parquet" (file name <name>_<timestamp>.parquet) or the path of the Parquet file
+        name : OPTIONAL : prefix of the default Parquet file name
+    """
+    table = toArrowTable(data)
+    if output == "arrow":
+        return table
+    if output == "parquet":
+        output = f"{name}_{int(time.time())}.parquet"
+    return writeParquet(table, output)
@@ -0,0 +1,827 @@
+import asyncio
+import json
+from copy import deepcopy
+from functools import partial
+from math import ceil
+from typing import IO, Union
+
+# Non standard libraries
+import pandas as pd
+from cjapy import config, connector
+from .cjapy import CJA, JsonListOrDataFrameType
+from .workspace import Workspace
+from .projects import Project
+from .arrowutils import isArrowOutput, formatArrowOutput
+from .reportcache import ReportCache
+
+
+class AsyncCJA:
+    """
+    Class that instantiate an asyncio connection to a single CJA API connection.
+    It exposes awaitable versions of the main read methods of the CJA class.
+    The token is shared with a CJA instance, that is also used to build the Workspace from the reports.
+    """
+
+    def __init__(
+        self,
+        config_object: dict = config.config_object,
+        header: dict = config.header,
+        loggingObject: dict = None,
+        maxConcurrency: int = 10,
+        cja: CJA = None,
+        rateLimiter: connector.RateLimiter = None,
+        retryPolicy: connector.RetryPolicy = None,
+        backgroundRefresh: bool = False,
+        tokenCache: connector.TokenCache = None,
+        reportCache: ReportCache = None,
+    ) -> None:
+        """
+        Instantiate the class with the information provided.
+        Arguments:
+            loggingObject : OPTIONAL :If you want to set logging capability for your actions.
+            header : REQUIRED : config header loaded (DO NOT MODIFY)
+            config_object : REQUIRED : config object loaded (DO NOT MODIFY)
+            maxConcurrency : OPTIONAL : maximum number of requests sent at the same time (default 10)
+            cja : OPTIONAL : an existing CJA instance to share the token with.
+            rateLimiter : OPTIONAL : RateLimiter instance pacing the requests, when no CJA instance is passed.
+            retryPolicy : OPTIONAL : RetryPolicy instance used for the requests, when no CJA instance is passed.
+            backgroundRefresh : OPTIONAL : renew the token in a background thread, when no CJA instance is passed.
+            tokenCache : OPTIONAL : TokenCache instance sharing the token between processes, when no CJA instance is passed.
+            reportCache : OPTIONAL : ReportCache instance caching the getReport responses, when no CJA instance is passed.
+        """
+        if cja is None:
+            cja = CJA(
+                config_object=config_object,
+                header=header,
+                loggingObject=loggingObject,
+                poolSize=maxConcurrency,
+                rateLimiter=rateLimiter,
+                retryPolicy=retryPolicy,
+                backgroundRefresh=backgroundRefresh,
+                tokenCache=tokenCache,
+                reportCache=reportCache,
+            )
+        self.cja = cja
+        self.loggingEnabled = cja.loggingEnabled
+        self.logger = cja.logger
+        self.connector = connector.AsyncAdobeRequest(
+            connector=cja.connector,
+            maxConcurrency=maxConcurrency,
+            loggingEnabled=self.loggingEnabled,
+            logger=self.logger,
+        )
+        self.endpoint = cja.endpoint
+
+    async def close(self) -> None:
+        """
+        Close the connections opened by the async connector.
+        The instance can also be used as an async context manager to close them automatically.
+        """
+        await self.connector.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _getAllPages(
+        self,
+        path: str,
+        params: dict,
+        lastKey: str = "lastPage",
+        pageKey: str = "page",
+        sizeKey: str = "limit",
+        n_results: Union[int, str] = "inf",
+        **kwargs,
+    ) -> list:
+        """
+        Loop through the pages of a list endpoint and return the content of all pages, in the page order.
+        When the first response provides the total number of pages, the remaining pages are requested concurrently.
+        Arguments:
+            path : REQUIRED : path of the endpoint
+            params : REQUIRED : parameters of the request, containing the page key.
+            lastKey : OPTIONAL : key of the response defining the last page.
+            pageKey : OPTIONAL : parameter defining the page requested ("page" by default)
+            sizeKey : OPTIONAL : parameter defining the number of results per page ("limit" by default), used to estimate the pages needed for n_results
+            n_results : OPTIONAL : stop requesting new pages once that number of results is reached (default "inf")
+        """
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        data = res.get("content", [])
+        lastPage = res.get(lastKey, True)
+        if float(len(data)) >= float(n_results):
+            lastPage = True
+        totalPages = res.get("totalPages")
+        if lastPage != True and totalPages is not None:
+            endPage = totalPages
+            if n_results != "inf" and len(data) > 0:
+                pageSize = params.get(sizeKey, len(data))
+                endPage = min(totalPages, params[pageKey] + ceil(float(n_results) / pageSize))
+            pendingPages = []
+            for page in range(params[pageKey] + 1, endPage):
+                pageParams = deepcopy(params)
+                pageParams[pageKey] = page
+                pendingPages.append(
+                    self.connector.getData(
+                        self.endpoint + path, params=pageParams, **kwargs
+                    )
+                )
+            for res in await asyncio.gather(*pendingPages):
+                data += res.get("content", [])
+        else:
+            while lastPage != True:
+                params[pageKey] += 1
+                res = await self.connector.getData(
+                    self.endpoint + path, params=params, **kwargs
+                )
+                data += res.get("content", [])
+                lastPage = res.get(lastKey, True)
+                if float(len(data)) >= float(n_results):
+                    lastPage = True
+        return data
+
+    async def getFilters(
+        self,
+        limit: int = 1000,
+        full: bool = False,
+        output: str = "df",
+        includeType: str = "all",
+        name: str = None,
+        dataIds: str = None,
+        ownerId: str = None,
+        filterByIds: str = None,
+        cached: bool = True,
+        **kwargs
+    ) -> JsonListOrDataFrameType:
+        """
+        Returns a list of filters used in CJA.
+        Arguments:
+            limit : OPTIONAL : number of result per request (default 1000)
+            full : OPTIONAL : add additional information to the filters
+            output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            includeType : OPTIONAL : Include additional segments not owned by user.(default all)
+                possible values are "shared" "templates" "deleted" "internal"
+            name : OPTIONAL : Filter list to only include filters that contains the Name
+            dataIds : OPTIONAL : Filter list to only include filters tied to the specified data group ID list (comma-delimited)
+            ownerId : OPTIONAL : Filter by a specific owner ID.
+            filterByIds : OPTIONAL : Filters by filter ID (comma-separated list)
+            cached : OPTIONAL : return cached results
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"async getFilters start, output: {output}")
+        path = "/filters"
+        params = {
+            "limit": limit,
+            "cached": cached,
+            "includeType": includeType,
+            "page": 0,
+        }
+        if full:
+            params[
+                "expansion"
+            ] = "compatibility,definition,internal,modified,isDeleted,definitionLastModified,createdDate,recentRecordedAccess,performanceScore,owner,dataId,ownerFullName,dataName,sharesFullName,approved,favorite,shares,tags,usageSummary,usageSummaryWithRelevancyScore"
+        if name is not None:
+            params["name"] = name
+        if dataIds is not None:
+            params["dataIds"] = dataIds
+        if ownerId is not None:
+            params["ownerId"] = ownerId
+        if filterByIds is not None:
+            params["filterByIds"] = filterByIds
+        data = await self._getAllPages(path, params, **kwargs)
+        self.cja._cacheComponents(("filter",), data, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "filters")
+        if output == "df":
+            df = pd.DataFrame(data)
+            return df
+        return data
+
+    async def getFilter(
+        self, filterId: str = None, full: bool = False, useMetadataCache: bool = True, **kwargs
+    ) -> dict:
+        """
+        Returns a single filter definition by its ID.
+        Arguments:
+            filterId : REQUIRED : ID of the filter
+            full : OPTIONAL : Boolean to define additional elements
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
+        """
+        if filterId is None:
+            raise ValueError("Require a filter ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getFilter start, id: {filterId}")
+        key = ("filter", filterId, full)
+        if useMetadataCache:
+            cached = self.cja._getCachedComponent(key)
+            if cached is not None:
+                return cached
+        path = f"/filters/{filterId}"
+        params = {}
+        if full:
+            params[
+                "expansion"
+            ] = "compatibility,definition,internal,modified,isDeleted,definitionLastModified,createdDate,recentRecordedAccess,performanceScore,owner,dataId,ownerFullName,dataName,sharesFullName,approved,favorite,shares,tags,usageSummary,usageSummaryWithRelevancyScore"
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self.cja._cacheComponent(key, res)
+        return res
+
+    async def getCalculatedMetrics(
+        self,
+        full: bool = False,
+        inclType: str = "all",
+        dataIds: str = None,
+        ownerId: str = None,
+        limit: int = 1000,
+        filterByIds: str = None,
+        favorite: bool = False,
+        approved: bool = False,
+        output: str = "df",
+        **kwargs
+    ) -> JsonListOrDataFrameType:
+        """
+        Returns a dataframe or the list of calculated Metrics.
+        Arguments:
+            full : OPTIONAL : returns all possible attributs if set to True (False by default)
+            inclType : OPTIONAL : returns the type selected (default "all")
+            dataIds : OPTIONAL : Filters the result to calculated metrics tied to a specific Data View ID (comma-delimited)
+            ownerId : OPTIONAL : Filters the result by specific loginId.
+            limit : OPTIONAL : Number of results per request (Default 1000)
+            filterByIds : OPTIONAL : Filter list to only include calculated metrics in the specified list (comma-delimited),
+            favorite : OPTIONAL : If set to true, return only favorties calculated metrics. (default False)
+            approved : OPTIONAL : If set to true, returns only approved calculated metrics. (default False)
+            output : OPTIONAL : by default returns a "dataframe", can also return the list when set to "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"async getCalculatedMetrics start, output: {output}")
+        path = "/calculatedmetrics"
+        params = {
+            "limit": limit,
+            "includeType": inclType,
+            "pagination": False,
+            "page": 0,
+        }
+        if full:
+            params[
+                "expansion"
+            ] = "definition,dataName,approved,favorite,shares,tags,sharesFullName,usageSummary,usageSummaryWithRelevancyScore,reportSuiteName,siteTitle,ownerFullName,modified,migratedIds,isDeleted,definition,authorization,compatibility,legacyId,internal,dataGroup,categories"
+        if dataIds is not None:
+            params["dataIds"] = dataIds
+        if ownerId is not None:
+            params["ownerId"] = ownerId
+        if filterByIds is not None:
+            params["filterByIds"] = filterByIds
+        if favorite:
+            params["favorite"] = favorite
+        if approved:
+            params["approved"] = approved
+        data = await self._getAllPages(path, params, **kwargs)
+        self.cja._cacheComponents(("calculatedMetric",), data, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "calculated_metrics")
+        if output == "df":
+            df = pd.DataFrame(data)
+            return df
+        return data
+
+    async def getCalculatedMetric(
+        self, calcId: str = None, full: bool = True, useMetadataCache: bool = True, **kwargs
+    ) -> dict:
+        """
+        Return a single calculated metrics based on its ID.
+        Arguments:
+            calcId : REQUIRED : The calculated metric
+            full : OPTIONAL : If you want to have all details
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
+        """
+        if calcId is None:
+            raise ValueError("Requires a Calculated Metrics ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getCalculatedMetric start, id: {calcId}")
+        key = ("calculatedMetric", calcId, full)
+        if useMetadataCache:
+            cached = self.cja._getCachedComponent(key)
+            if cached is not None:
+                return cached
+        path = f"/calculatedmetrics/{calcId}"
+        params = {"includeHidden": True}
+        if full:
+            params[
+                "expansion"
+            ] = "approved,favorite,shares,tags,sharesFullName,usageSummary,usageSummaryWithRelevancyScore,reportSuiteName,siteTitle,ownerFullName,modified,migratedIds,isDeleted,definition,authorization,compatibility,legacyId,internal,dataGroup,categories"
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self.cja._cacheComponent(key, res)
+        return res
+
+    async def getDimensions(
+        self,
+        dataviewId: str = None,
+        full: bool = False,
+        inclType: str = None,
+        output: str = "df",
+        **kwargs
+    ) -> JsonListOrDataFrameType:
+        """
+        Used to retrieve dimensions for a dataview
+        Arguments:
+            dataviewId : REQUIRED : the Data View ID to retrieve data from.
+            full : OPTIONAL : To add additional elements (default False)
+            inclType : OPTIONAL : Possibility to add "hidden" values
+            output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+        """
+        if dataviewId is None:
+            raise ValueError("Require a Data View ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getDimensions start")
+        path = f"/datagroups/data/{dataviewId}/dimensions"
+        params = {"page": 0}
+        if full:
+            params[
+                "expansion"
+            ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,bucketingSetting,noValueOptionsSetting,defaultDimensionSort,persistenceSetting,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
+        if inclType == "hidden":
+            params["includeType"] = "hidden"
+        dimensions = await self._getAllPages(path, params, **kwargs)
+        self.cja._cacheComponents(("dimension", dataviewId), dimensions, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(dimensions, output, "dimensions")
+        if output == "df":
+            df = pd.DataFrame(dimensions)
+            return df
+        return dimensions
+
+    async def getDimension(
+        self,
+        dataviewId: str = None,
+        dimensionId: str = None,
+        full: bool = True,
+        useMetadataCache: bool = True,
+        **kwargs
+    ) -> dict:
+        """
+        Return a specific dimension based on the dataview ID and dimension ID passed.
+        Arguments:
+            dataviewId : REQUIRED : the Data View ID to retrieve data from.
+            dimensionId : REQUIRED : the dimension ID to return
+            full : OPTIONAL : To add additional elements (default True)
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
+        """
+        if dataviewId is None:
+            raise ValueError("Require a Data View ID")
+        if dimensionId is None:
+            raise ValueError("Require a Dimension ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getDimension start, id: {dimensionId}")
+        key = ("dimension", dataviewId, dimensionId, full)
+        if useMetadataCache:
+            cached = self.cja._getCachedComponent(key)
+            if cached is not None:
+                return cached
+        path = f"/datagroups/data/{dataviewId}/dimensions/{dimensionId}"
+        params = {}
+        if full:
+            params[
+                "expansion"
+            ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self.cja._cacheComponent(key, res)
+        return res
+
+    async def getMetrics(
+        self,
+        dataviewId: str = None,
+        full: bool = False,
+        inclType: str = None,
+        output: str = "df",
+        **kwargs
+    ) -> JsonListOrDataFrameType:
+        """
+        Used to retrieve metrics for a dataview
+        Arguments:
+            dataviewId : REQUIRED : the Data View ID to retrieve data from.
+            full : OPTIONAL : To add additional elements (default False)
+            inclType : OPTIONAL : Possibility to add "hidden" values
+            output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+        """
+        if dataviewId is None:
+            raise ValueError("Require a Data View ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getMetrics start")
+        path = f"/datagroups/data/{dataviewId}/metrics"
+        params = {"page": 0}
+        if full:
+            params[
+                "expansion"
+            ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
+        if inclType == "hidden":
+            params["includeType"] = "hidden"
+        metrics = await self._getAllPages(path, params, **kwargs)
+        self.cja._cacheComponents(("metric", dataviewId), metrics, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(metrics, output, "metrics")
+        if output == "df":
+            df = pd.DataFrame(metrics)
+            return df
+        return metrics
+
+    async def getMetric(
+        self,
+        dataviewId: str = None,
+        metricId: str = None,
+        full: bool = True,
+        useMetadataCache: bool = True,
+        **kwargs
+    ) -> dict:
+        """
+        Return a specific metric based on the dataview ID and dimension ID passed.
+        Arguments:
+            dataviewId : REQUIRED : the Data View ID to retrieve data from.
+            metricId : REQUIRED : the metric ID to return
+            full : OPTIONAL : To add additional elements (default True)
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
+        """
+        if dataviewId is None:
+            raise ValueError("Require a Data View ID")
+        if metricId is None:
+            raise ValueError("Require a Dimension ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getMetric start, id: {metricId}")
+        key = ("metric", dataviewId, metricId, full)
+        if useMetadataCache:
+            cached = self.cja._getCachedComponent(key)
+            if cached is not None:
+                return cached
+        path = f"/datagroups/data/{dataviewId}/metrics/{metricId}"
+        params = {}
+        if full:
+            params[
+                "expansion"
+            ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,bucketingSetting,noValueOptionsSetting,defaultDimensionSort,persistenceSetting,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self.cja._cacheComponent(key, res)
+        return res
+
+    async def getDataViews(
+        self,
+        limit: int = 100,
+        full: bool = True,
+        output: str = "df",
+        parentDataGroupId: str = None,
+        externalIds: str = None,
+        externalParentIds: str = None,
+        includeType: str = "all",
+        cached: bool = True,
+        **kwargs,
+    ) -> JsonListOrDataFrameType:
+        """
+        Returns the Data View configuration.
+        Arguments:
+            limit : OPTIONAL : number of results per request (default 100)
+            full : OPTIONAL : define if all possible information are returned (default True).
+            output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            parentDataGroupId : OPTIONAL : Filters data views by a single parentDataGroupId
+            externalIds : OPTIONAL : Comma-delimited list of external ids to limit the response with.
+            externalParentIds : OPTIONAL : Comma-delimited list of external parent ids to limit the response with.
+            includeType : OPTIONAL : include additional DataViews not owned by user.(default "all")
+            cached : OPTIONAL : return cached results
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"async getDataViews start, output: {output}")
+        path = "/datagroups/dataviews"
+        params = {
+            "limit": limit,
+            "includeType": includeType,
+            "cached": cached,
+            "page": 0,
+        }
+        if full:
+            params[
+                "expansion"
+            ] = "name,description,owner,isDeleted,parentDataGroupId,segmentList,currentTimezoneOffset,timezoneDesignator,modified,createdDate,organization,curationEnabled,recentRecordedAccess,sessionDefinition,curatedComponents,externalData,containerNames"
+        if parentDataGroupId:
+            params["parentDataGroupId"] = parentDataGroupId
+        if externalIds:
+            params["externalIds"] = externalIds
+        if externalParentIds:
+            params["externalParentIds"] = externalParentIds
+        data = await self._getAllPages(path, params, lastKey="last", **kwargs)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "dataviews")
+        if output == "df":
+            df = pd.DataFrame(data)
+            return df
+        return data
+
+    async def getDataView(
+        self, dataViewId: str = None, full: bool = True, **kwargs
+    ) -> dict:
+        """
+        Returns a specific Data View configuration from Configuration ID.
+        Arguments:
+            dataViewId : REQUIRED : The data view ID to retrieve.
+            full : OPTIONAL : getting extra information on the data view
+        """
+        if dataViewId is None:
+            raise ValueError("dataViewId is required")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getDataView start")
+        path = f"/datagroups/dataviews/{dataViewId}"
+        params = {}
+        if full:
+            params[
+                "expansion"
+            ] = "name,description,owner,isDeleted,parentDataGroupId,segmentList,currentTimezoneOffset,timezoneDesignator,modified,createdDate,organization,curationEnabled,recentRecordedAccess,sessionDefinition,curatedComponents,externalData,containerNames"
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        return res
+
+    async def getProjects(
+        self,
+        full: bool = True,
+        includeType: str = "all",
+        filterByIds: str = None,
+        ownerId: str = None,
+        limit: int = None,
+        usedIn: bool = False,
+        n_results: int = "inf",
+        output: str = "df",
+        **kwargs,
+    ) -> JsonListOrDataFrameType:
+        """
+        Returns a list of project ID with their meta information attached to it.
+        Arguments:
+            full : OPTIONAL : add all metadata attached to the project (default True)
+            includeType : OPTIONAL : Include additional segments not owned by user. ("all" or "shared")
+            filterByIds : OPTIONAL : Filter list to only include projects in the specified list (comma-delimited list of IDs)
+            ownerId : OPTIONAL : Filter list to only include projects owned by the specified imsUserId
+            limit : OPTIONAL : To limit the number of resutls returned per page.
+            usedIn : OPTIONAL : Additional parameter to compute some usage of the projects. Recommended to be used with limit
+            n_results : OPTIONAL : If you want to restrict to a certain number of requests (default: "inf" loop through all)
+            output : OPTIONAL : the type of output to return "df" or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"async getProjects start")
+        path = "/projects"
+        params = {"includeType": includeType}
+        if limit is not None:
+            params["limit"] = limit
+            params["page"] = kwargs.get("page", 0)
+            params["pagination"] = "true"
+        if full:
+            params[
+                "expansion"
+            ] = "shares,tags,accessLevel,modified,externalReferences,definition,ownerFullName,sharesFullName,complexity,lastRecordedAccess,usageSummary"
+        if usedIn:
+            params["expansion"] += ",usedIn"
+        if filterByIds:
+            params["filterByIds"] = filterByIds
+        if ownerId:
+            params["ownerId"] = ownerId
+        if params.get("pagination", "false") != "true":
+            data = await self.connector.getData(self.endpoint + path, params=params)
+        else:
+            data = await self._getAllPages(path, params, n_results=n_results)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "projects")
+        if output == "raw":
+            return data
+        return pd.DataFrame(data)
+
+    async def getProject(
+        self,
+        projectId: str = None,
+        projectClass: bool = False,
+        dvIdSuffix: bool = False,
+        **kwargs,
+    ) -> Union[dict, Project]:
+        """
+        Return a specific project with its definition
+        Arguments:
+            projectId : REQUIRED : a project ID to return
+            projectClass : OPTIONAL : Return a Project class that digest the info.
+            dvIdSuffix : OPTIONAL : If you want to add data view ID as suffix of metrics and dimensions (::dvId)
+        """
+        if projectId is None:
+            raise ValueError("Require a Project ID")
+        if self.loggingEnabled:
+            self.logger.debug(f"async getProject start")
+        path = f"/projects/{projectId}"
+        params = {
+            "expansion": "shares,tags,accessLevel,modified,externalReferences,definition"
+        }
+        res = await self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        if projectClass:
+            return Project(res, dvIdSuffix=dvIdSuffix)
+        return res
+
+    async def getAuditLogs(
+        self,
+        startDate: str = None,
+        endDate: str = None,
+        action: str = None,
+        component: str = None,
+        componentId: str = None,
+        userType: str = None,
+        userId: str = None,
+        userEmail: str = None,
+        description: str = None,
+        pageSize: int = 100,
+        n_results: Union[str, int] = "inf",
+        output: str = "df",
+    ) -> JsonListOrDataFrameType:
+        """
+        Get Audit Log when few filters are applied.
+        All filters are applied with an AND condition.
+        Arguments:
+            startDate : OPTIONAL : begin range date, format: YYYY-01-01T00:00:00-07 (required if endDate is used)
+            endDate : OPTIONAL : begin range date, format: YYYY-01-01T00:00:00-07 (required if startDate is used)
+            action : OPTIONAL : The type of action a user or system can make.
+            component : OPTIONAL :The type of component.
+            componentId : OPTIONAL : The id of the component.
+            userType : OPTIONAL : The type of user.
+            userId : OPTIONAL : The ID of the user.
+            userEmail : OPTIONAL : The email address of the user.
+            description : OPTIONAL : The description of the audit log.
+            pageSize : OPTIONAL : Number of results per page. If left null, the default size is 100.
+            n_results : OPTIONAL : Total number of results you want for that search. Default "inf" will return everything
+            output : OPTIONAL : DataFrame by default, can be "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"async getAuditLogs start")
+        path = "/auditlogs/api/v1/auditlogs"
+        params = self.cja._getAuditLogsParams(
+            startDate=startDate,
+            endDate=endDate,
+            action=action,
+            component=component,
+            componentId=componentId,
+            userType=userType,
+            userId=userId,
+            userEmail=userEmail,
+            description=description,
+            pageSize=pageSize,
+        )
+        data = await self._getAllPages(
+            path,
+            params,
+            lastKey="last",
+            pageKey="pageNumber",
+            sizeKey="pageSize",
+            n_results=n_results,
+        )
+        if output == "raw":
+            return data
+        df = self.cja._formatAuditLogs(data)
+        if isArrowOutput(output):
+            return formatArrowOutput(df, output, "audit_logs")
+        return df
+
+    async def _postReport(self, path: str = None, dataRequest: dict = None, params: dict = None) -> dict:
+        """
+        Send a report request and return its response, from the report cache of the CJA instance when it is set.
+        Arguments:
+            path : REQUIRED : path of the reporting endpoint
+            dataRequest : REQUIRED : the report request (for one page)
+            params : REQUIRED : parameters of the request
+        """
+        reportCache = self.cja.reportCache
+        ## the cache backend can read and write on disk, it runs in the default executor to not block the event loop
+        loop = asyncio.get_running_loop()
+        if reportCache is not None:
+            res = await loop.run_in_executor(None, partial(reportCache.get, dataRequest, params))
+            if res is not None:
+                return res
+        res = await self.connector.postData(self.endpoint + path, data=dataRequest, params=params)
+        if reportCache is not None:
+            await loop.run_in_executor(None, partial(reportCache.set, dataRequest, params, res))
+        return res
+
+    async def getReport(
+        self,
+        request: Union[dict, IO] = None,
+        limit: int = 20000,
+        n_results: Union[int, str] = "inf",
+        allowRemoteLoad: str = "default",
+        useCache: bool = True,
+        useResultsCache: bool = False,
+        includeOberonXml: bool = False,
+        includePredictiveObjects: bool = False,
+        returnsNone: bool = None,
+        countRepeatInstances: bool = None,
+        ignoreZeroes: bool = None,
+        dataViewId: str = None,
+        resolveColumns: bool = True,
+        returnClass: bool = True,
+        parallel_pages: int = 1,
+    ) -> Union[Workspace, dict]:
+        """
+        Return an instance of Workspace that contains the data requested.
+        The Workspace is built outside of the event loop, by the CJA instance attached.
+        Argumnents:
+            request : REQUIRED : either a dictionary of a JSON file that contains the request information.
+            limit : OPTIONAL : number of results per request (default 20000)
+            n_results : OPTIONAL : total number of results returns. Use "inf" to return everything (default "inf")
+            allowRemoteLoad : OPTIONAL : Controls if Oberon should remote load data.
+            useCache : OPTIONAL : Use caching for faster requests (Do not do any report caching)
+            useResultsCache : OPTIONAL : Use results caching for faster reporting times
+            includeOberonXml : OPTIONAL : Controls if Oberon XML should be returned in the response - DEBUG ONLY
+            includePredictiveObjects : OPTIONAL : Controls if platform Predictive Objects should be returned in the response - DEBUG ONLY
+            returnsNone : OPTIONAL: Overwritte the request setting to return None values.
+            countRepeatInstances : OPTIONAL: Overwritte the request setting to count repeatInstances values.
+            ignoreZeroes : OPTIONAL : Ignore zeros in the results
+            dataViewId : OPTIONAL : Overwrite the data View ID used for report.
+            resolveColumns: OPTIONAL : automatically resolve columns from ID to name for calculated metrics & segments. Default True.
+            returnClass : OPTIONAL : return the class building dataframe and better comprehension of data. (default yes)
+            parallel_pages : OPTIONAL : number of pages requested at the same time after the first one (default 1, sequential)
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"Start async getReport")
+        path = "/reports"
+        params = {
+            "allowRemoteLoad": allowRemoteLoad,
+            "useCache": useCache,
+            "useResultsCache": useResultsCache,
+            "includeOberonXml": includeOberonXml,
+            "includePlatformPredictiveObjects": includePredictiveObjects,
+        }
+        dataRequest = self.cja._prepareReportRequest(
+            request,
+            limit=limit,
+            returnsNone=returnsNone,
+            countRepeatInstances=countRepeatInstances,
+            ignoreZeroes=ignoreZeroes,
+            dataViewId=dataViewId,
+        )
+        if self.loggingEnabled:
+            self.logger.debug(f"getReport request: {json.dumps(dataRequest,indent=4)}")
+        res = await self._postReport(path, dataRequest, params)
+        firstResponse = res
+        dataRows = None
+        if "rows" in res.keys():
+            dataRows = res.get("rows")
+            lastPage = res.get("lastPage", True)
+            if float(len(dataRows)) >= float(n_results):
+                lastPage = True
+            totalPages = res.get("totalPages")
+            if lastPage != True and parallel_pages > 1 and totalPages is not None:
+                endPage = self.cja._getReportEndPage(totalPages, limit, n_results)
+                semaphore = asyncio.Semaphore(parallel_pages)
+
+                async def fetchPage(page: int) -> list:
+                    pageRequest = self.cja._reportPageRequest(dataRequest, page)
+                    async with semaphore:
+                        pageResponse = await self._postReport(path, pageRequest, params)
+                    if "rows" not in pageResponse.keys():
+                        if "error-504" in pageResponse.keys():
+                            raise TimeoutError(pageResponse["error-504"])
+                        raise ValueError(
+                            f"Issue retrieving the page {page} of the report: {pageResponse}"
+                        )
+                    return pageResponse["rows"]
+
+                for rows in await asyncio.gather(
+                    *[fetchPage(page) for page in range(1, endPage)]
+                ):
+                    dataRows += rows
+                lastPage = True
+            page = dataRequest["settings"]["page"]
+            while lastPage != True:
+                page += 1
+                res = await self._postReport(
+                    path, self.cja._reportPageRequest(dataRequest, page), params
+                )
+                if "rows" not in res.keys():
+                    if "error-504" in res.keys():
+                        raise TimeoutError(res["error-504"])
+                    raise ValueError(
+                        f"Issue retrieving the page {page} of the report: {res}"
+                    )
+                dataRows += res["rows"]
+                lastPage = res.get("lastPage", True)
+                if float(len(dataRows)) >= float(n_results):
+                    lastPage = True
+            if returnClass == False:
+                return dataRows
+        else:
+            if "error-504" in res.keys():
+                raise TimeoutError(res["error-504"])
+            if returnClass == False:
+                return res
+        loop = asyncio.get_event_loop()
+        data = await loop.run_in_executor(
+            None,
+            partial(
+                self.cja._buildWorkspace,
+                dataRequest=dataRequest,
+                response=firstResponse,
+                dataRows=dataRows,
+                resolveColumns=resolveColumns,
+            ),
+        )
+        return data
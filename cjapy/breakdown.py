@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from itertools import chain
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .arrowutils import writeParquet
+
+
+class BreakdownLevel:
+    """
+    Accumulator of the breakdown results of one level of getMultidimensionalReport.
+    The results of each parent are kept as column arrays and the dataframe of the level is built once, when the level is complete.
+    A result is a dictionary of the columns: {"itemId":[...],"value":[...],"data":array of the metrics (one row per item)}
+    """
+
+    def __init__(self, level: int = 0, dimensions: list = None, metrics: list = None) -> None:
+        """
+        Instantiate the accumulator of a level.
+        Arguments:
+            level : REQUIRED : index of the level
+            dimensions : REQUIRED : list of the dimensions of the report, in the order of the breakdown
+            metrics : REQUIRED : list of the metrics ID
+        """
+        if dimensions is None:
+            raise ValueError("Require the list of dimensions")
+        if metrics is None:
+            raise ValueError("Require the list of metrics")
+        self.level = level
+        self.dimension = dimensions[level]
+        self.ancestors = list(dimensions[:level])
+        self.metrics = list(metrics)
+        self.parents = []
+        self.results = []
+
+    def add(self, parent: tuple = None, result: dict = None) -> None:
+        """
+        Add the result of the breakdown of a parent.
+        Arguments:
+            parent : REQUIRED : tuple of the breakdowns (dimension, itemId, value) of the result
+            result : REQUIRED : dictionary of the columns {"itemId","value","data"}
+        """
+        self.parents.append(parent)
+        self.results.append(result)
+
+    def __len__(self) -> int:
+        return sum(len(result["itemId"]) for result in self.results)
+
+    def getChildren(self) -> list:
+        """
+        Return the parents of the next level: one per item of that level.
+        """
+        return [
+            parent + ((self.dimension, itemId, value),)
+            for parent, result in zip(self.parents, self.results)
+            for itemId, value in zip(result["itemId"], result["value"])
+        ]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Build the dataframe of the level: the value of each previous dimension, the itemId, the value of the dimension and the metrics (float64).
+        """
+        counts = [len(result["itemId"]) for result in self.results]
+        columns = {}
+        for position, ancestor in enumerate(self.ancestors):
+            parentValues = np.empty(len(self.parents), dtype=object)
+            parentValues[:] = [parent[position][2] for parent in self.parents]
+            columns[ancestor] = np.repeat(parentValues, counts)
+        columns["itemId"] = pd.Categorical(
+            list(chain.from_iterable(result["itemId"] for result in self.results))
+        )
+        columns[self.dimension] = list(
+            chain.from_iterable(result["value"] for result in self.results)
+        )
+        metricsData = np.concatenate(
+            [np.empty((0, len(self.metrics)), dtype="float64")]
+            + [np.asarray(result["data"], dtype="float64").reshape(-1, len(self.metrics)) for result in self.results]
+        )
+        df = pd.DataFrame(columns, copy=False)
+        metricsFrame = pd.DataFrame(metricsData, columns=self.metrics, copy=False)
+        return pd.concat([df, metricsFrame], axis=1)
+
+    def save(self, path: str = None, format: str = "csv", dataframe: pd.DataFrame = None) -> str:
+        """
+        Write the dataframe of the level in the folder and return the name of the file.
+        The file is named level_<index>_<dimension>.<format>
+        Arguments:
+            path : REQUIRED : folder where the file is written (created if needed)
+            format : OPTIONAL : "csv" (default) or "parquet" (requires pyarrow)
+            dataframe : OPTIONAL : dataframe of the level, if it has already been built
+        """
+        if format not in ("csv", "parquet"):
+            raise ValueError("format can only be 'csv' or 'parquet'")
+        if dataframe is None:
+            dataframe = self.to_dataframe()
+        folder = Path(path)
+        folder.mkdir(parents=True, exist_ok=True)
+        dimensionName = re.sub(r"[^\w.-]+", "_", self.dimension)
+        filename = folder / f"level_{self.level}_{dimensionName}.{format}"
+        if format == "parquet":
+            return writeParquet(dataframe, filename)
+        dataframe.to_csv(filename, index=False)
+        return str(filename)
+
+
+class BreakdownCheckpoint:
+    """
+    Checkpoint of a getMultidimensionalReport job in a local folder.
+    Each breakdown returned is saved in its own JSON file, keyed by the hash of its request, so a job that stopped can be resumed without requesting again the breakdowns already returned.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Instantiate the checkpoint.
+        Arguments:
+            path : REQUIRED : folder of the checkpoint (created if needed)
+        """
+        if path is None:
+            raise ValueError("Require a folder for the checkpoint")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def getKey(request: dict = None, n_results: Union[int, str] = None) -> str:
+        """
+        Return the key of a breakdown request.
+        Arguments:
+            request : REQUIRED : the request sent to getReport, including the breakdown filters
+            n_results : OPTIONAL : number of results requested
+        """
+        definition = json.dumps({"request": request, "n_results": str(n_results)}, sort_keys=True)
+        return hashlib.sha256(definition.encode("utf-8")).hexdigest()
+
+    def _getFile(self, level: int, key: str) -> Path:
+        return self.path / f"level_{level}" / f"{key}.json"
+
+    def get(self, level: int = 0, key: str = None) -> dict:
+        """
+        Return the columns saved for that breakdown, or None if it has not been returned yet.
+        Arguments:
+            level : REQUIRED : index of the level
+            key : REQUIRED : key of the breakdown request
+        """
+        try:
+            with open(self._getFile(level, key), "r") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        result["data"] = np.array(result["data"], dtype="float64")
+        return result
+
+    def save(self, level: int = 0, key: str = None, result: dict = None) -> None:
+        """
+        Save the columns of a breakdown.
+        The file is written atomically, a job stopped during the write does not leave a partial result.
+        Arguments:
+            level : REQUIRED : index of the level
+            key : REQUIRED : key of the breakdown request
+            result : REQUIRED : dictionary of the columns {"itemId","value","data"}
+        """
+        filename = self._getFile(level, key)
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        tmpFile = filename.with_name(f"{filename.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmpFile, "w") as f:
+            json.dump(
+                {
+                    "itemId": list(result["itemId"]),
+                    "value": list(result["value"]),
+                    "data": np.asarray(result["data"]).tolist(),
+                },
+                f,
+            )
+        os.replace(tmpFile, filename)
+
+    def clear(self) -> None:
+        """
+        Remove the checkpoint folder.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+
+class MetadataCache:
+    """
+    In-memory cache of the components definition (filters, calculated metrics, dimensions, metrics).
+    The elements expire after ttl seconds and the least recently used elements are evicted when maxSize is reached.
+    The keys are tuples starting with the component type, ex: ("filter", filterId, full).
+    """
+
+    def __init__(self, ttl: float = 300, maxSize: int = 1000) -> None:
+        """
+        Instantiate the cache.
+        Arguments:
+            ttl : OPTIONAL : number of seconds an element is kept in the cache (default 300). 0 or None disables the cache.
+            maxSize : OPTIONAL : maximum number of elements in the cache (default 1000)
+        """
+        self.ttl = ttl
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.ttl) and self.ttl > 0 and self.maxSize > 0
+
+    def get(self, key: tuple) -> dict:
+        """
+        Return a copy of the element cached for that key, or None if it is not cached or expired.
+        Arguments:
+            key : REQUIRED : key of the element
+        """
+        if self.enabled == False:
+            return None
+        with self._lock:
+            element = self._data.get(key)
+            if element is None or element[0] < time.monotonic():
+                if element is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            value = element[1]
+        return deepcopy(value)
+
+    def set(self, key: tuple, value: dict) -> None:
+        """
+        Cache a copy of the element for that key.
+        Arguments:
+            key : REQUIRED : key of the element
+            value : REQUIRED : element to cache
+        """
+        if self.enabled == False:
+            return
+        value = deepcopy(value)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxSize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *keyPrefix) -> int:
+        """
+        Remove the elements whose key starts with the values passed and return the number of elements removed.
+        Example: invalidate("filter", filterId) removes the filter, whatever the other parts of the key.
+        Arguments:
+            keyPrefix : REQUIRED : first values of the keys to remove
+        """
+        size = len(keyPrefix)
+        with self._lock:
+            keys = [key for key in self._data if key[:size] == keyPrefix]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Remove all the elements and reset the counters.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Return the number of elements cached, hits and misses.
+        """
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -3,20 +3,34 @@
 import json
 from copy import deepcopy
 from pathlib import Path
-from typing import IO, Union, List
+from typing import IO, Union, List, Iterator, Callable
 from collections import defaultdict, deque
 import time, logging, re
-from itertools import tee
+from itertools import tee, islice
+from math import ceil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 # Non standard libraries
+import numpy as np
 import pandas as pd
 from cjapy import config, connector
 from .workspace import Workspace
 from .requestCreator import RequestCreator
-from .projects import Project
+from .projects import Project, ProjectSnapshot
+from .componentmatcher import ComponentMatcher
+from .componentindex import ComponentUsageIndex
+from .componentgraph import ComponentDependencyGraph
+from .cache import MetadataCache
+from .componentstore import ComponentStore
+from .sinks import getReportSink
+from .arrowutils import isArrowOutput, formatArrowOutput
+from .breakdown import BreakdownLevel, BreakdownCheckpoint
+from .reportcache import ReportCache
 
 JsonOrDataFrameType = Union[pd.DataFrame, dict]
 JsonListOrDataFrameType = Union[pd.DataFrame, List[dict]]
+JsonListOrDataFrameOrIteratorType = Union[pd.DataFrame, List[dict], Iterator[dict]]
 
 
 class CJA:
@@ -33,6 +47,17 @@ class CJA:
         config_object: dict = config.config_object,
         header: dict = config.header,
         loggingObject: dict = None,
+        poolSize: int = 10,
+        poolBlock: bool = False,
+        rateLimiter: connector.RateLimiter = None,
+        retryPolicy: connector.RetryPolicy = None,
+        backgroundRefresh: bool = False,
+        tokenCache: connector.TokenCache = None,
+        metadataCacheTTL: float = 0,
+        metadataCacheSize: int = 1000,
+        componentStore: ComponentStore = None,
+        componentStoreMaxAge: float = 86400,
+        reportCache: ReportCache = None,
     ) -> None:
         """
         Instantiate the class with the information provided.
@@ -40,6 +65,24 @@ class CJA:
             loggingObject : OPTIONAL :If you want to set logging capability for your actions.
             header : REQUIRED : config header loaded (DO NOT MODIFY)
             config_object : REQUIRED : config object loaded (DO NOT MODIFY)
+            poolSize : OPTIONAL : number of connections kept open to the API and reused by the requests (default 10)
+            poolBlock : OPTIONAL : if set to True, never open more than poolSize connections at the same time (default False)
+            rateLimiter : OPTIONAL : RateLimiter instance pacing the requests.
+                The same instance can be passed to several CJA instances, or use RateLimiter.shared() for the process wide one.
+            retryPolicy : OPTIONAL : RetryPolicy instance defining how the throttled or failed requests are retried.
+            backgroundRefresh : OPTIONAL : renew the token in a background thread before it expires,
+                so the requests never wait for a token refresh. (default False)
+            tokenCache : OPTIONAL : TokenCache instance storing the token on disk, so other processes can reuse it.
+                Pass True to use the default cache file (token_cache.json in the .cjapy folder of your home directory).
+            metadataCacheTTL : OPTIONAL : number of seconds the filters, calculated metrics, dimensions and metrics definitions
+                are kept in memory (default 0, the metadata cache is disabled). Ex: 300 for 5 minutes.
+            metadataCacheSize : OPTIONAL : maximum number of components kept in the metadata cache (default 1000)
+            componentStore : OPTIONAL : ComponentStore instance, a local SQLite store of the components definition.
+                It is synchronized with the syncComponentStore method.
+            componentStoreMaxAge : OPTIONAL : number of seconds after the last synchronization of the store
+                during which the components are read from the store (default 86400)
+            reportCache : OPTIONAL : ReportCache instance caching the getReport responses, keyed by the request fingerprint.
+                Pass True to use an in-memory cache with the default settings.
         """
         if loggingObject is not None and sorted(
             ["level", "stream", "format", "filename", "file"]
@@ -61,13 +104,236 @@ class CJA:
             header=header,
             loggingEnabled=self.loggingEnabled,
             logger=self.logger,
+            poolSize=poolSize,
+            poolBlock=poolBlock,
+            rateLimiter=rateLimiter,
+            retryPolicy=retryPolicy,
+            backgroundRefresh=backgroundRefresh,
+            tokenCache=tokenCache,
         )
         self.header = self.connector.header
         self.endpoint = config.endpoints["global"]
         self.listProjectIds = []
         self.projectsDetails = {}
+        self.projectsDetailsErrors = {}
+        self.componentUsageIndex = None
         self.filters = []
         self.calculatedMetrics: JsonListOrDataFrameType = []
+        self.metadataCache = MetadataCache(ttl=metadataCacheTTL, maxSize=metadataCacheSize)
+        self.componentStore = componentStore
+        self.componentStoreMaxAge = componentStoreMaxAge
+        if reportCache == True:
+            reportCache = ReportCache()
+        self.reportCache = reportCache or None
+
+    def close(self) -> None:
+        """
+        Close the connections opened to the CJA API.
+        The instance can also be used as a context manager to close them automatically.
+        """
+        if self.loggingEnabled:
+            self.logger.debug("closing the CJA connector")
+        self.connector.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _cacheComponent(self, key: tuple = None, element: dict = None) -> None:
+        """
+        Save a component definition in the metadata cache, if the element is not an error.
+        Arguments:
+            key : REQUIRED : key of the component in the cache
+            element : REQUIRED : the component definition
+        """
+        if isinstance(element, dict) and "id" in element:
+            self.metadataCache.set(key, element)
+
+    def _getCachedComponent(self, key: tuple = None) -> dict:
+        """
+        Return the component definition from the metadata cache, or from the component store when it is fresh enough.
+        Returns None if the component is not available locally.
+        Arguments:
+            key : REQUIRED : key of the component, ex: ("filter", filterId, full) or ("dimension", dataviewId, dimensionId, full)
+        """
+        element = self.metadataCache.get(key)
+        if element is None and self.componentStore is not None:
+            componentType = key[0]
+            if componentType in ("dimension", "metric"):
+                dataviewId, componentId = key[1], key[2]
+            else:
+                dataviewId, componentId = None, key[1]
+            element = self.componentStore.getComponent(
+                componentType,
+                componentId,
+                dataviewId=dataviewId,
+                maxAge=self.componentStoreMaxAge,
+                full=key[-1],
+            )
+            if element is not None:
+                self.metadataCache.set(key, element)
+        return element
+
+    def _invalidateComponent(self, componentType: str = None, componentId: str = None) -> None:
+        """
+        Remove a component updated or deleted from the metadata cache and the component store.
+        For a data view, its dimensions and metrics are removed.
+        Arguments:
+            componentType : REQUIRED : "filter", "calculatedMetric" or "dataView"
+            componentId : REQUIRED : ID of the component
+        """
+        if componentType == "dataView":
+            self.metadataCache.invalidate("dimension", componentId)
+            self.metadataCache.invalidate("metric", componentId)
+        else:
+            self.metadataCache.invalidate(componentType, componentId)
+        if self.componentStore is not None:
+            self.componentStore.removeComponents(componentType, componentId)
+            if componentType == "dataView":
+                self.componentStore.removeComponents("dimension", dataviewId=componentId)
+                self.componentStore.removeComponents("metric", dataviewId=componentId)
+
+    def syncComponentStore(
+        self, componentTypes: list = None, max_workers: int = 4
+    ) -> dict:
+        """
+        Synchronize the component store attached to that instance, downloading only the components modified
+        since the last synchronization. Returns the number of components added, updated and deleted per type.
+        Arguments:
+            componentTypes : OPTIONAL : list of the component types to synchronize (default all)
+                possible values: "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            max_workers : OPTIONAL : number of requests sent at the same time (default 4)
+        """
+        if self.componentStore is None:
+            raise ValueError("Require a componentStore, set it when instantiating the CJA class")
+        if self.loggingEnabled:
+            self.logger.debug(f"syncComponentStore start")
+        return self.componentStore.sync(
+            self, componentTypes=componentTypes, max_workers=max_workers
+        )
+
+    def _cacheComponents(
+        self, keyPrefix: tuple = None, elements: list = None, full: bool = False
+    ) -> None:
+        """
+        Pre-warm the metadata cache with the components returned by a list endpoint.
+        Arguments:
+            keyPrefix : REQUIRED : start of the key, ex: ("filter",) or ("dimension", dataviewId)
+            elements : REQUIRED : list of the components definition
+            full : OPTIONAL : if the components have been requested with all details
+        """
+        if self.metadataCache.enabled == False or not isinstance(elements, list):
+            return
+        for element in elements:
+            if isinstance(element, dict) and "id" in element:
+                self.metadataCache.set(keyPrefix + (element["id"], full), element)
+
+    def _iterPages(
+        self,
+        path: str = None,
+        params: dict = None,
+        lastKey: str = "lastPage",
+        pageKey: str = "page",
+        sizeKey: str = "limit",
+        n_results: Union[int, str] = "inf",
+        max_workers: int = 1,
+        **kwargs,
+    ) -> Iterator[list]:
+        """
+        Generator looping through the pages of a list endpoint and yielding the content of each page, in the page order, as soon as it arrives.
+        When the first response provides the total number of pages, the next pages are fetched concurrently,
+        never holding more than max_workers pages in advance.
+        Arguments:
+            path : REQUIRED : path of the endpoint
+            params : REQUIRED : parameters of the request, containing the page key.
+            lastKey : OPTIONAL : key of the response defining the last page ("lastPage" by default)
+            pageKey : OPTIONAL : parameter defining the page requested ("page" by default)
+            sizeKey : OPTIONAL : parameter defining the number of results per page ("limit" by default), used to estimate the pages needed for n_results
+            n_results : OPTIONAL : stop requesting new pages once that number of results is reached (default "inf")
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
+        """
+        res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        content = res.get("content", [])
+        nbResults = len(content)
+        yield content
+        lastPage = res.get(lastKey, True)
+        if float(nbResults) >= float(n_results):
+            lastPage = True
+        totalPages = res.get("totalPages")
+        if lastPage != True and max_workers > 1 and totalPages is not None:
+            firstPage = params[pageKey]
+            endPage = totalPages
+            if n_results != "inf" and nbResults > 0:
+                pageSize = params.get(sizeKey, nbResults)
+                endPage = min(totalPages, firstPage + ceil(float(n_results) / pageSize))
+            if self.loggingEnabled:
+                self.logger.debug(
+                    f"fetching pages {firstPage+1} to {endPage-1} of {path} with {max_workers} workers"
+                )
+
+            def fetchPage(page: int) -> list:
+                pageParams = deepcopy(params)
+                pageParams[pageKey] = page
+                res = self.connector.getData(
+                    self.endpoint + path, params=pageParams, **kwargs
+                )
+                return res.get("content", [])
+
+            pages = iter(range(firstPage + 1, endPage))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = deque(
+                    executor.submit(fetchPage, page)
+                    for page in islice(pages, max_workers)
+                )
+                while len(futures) > 0:
+                    content = futures.popleft().result()
+                    nextPage = next(pages, None)
+                    if nextPage is not None:
+                        futures.append(executor.submit(fetchPage, nextPage))
+                    yield content
+        else:
+            while lastPage != True:
+                params[pageKey] += 1
+                res = self.connector.getData(
+                    self.endpoint + path, params=params, **kwargs
+                )
+                content = res.get("content", [])
+                nbResults += len(content)
+                yield content
+                lastPage = res.get(lastKey, True)
+                if float(nbResults) >= float(n_results):
+                    lastPage = True
+
+    def _getAllPages(
+        self,
+        path: str = None,
+        params: dict = None,
+        lastKey: str = "lastPage",
+        pageKey: str = "page",
+        sizeKey: str = "limit",
+        n_results: Union[int, str] = "inf",
+        max_workers: int = 1,
+        **kwargs,
+    ) -> list:
+        """
+        Loop through the pages of a list endpoint and return the content of all pages, in the page order.
+        Same arguments than the _iterPages method.
+        """
+        data = []
+        for content in self._iterPages(
+            path,
+            params,
+            lastKey=lastKey,
+            pageKey=pageKey,
+            sizeKey=sizeKey,
+            n_results=n_results,
+            max_workers=max_workers,
+            **kwargs,
+        ):
+            data += content
+        return data
 
     def getCurrentUser(self, admin: bool = False, useCache: bool = True, **kwargs) -> dict:
         """
@@ -94,8 +360,9 @@ class CJA:
         approved: bool = False,
         cache: bool = True,
         output: str = "df",
+        max_workers: int = 1,
         **kwargs
-    ) -> JsonListOrDataFrameType:
+    ) -> JsonListOrDataFrameOrIteratorType:
         """
         Returns a dataframe or the list of calculated Metrics.
         Arguments:
@@ -116,6 +383,9 @@ class CJA:
             approved : OPTIONAL : If set to true, returns only approved calculated metrics. (default False)
             cache : OPTIONAL : cache the result in a local variable.
             output : OPTIONAL : by default returns a "dataframe", can also return the list when set to "raw"
+                or a generator yielding the calculated metrics page by page when set to "iter" (no cache)
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if self.loggingEnabled:
             self.logger.debug(f"getCalculatedMetrics start, output: {output}")
@@ -140,14 +410,13 @@ class CJA:
             params["favorite"] = favorite
         if approved:
             params["approved"] = approved
-        res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
-        data = res["content"]
-        lastPage = res.get("lastPage", True)
-        while lastPage != True:
-            params["page"] += 1
-            res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
-            data += res["content"]
-            lastPage = res.get("lastPage", True)
+        if output == "iter":
+            pages = self._iterPages(path, params, max_workers=max_workers, **kwargs)
+            return (calcMetric for page in pages for calcMetric in page)
+        data = self._getAllPages(path, params, max_workers=max_workers, **kwargs)
+        self._cacheComponents(("calculatedMetric",), data, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "calculated_metrics")
         if output == "df":
             df = pd.DataFrame(data)
             if cache:
@@ -155,7 +424,7 @@ class CJA:
             return df
         if cache:
             self.calculatedMetrics = data
-        return res
+        return data
 
     def getCalculatedMetricsFunctions(
         self, output: str = "raw"
@@ -174,17 +443,25 @@ class CJA:
             return df
         return res
 
-    def getCalculatedMetric(self, calcId: str = None, full: bool = True, **kwargs) -> dict:
+    def getCalculatedMetric(
+        self, calcId: str = None, full: bool = True, useMetadataCache: bool = True, **kwargs
+    ) -> dict:
         """
         Return a single calculated metrics based on its ID.
         Arguments:
             calcId : REQUIRED : The calculated metric
             full : OPTIONAL : If you want to have all details
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
         """
         if calcId is None:
             raise ValueError("Requires a Calculated Metrics ID")
         if self.loggingEnabled:
             self.logger.debug(f"getCalculatedMetric start, id: {calcId}")
+        key = ("calculatedMetric", calcId, full)
+        if useMetadataCache:
+            cached = self._getCachedComponent(key)
+            if cached is not None:
+                return cached
         path = f"/calculatedmetrics/{calcId}"
         params = {"includeHidden": True}
         if full:
@@ -192,6 +469,7 @@ class CJA:
                 "expansion"
             ] = "approved,favorite,shares,tags,sharesFullName,usageSummary,usageSummaryWithRelevancyScore,reportSuiteName,siteTitle,ownerFullName,modified,migratedIds,isDeleted,definition,authorization,compatibility,legacyId,internal,dataGroup,categories"
         res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self._cacheComponent(key, res)
         return res
 
     def createCalculatedMetric(self, data: dict = None) -> dict:
@@ -234,6 +512,7 @@ class CJA:
             self.logger.debug(f"deleteCalculateMetrics start, id: {calcId}")
         path = f"/calculatedmetrics/{calcId}"
         res = self.connector.deleteData(self.endpoint + path)
+        self._invalidateComponent("calculatedMetric", calcId)
         return res
 
     def updateCalculatedMetrics(self, calcId: str = None, data: dict = None, **kwargs) -> dict:
@@ -251,6 +530,7 @@ class CJA:
             self.logger.debug(f"updateCalculatedMetrics start, id: {calcId}")
         path = f"/calculatedmetrics/{calcId}"
         res = self.connector.putData(self.endpoint + path, data=data, **kwargs)
+        self._invalidateComponent("calculatedMetric", calcId)
         return res
 
     def getShares(
@@ -385,6 +665,7 @@ class CJA:
             includeType : OPTIONAL : Show daterange not owned by user (default "all")
                 Possible values are "all", "shared", "templates"
             output : OPTIONAL : Type of result returned.
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
         """
         if self.loggingEnabled:
             self.logger.debug(f"getDateRanges start")
@@ -400,6 +681,8 @@ class CJA:
             params["includeType"] = includeType
         res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
         data = res.get("content", [])
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "date_ranges")
         if output == "df":
             df = pd.DataFrame(data)
             return df
@@ -704,6 +987,7 @@ class CJA:
         inclType: str = None,
         verbose: bool = False,
         output: str = "df",
+        max_workers: int = 1,
         **kwargs
     ) -> dict:
         """
@@ -713,6 +997,8 @@ class CJA:
             full : OPTIONAL : To add additional elements (default False)
             inclType : OPTIONAL : Possibility to add "hidden" values
             output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if dataviewId is None:
             raise ValueError("Require a Data View ID")
@@ -726,18 +1012,12 @@ class CJA:
             ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,bucketingSetting,noValueOptionsSetting,defaultDimensionSort,persistenceSetting,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
         if inclType == "hidden":
             params["includeType"] = "hidden"
-        res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
+        dimensions = self._getAllPages(
+            path, params, max_workers=max_workers, verbose=verbose, **kwargs
         )
-        dimensions = res.get("content", [])
-        lastPage = res.get('lastPage',True)
-        while lastPage == False:
-            params["page"] += 1
-            res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
-            )
-            dimensions += res.get('content',[])
-            lastPage = res.get('lastPage',True)
+        self._cacheComponents(("dimension", dataviewId), dimensions, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(dimensions, output, "dimensions")
         if output == "df":
             df = pd.DataFrame(dimensions)
             return df
@@ -747,6 +1027,7 @@ class CJA:
         self, dataviewId: str = None, 
         dimensionId: str = None, 
         full: bool = True,
+        useMetadataCache: bool = True,
         **kwargs
     ):
         """
@@ -755,6 +1036,7 @@ class CJA:
             dataviewId : REQUIRED : the Data View ID to retrieve data from.
             dimensionId : REQUIRED : the dimension ID to return
             full : OPTIONAL : To add additional elements (default True)
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
         """
         if dataviewId is None:
             raise ValueError("Require a Data View ID")
@@ -762,6 +1044,11 @@ class CJA:
             raise ValueError("Require a Dimension ID")
         if self.loggingEnabled:
             self.logger.debug(f"getDimension start, id: {dimensionId}")
+        key = ("dimension", dataviewId, dimensionId, full)
+        if useMetadataCache:
+            cached = self._getCachedComponent(key)
+            if cached is not None:
+                return cached
         path = f"/datagroups/data/{dataviewId}/dimensions/{dimensionId}"
         params = {}
         if full:
@@ -769,6 +1056,7 @@ class CJA:
                 "expansion"
             ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
         res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self._cacheComponent(key, res)
         return res
 
     def getMetrics(
@@ -777,7 +1065,8 @@ class CJA:
         full: bool = False,
         inclType: str = None,
         verbose: bool = False,
-                output: str = "df",
+        output: str = "df",
+        max_workers: int = 1,
         **kwargs
     ) -> dict:
         """
@@ -787,6 +1076,8 @@ class CJA:
             full : OPTIONAL : To add additional elements (default False)
             inclType : OPTIONAL : Possibility to add "hidden" values
             output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if dataviewId is None:
             raise ValueError("Require a Data View ID")
@@ -800,25 +1091,24 @@ class CJA:
             ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
         if inclType == "hidden":
             params["includeType"] = "hidden"
-        res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
+        metrics = self._getAllPages(
+            path, params, max_workers=max_workers, verbose=verbose, **kwargs
         )
-        metrics = res.get('content',[])
-        lastPage = res.get('lastPage',True)
-        while lastPage == False:
-            params["page"] += 1
-            res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
-            )
-            metrics += res.get('content',[])
-            lastPage = res.get('lastPage',True)
+        self._cacheComponents(("metric", dataviewId), metrics, full=full)
+        if isArrowOutput(output):
+            return formatArrowOutput(metrics, output, "metrics")
         if output =='df':
             df = pd.DataFrame(metrics)
             return df
-        return res
+        return metrics
 
     def getMetric(
-        self, dataviewId: str = None, metricId: str = None, full: bool = True, **kwargs
+        self,
+        dataviewId: str = None,
+        metricId: str = None,
+        full: bool = True,
+        useMetadataCache: bool = True,
+        **kwargs
     ):
         """
         Return a specific metric based on the dataview ID and dimension ID passed.
@@ -826,6 +1116,7 @@ class CJA:
             dataviewId : REQUIRED : the Data View ID to retrieve data from.
             metricId : REQUIRED : the metric ID to return
             full : OPTIONAL : To add additional elements (default True)
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
         """
         if dataviewId is None:
             raise ValueError("Require a Data View ID")
@@ -833,6 +1124,11 @@ class CJA:
             raise ValueError("Require a Dimension ID")
         if self.loggingEnabled:
             self.logger.debug(f"getMetric start, id: {metricId}")
+        key = ("metric", dataviewId, metricId, full)
+        if useMetadataCache:
+            cached = self._getCachedComponent(key)
+            if cached is not None:
+                return cached
         path = f"/datagroups/data/{dataviewId}/metrics/{metricId}"
         params = {}
         if full:
@@ -840,6 +1136,7 @@ class CJA:
                 "expansion"
             ] = "approved,favorite,tags,usageSummary,usageSummaryWithRelevancyScore,description,sourceFieldId,segmentable,required,hideFromReporting,hidden,includeExcludeSetting,fieldDefinition,bucketingSetting,noValueOptionsSetting,defaultDimensionSort,persistenceSetting,storageId,tableName,dataSetIds,dataSetType,type,schemaPath,hasData,sourceFieldName,schemaType,sourceFieldType,fromGlobalLookup,multiValued,precision"
         res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self._cacheComponent(key, res)
         return res
 
     def getDataViews(
@@ -853,6 +1150,7 @@ class CJA:
         includeType: str = "all",
         cached: bool = True,
         verbose: bool = False,
+        max_workers: int = 1,
         **kwargs,
     ) -> JsonListOrDataFrameType:
         """
@@ -861,6 +1159,7 @@ class CJA:
             limit : OPTIONAL : number of results per request (default 100)
             full : OPTIONAL : define if all possible information are returned (default True).
             output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
             parentDataGroupId : OPTIONAL : Filters data views by a single parentDataGroupId
             externalIds : OPTIONAL : Comma-delimited list of external ids to limit the response with.
             externalParentIds : OPTIONAL : Comma-delimited list of external parent ids to limit the response with.
@@ -868,6 +1167,7 @@ class CJA:
             includeType : OPTIONAL : include additional DataViews not owned by user.(default "all")
             cached : OPTIONAL : return cached results
             verbose : OPTIONAL : add comments in the console.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if self.loggingEnabled:
             self.logger.debug(f"getDataViews start, output: {output}")
@@ -888,18 +1188,16 @@ class CJA:
             params["externalIds"] = externalIds
         if externalParentIds:
             params["externalParentIds"] = externalParentIds
-        res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
+        data = self._getAllPages(
+            path,
+            params,
+            lastKey="last",
+            max_workers=max_workers,
+            verbose=verbose,
+            **kwargs,
         )
-        data = res["content"]
-        last = res.get("last", True)
-        while last != True:
-            params["page"] += 1
-            res = self.connector.getData(
-                self.endpoint + path, params=params, verbose=verbose, **kwargs
-            )
-            data += res["content"]
-            last = res.get("last", True)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "dataviews")
         if output == "df":
             df = pd.DataFrame(data)
             return df
@@ -931,13 +1229,15 @@ class CJA:
                 f.write(json.dumps(res, indent=4))
         return res
 
-    def getConnections(self,limit:int=1000,full:bool=True,output:str='df',**kwargs)-> JsonListOrDataFrameType:
+    def getConnections(self,limit:int=1000,full:bool=True,output:str='df',max_workers:int=1,**kwargs)-> JsonListOrDataFrameType:
         """
         Retrieve the connections associated to that company.
         Arguments:
             limit : OPTIONAL : number of results per request (default 100)
             full : OPTIONAL : define if all possible information are returned (default True).
             output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if self.loggingEnabled:
             self.logger.debug(f"getConnections start")
@@ -945,14 +1245,9 @@ class CJA:
         params = {"limit":limit,"page":0}
         if full:
             params["expansion"] ="granularBackfills,granularStreaming,backfillsSummaryConnection,name,description,isDeleted,isDisabled,dataSets,createdDate,modified,sandboxName,organization,backfillEnabled,modifiedBy,ownerFullName"
-        res = self.connector.getData(self.endpoint + path,params=params, **kwargs)
-        data = res.get('content',[])
-        lastpage = res.get('lastPage',True)
-        while lastpage != True:
-            params['page'] += 1
-            res = self.connector.getData(self.endpoint + path,params=params, **kwargs)
-            data += res.get('content',[])
-            lastpage = res.get('lastPage',True)
+        data = self._getAllPages(path, params, max_workers=max_workers, **kwargs)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "connections")
         if output == "df":
             df = pd.DataFrame(data)
             return df
@@ -1053,6 +1348,7 @@ class CJA:
             self.logger.debug(f"deleteDataView start, id: {dataViewId}")
         path = f"/datagroups/dataviews/{dataViewId}"
         res = self.connector.deleteData(self.endpoint + path)
+        self._invalidateComponent("dataView", dataViewId)
         return res
 
     def updateDataView(
@@ -1077,6 +1373,7 @@ class CJA:
             with open(data, "r", encoding=kwargs.get("encoding", "utf-8")) as f:
                 data = json.load(f.read())
         res = self.connector.putData(self.endpoint + path, data=data)
+        self._invalidateComponent("dataView", dataViewId)
         return res
 
     def copyDataView(self, dataViewId: str = None, **kwargs) -> dict:
@@ -1106,14 +1403,17 @@ class CJA:
         cached: bool = True,
         cache: bool = True,
         verbose: bool = False,
+        max_workers: int = 1,
         **kwargs
-    ) -> JsonListOrDataFrameType:
+    ) -> JsonListOrDataFrameOrIteratorType:
         """
         Returns a list of filters used in CJA.
         Arguments:
             limit : OPTIONAL : number of result per request (default 100)
             full : OPTIONAL : add additional information to the filters
             output : OPTIONAL : Type of output selected, either "df" (default) or "raw"
+                or "iter" for a generator yielding the filters page by page (no cache)
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
             includeType : OPTIONAL : Include additional segments not owned by user.(default all)
                 possible values are "shared" "templates" "deleted" "internal"
             name : OPTIONAL : Filter list to only include filters that contains the Name
@@ -1123,6 +1423,7 @@ class CJA:
             cached : OPTIONAL : return cached results
             cache : OPTIONAL : If you want to cache the results in a local variable
             toBeUsedInRsid : OPTIONAL : The report suite where the filters is intended to be used. This report suite will be used to determine things like compatibility and permissions.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if self.loggingEnabled:
             self.logger.debug(f"getFilters start, output: {output}")
@@ -1145,20 +1446,19 @@ class CJA:
             params["ownerId"] = ownerId
         if filterByIds is not None:
             params["filterByIds"] = filterByIds
-        res = self.connector.getData(
-            self.endpoint + path, params=params, verbose=verbose, **kwargs
-        )
-        lastPage = res.get("lastPage", True)
-        data = res["content"]
-        while lastPage == False:
-            params["page"] += 1
-            res = self.connector.getData(
-                self.endpoint + path, params=params, verbose=verbose, **kwargs
+        if output == "iter":
+            pages = self._iterPages(
+                path, params, max_workers=max_workers, verbose=verbose, **kwargs
             )
-            data += res["content"]
-            lastPage = res.get("lastPage", True)
+            return (filter for page in pages for filter in page)
+        data = self._getAllPages(
+            path, params, max_workers=max_workers, verbose=verbose, **kwargs
+        )
+        self._cacheComponents(("filter",), data, full=full)
         if cache:
             self.filtes = data
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "filters")
         if output == "df":
             df = pd.DataFrame(data)
             return df
@@ -1168,6 +1468,7 @@ class CJA:
         self,
         filterId: str = None,
         full: bool = False,
+        useMetadataCache: bool = True,
         **kwargs
     ) -> dict:
         """
@@ -1175,11 +1476,17 @@ class CJA:
         Arguments:
             filterId : REQUIRED : ID of the filter
             full : OPTIONAL : Boolean to define additional elements
+            useMetadataCache : OPTIONAL : return the definition from the metadata cache when available (default True)
         """
         if filterId is None:
             raise ValueError("Require a filter ID")
         if self.loggingEnabled:
             self.logger.debug(f"getFilter start, id: {filterId}")
+        key = ("filter", filterId, full)
+        if useMetadataCache:
+            cached = self._getCachedComponent(key)
+            if cached is not None:
+                return cached
         path = f"/filters/{filterId}"
         params = {}
         if full:
@@ -1187,6 +1494,7 @@ class CJA:
                 "expansion"
             ] = "compatibility,definition,internal,modified,isDeleted,definitionLastModified,createdDate,recentRecordedAccess,performanceScore,owner,dataId,ownerFullName,dataName,sharesFullName,approved,favorite,shares,tags,usageSummary,usageSummaryWithRelevancyScore"
         res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+        self._cacheComponent(key, res)
         return res
 
     def deleteFilter(self, filterId: str = None) -> str:
@@ -1201,6 +1509,7 @@ class CJA:
             self.logger.debug(f"deleteFilter start, id: {filterId}")
         path = f"/filters/{filterId}"
         res = self.connector.deleteData(self.endpoint + path)
+        self._invalidateComponent("filter", filterId)
         return res
 
     def validateFilter(self, data: Union[dict, IO] = None, **kwargs) -> dict:
@@ -1263,6 +1572,7 @@ class CJA:
             with open(data, "r", encoding=kwargs.get("encoding", "utf-8")) as f:
                 data = json.load(f.read())
         res = self.connector.putData(self.endpoint + path, data=data, **kwargs)
+        self._invalidateComponent("filter", filterId)
         return res
 
     def getAuditLogs(
@@ -1280,7 +1590,8 @@ class CJA:
         n_results: Union[str, int] = "inf",
         output: str = "df",
         save: bool = False,
-    ) -> JsonListOrDataFrameType:
+        max_workers: int = 1,
+    ) -> JsonListOrDataFrameOrIteratorType:
         """
         Get Audit Log when few filters are applied.
         All filters are applied with an AND condition.
@@ -1299,11 +1610,75 @@ class CJA:
             pageSize : OPTIONAL : Number of results per page. If left null, the default size is 100.
             n_results : OPTIONAL : Total number of results you want for that search. Default "inf" will return everything
             output : OPTIONAL : DataFrame by default, can be "raw"
+                or "iter" for a generator yielding the raw logs page by page (no save)
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
         if self.loggingEnabled:
             self.logger.debug(f"getAuditLogs start")
-        params = {"pageNumber": 0, "pageSize": pageSize}
         path = "/auditlogs/api/v1/auditlogs"
+        params = self._getAuditLogsParams(
+            startDate=startDate,
+            endDate=endDate,
+            action=action,
+            component=component,
+            componentId=componentId,
+            userType=userType,
+            userId=userId,
+            userEmail=userEmail,
+            description=description,
+            pageSize=pageSize,
+        )
+        if output == "iter":
+            pages = self._iterPages(
+                path,
+                params,
+                lastKey="last",
+                pageKey="pageNumber",
+                sizeKey="pageSize",
+                n_results=n_results,
+                max_workers=max_workers,
+            )
+            return (log for page in pages for log in page)
+        data = self._getAllPages(
+            path,
+            params,
+            lastKey="last",
+            pageKey="pageNumber",
+            sizeKey="pageSize",
+            n_results=n_results,
+            max_workers=max_workers,
+        )
+        if output == "raw":
+            if save:
+                with open(f"audit_logs_{int(time.time())}.json", "w") as f:
+                    f.write(json.dumps(data))
+            return data
+        df = self._formatAuditLogs(data)
+        if isArrowOutput(output):
+            return formatArrowOutput(df, output, "audit_logs")
+        if save:
+            df.to_csv(f"audit_logs.{int(time.time())}.csv", index=False)
+        return df
+
+    def _getAuditLogsParams(
+        self,
+        startDate: str = None,
+        endDate: str = None,
+        action: str = None,
+        component: str = None,
+        componentId: str = None,
+        userType: str = None,
+        userId: str = None,
+        userEmail: str = None,
+        description: str = None,
+        pageSize: int = 100,
+    ) -> dict:
+        """
+        Return the parameters of the audit logs request, shared by the CJA and AsyncCJA getAuditLogs methods.
+        Same arguments than the getAuditLogs method.
+        """
+        params = {"pageNumber": 0, "pageSize": pageSize}
         if startDate is not None and endDate is not None:
             params["startDate"] = startDate
             params["endDate"] = endDate
@@ -1314,26 +1689,21 @@ class CJA:
         if componentId is not None:
             params["componentId"] = componentId
         if userType is not None:
-            params["userType"]
+            params["userType"] = userType
         if userId is not None:
             params["userId"] = userId
         if userEmail is not None:
             params["userEmail"] = userEmail
         if description is not None:
             params["description"] = description
-        lastPage = False
-        data = []
-        while lastPage != True:
-            res = self.connector.getData(self.endpoint + path, params=params)
-            data += res.get("content", [])
-            lastPage = res.get("last", True)
-            if len(data) > float(n_results):
-                lastPage = True
-            params["pageNumber"] += 1
-        if output == "raw":
-            if save:
-                with open(f"audit_logs_{int(time.time())}.json", "w") as f:
-                    f.write(json.dumps(data))
+        return params
+
+    def _formatAuditLogs(self, data: list = None) -> pd.DataFrame:
+        """
+        Transform the audit logs returned by the API into a dataframe with the user and component information flatten.
+        Arguments:
+            data : REQUIRED : list of audit logs.
+        """
         df = pd.DataFrame(data)
         try:
             df["userId"] = df["user"].apply(lambda x: x.get("id", ""))
@@ -1355,8 +1725,6 @@ class CJA:
         except:
             if self.loggingEnabled:
                 self.logger.debug(f"issue extracting componentName")
-        if save:
-            df.to_csv(f"audit_logs.{int(time.time())}.csv", index=False)
         return df
 
     SAMPLE_FILTERMESSAGE_LOGS = {
@@ -1413,7 +1781,7 @@ class CJA:
         res = self.connector.postData(self.endpoint + path, data=filterMessage)
         return res
     
-    def getAnnotations(self,full:bool=True,includeType:str='all',limit:int=1000,page:int=0)->list:
+    def getAnnotations(self,full:bool=True,includeType:str='all',limit:int=1000,page:int=0,max_workers:int=1,output:str="raw")->Union[list,Iterator[dict]]:
         """
         Returns a list of the available annotations 
         Arguments:
@@ -1421,18 +1789,20 @@ class CJA:
             includeType : OPTIONAL : use to return only "shared" or "all"(default) annotation available.
             limit : OPTIONAL : number of result per page (default 1000)
             page : OPTIONAL : page used for pagination
+            output : OPTIONAL : "raw" (default) returns the list, "iter" returns a generator yielding the annotations page by page.
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one (default 1, sequential)
         """
-        params = {"includeType":includeType,"page":page}
+        params = {"includeType":includeType,"limit":limit,"page":page}
         if full:
             params['expansion'] = "name,description,dateRange,color,applyToAllReports,scope,createdDate,modifiedDate,modifiedById,tags,shares,approved,favorite,owner,usageSummary,companyId,dataId"
         path = f"/annotations"
-        lastPage = False
-        data = []
-        while lastPage == False:
-            res = self.connector.getData(self.endpoint + path,params=params)
-            data += res.get('content',[])
-            lastPage = res.get('lastPage',True)
-            params['page'] += 1
+        if output == "iter":
+            pages = self._iterPages(path, params, max_workers=max_workers)
+            return (annotation for page in pages for annotation in page)
+        data = self._getAllPages(path, params, max_workers=max_workers)
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "annotations")
         return data
     
     def getAnnotation(self,annotationId:str=None)->dict:
@@ -1581,8 +1951,9 @@ class CJA:
         save: bool = False,
         output: str = "df",
         cache: bool = True,
+        max_workers: int = 1,
         **kwargs,
-    ) -> JsonListOrDataFrameType:
+    ) -> JsonListOrDataFrameOrIteratorType:
         """
         Returns a list of project ID with their meta information attached to it.
         Arguments:
@@ -1595,7 +1966,10 @@ class CJA:
             usedIn : OPTIONAL : Additional parameter to compute some usage of the projects. Recommended to be used with limit
             save : OPTIONAL : if you want to save the result
             cache : OPTIONAL : if you want to save the project in a local Variable.
-            output : OPTIONAL : the type of output to return "df" or "raw"
+            output : OPTIONAL : the type of output to return "df" or "raw",
+                or "iter" for a generator yielding the projects page by page (no save or cache)
+                "arrow" returns an Arrow table, "parquet" (or a path ending with .parquet) writes a Parquet file and returns its name. Requires pyarrow.
+            max_workers : OPTIONAL : number of pages fetched at the same time after the first one, when limit is used (default 1, sequential)
         Possible kwargs:
             page : the page number to reach.
         """
@@ -1617,23 +1991,25 @@ class CJA:
             params["filterByIds"] = filterByIds
         if ownerId:
             params["ownerId"] = ownerId
-        res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
         if params.get('pagination','false') != 'true':
-            data = res
+            data = self.connector.getData(self.endpoint + path, params=params, **kwargs)
+            if output == "iter":
+                return iter(data)
+        elif output == "iter":
+            pages = self._iterPages(
+                path, params, n_results=n_results, max_workers=max_workers, **kwargs
+            )
+            return (project for page in pages for project in page)
         else:
-            lastPage = res.get('lastPage',False)
-            data = res["content"]
-            while float(len(data)) < float(n_results) and lastPage == False:
-                params["page"] +=1
-                res = self.connector.getData(self.endpoint + path, params=params, **kwargs)
-                data += res["content"]
-                lastPage = res.get('lastPage',False)
-                if float(len(data)) >= float(n_results):
-                    lastPage=True
+            data = self._getAllPages(
+                path, params, n_results=n_results, max_workers=max_workers, **kwargs
+            )
+        if isArrowOutput(output):
+            return formatArrowOutput(data, output, "projects")
         if output == "raw":
             if save:
                 with open(f"projects_{int(time.time())}.json", "w") as f:
-                    f.write(json.dumps(res, indent=2))
+                    f.write(json.dumps(data, indent=2))
             return data
         if cache:
             self.listProjectIds = data
@@ -1686,6 +2062,9 @@ class CJA:
         cache: bool = False,
         dvIdSuffix: bool = False,
         output:str="dict",
+        max_workers: int = 1,
+        progress: Callable = None,
+        snapshot: Union[str, ProjectSnapshot] = None,
     ) -> dict:
         """
         Retrieve all projects details. You can either pass the list of dataframe returned from the getProjects methods and some filters.
@@ -1701,7 +2080,13 @@ class CJA:
             dvIdSuffix : OPTIONAL : If you want to add data view ID as suffix of metrics and dimensions (::dvId)
             cache : OPTIONAL : If you want to cache the different elements retrieved for future usage.
             output : OPTIONAL : If you want to return a "list" or "dict" from this method. (default "dict")
+            max_workers : OPTIONAL : number of projects retrieved at the same time (default 1, sequential)
+            progress : OPTIONAL : function called after each project with a dictionary: {"projectId","done","total","errors"}
+            snapshot : OPTIONAL : path of a local snapshot file (or a ProjectSnapshot instance) for an incremental refresh.
+                Only the projects that are new or whose modified date changed are retrieved, the others are rebuilt from the snapshot.
+                The deleted projects are removed from the snapshot when the full list of projects is used (no projects and no filter passed).
         Not using filter may end up taking a while to retrieve the information.
+        The projects that cannot be retrieved are not returned, their errors are available in the projectsDetailsErrors attribute.
         """
         if self.loggingEnabled:
             self.logger.debug(f"starting getAllProjectDetails")
@@ -1720,7 +2105,9 @@ class CJA:
             if isinstance(projects, pd.DataFrame):
                 fullProjectIds = projects.to_dict(orient="records")
             elif isinstance(projects, list):
-                fullProjectIds = (proj["id"] for proj in projects)
+                fullProjectIds = [
+                    {"id": proj} if isinstance(proj, str) else proj for proj in projects
+                ]
         if filterNameProject is not None:
             if self.loggingEnabled:
                 self.logger.debug(f"filterNameProject passed")
@@ -1737,18 +2124,85 @@ class CJA:
                 for project in fullProjectIds
                 if filterNameOwner in project["owner"].get("name", "")
             ]
+        projectIds = [project["id"] for project in fullProjectIds]
         if self.loggingEnabled:
-            self.logger.info(f"{len(fullProjectIds)} project details to retrieve")
+            self.logger.info(f"{len(projectIds)} project details to retrieve")
             self.logger.debug(
-                f"estimated time required : {int(len(fullProjectIds)/60)} minutes"
+                f"estimated time required : {int(len(projectIds)/60/max(1, max_workers))} minutes"
             )
-        projectIds = (project["id"] for project in fullProjectIds)
+        results = {}
+        errors = {}
+        projectsToRetrieve = projectIds
+        if snapshot is not None:
+            if isinstance(snapshot, ProjectSnapshot) == False:
+                snapshot = ProjectSnapshot(snapshot)
+            if projects is None and filterNameProject is None and filterNameOwner is None:
+                removed = snapshot.keep(projectIds)
+                if self.loggingEnabled and len(removed) > 0:
+                    self.logger.debug(f"{len(removed)} deleted projects removed from the snapshot")
+            projectsToRetrieve = []
+            for project in fullProjectIds:
+                projectId, modified = project["id"], project.get("modified")
+                previous = self.projectsDetails.get(projectId)
+                if (
+                    isinstance(previous, Project)
+                    and modified is not None
+                    and previous.modified == modified
+                    and previous.dvIdSuffix == dvIdSuffix
+                ):
+                    results[projectId] = previous
+                    continue
+                definition = snapshot.getDefinition(projectId, modified)
+                if definition is not None:
+                    try:
+                        results[projectId] = Project(definition, dvIdSuffix=dvIdSuffix)
+                        continue
+                    except Exception:
+                        pass
+                projectsToRetrieve.append(projectId)
+            if self.loggingEnabled:
+                self.logger.info(
+                    f"{len(projectIds) - len(projectsToRetrieve)} projects unchanged, {len(projectsToRetrieve)} projects to retrieve"
+                )
+
+        def getProjectDetails(projectId: str) -> Project:
+            if snapshot is None:
+                return self.getProject(projectId, projectClass=True, dvIdSuffix=dvIdSuffix)
+            res = self.getProject(projectId, cache=False)
+            project = Project(res, dvIdSuffix=dvIdSuffix)
+            snapshot.setDefinition(res)
+            return project
+
+        def collect(projectId: str, getResult: Callable) -> None:
+            try:
+                results[projectId] = getResult()
+            except Exception as error:
+                if self.loggingEnabled:
+                    self.logger.error(f"project {projectId} cannot be retrieved: {error}")
+                errors[projectId] = str(error)
+            if progress is not None:
+                progress(
+                    {"projectId": projectId, "done": len(results) + len(errors), "total": len(projectIds), "errors": len(errors)}
+                )
+
+        if max_workers > 1 and len(projectsToRetrieve) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(projectsToRetrieve))) as executor:
+                futures = {
+                    executor.submit(getProjectDetails, projectId): projectId
+                    for projectId in projectsToRetrieve
+                }
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+        else:
+            for projectId in projectsToRetrieve:
+                collect(projectId, partial(getProjectDetails, projectId))
+        if snapshot is not None:
+            snapshot.save()
+        ## keeping the order of the projects
         projectsDetails = {
-            projectId: self.getProject(
-                projectId, projectClass=True, dvIdSuffix=dvIdSuffix
-            )
-            for projectId in projectIds
+            projectId: results[projectId] for projectId in projectIds if projectId in results
         }
+        self.projectsDetailsErrors = errors
         if filterNameProject is None and filterNameOwner is None:
             self.projectsDetails = projectsDetails
         if output == "list":
@@ -1823,6 +2277,59 @@ class CJA:
         )
         return res
 
+    def buildComponentUsageIndex(
+        self,
+        path: str = None,
+        filters: Union[list, pd.DataFrame] = None,
+        calculatedMetrics: Union[list, pd.DataFrame] = None,
+        projectDetails: Union[list, dict] = None,
+        dvIdSuffix: bool = False,
+        max_workers: int = 1,
+    ) -> ComponentUsageIndex:
+        """
+        Build the inverted index of the components usage (ComponentUsageIndex) and save it in the componentUsageIndex attribute.
+        The elements that are not passed are retrieved (getFilters and getCalculatedMetrics with full=True, getAllProjectDetails).
+        Arguments:
+            path : OPTIONAL : path of the JSON file where the index is saved.
+            filters : OPTIONAL : list or dataframe returned by getFilters with full=True
+            calculatedMetrics : OPTIONAL : list or dataframe returned by getCalculatedMetrics with full=True
+            projectDetails : OPTIONAL : list of instances of the Project class (or dictionary returned by getAllProjectDetails)
+            dvIdSuffix : OPTIONAL : If you do not give projectDetails and you want to index the data view ID suffix of dimensions and metrics.
+            max_workers : OPTIONAL : number of projects retrieved at the same time, if projectDetails is not passed (default 1)
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"starting buildComponentUsageIndex")
+        if filters is None:
+            filters = self.getFilters(full=True)
+        if calculatedMetrics is None:
+            calculatedMetrics = self.getCalculatedMetrics(full=True)
+        if projectDetails is None:
+            projectDetails = self.getAllProjectDetails(
+                dvIdSuffix=dvIdSuffix, max_workers=max_workers
+            )
+        index = ComponentUsageIndex(path)
+        index.build(filters, calculatedMetrics, projectDetails)
+        if path is not None:
+            index.save()
+        if self.loggingEnabled:
+            self.logger.debug(f"{len(index)} components indexed")
+        self.componentUsageIndex = index
+        return index
+
+    def _getRecursiveUsage(self, graph: ComponentDependencyGraph, listRecusion: list) -> dict:
+        """
+        Return the projects using each filter or calculated metric of the list, directly or through other filters and calculated metrics.
+        Arguments:
+            graph : REQUIRED : ComponentDependencyGraph of the filters, calculated metrics and projects
+            listRecusion : REQUIRED : list of filters and calculated metrics IDs
+        """
+        recurseObj = defaultdict(list)
+        for rec in dict.fromkeys(listRecusion):
+            projects = graph.getDependents(rec).get("projects", [])
+            if len(projects) > 0:
+                recurseObj[rec] = projects
+        return recurseObj
+
     def findComponentsUsage(
         self,
         components: list = None,
@@ -1833,6 +2340,7 @@ class CJA:
         regexUsed: bool = False,
         resetProjectDetails: bool = False,
         dvIdSuffix: bool = False,
+        index: ComponentUsageIndex = None,
     ) -> dict:
         """
         Find the usage of components in the different part of Adobe Analytics setup.
@@ -1847,14 +2355,33 @@ class CJA:
                 Should be the list or dataframe return by the getCalculatedMetrics method.
             recursive : OPTIONAL : if set to True, will also find the reference where the meta component are used.
                 segments based on your elements will also be searched to see where they are located.
+                The projects are found through the dependency graph (ComponentDependencyGraph), directly or through other filters and calculated metrics.
             regexUsed : OPTIONAL : If set to True, the element are definied as a regex and some default setup is turned off.
             resetProjectDetails : OPTIONAL : Set to false by default. If set to True, it will NOT use the cache.
             dvIdSuffix : OPTIONAL : If you do not give projectDetails and you want to look for rsid usage in report for dimensions and metrics.
+            index : OPTIONAL : ComponentUsageIndex to use instead of scanning the definitions (see buildComponentUsageIndex).
+                The components are then exact IDs (no regex) and each project is returned once per component.
         """
         if components is None or type(components) != list:
             raise ValueError("components must be present as a list")
         if self.loggingEnabled:
             self.logger.debug(f"starting findComponentsUsage for {components}")
+        if index is not None:
+            if regexUsed:
+                raise ValueError("regexUsed cannot be used with an index, the components are exact IDs")
+            returnObj = {comp: index.getUsage(comp) for comp in components}
+            if recursive:
+                listRecusion = [
+                    elementId
+                    for comp in components
+                    for usageType in ("filters", "calculatedMetrics")
+                    for element in returnObj[comp][usageType]
+                    for elementId in element.values()
+                ]
+                returnObj["recursion"] = self._getRecursiveUsage(
+                    ComponentDependencyGraph(index), listRecusion
+                )
+            return returnObj
         listRecusion = []  # for findings on recursion
         if regexUsed:
             if self.loggingEnabled:
@@ -1931,17 +2458,20 @@ class CJA:
             self.logger.debug(f"search started")
             self.logger.debug(f"recursive option : {recursive}")
             self.logger.debug("Analyzing Filters")
+        matcher = ComponentMatcher(components)
         for _, seg in myFilters.iterrows():
+            found = matcher.findAll(str(seg["definition"]))
             for comp in components:
-                if re.search(f"{comp}", str(seg["definition"])):
+                if comp in found:
                     returnObj[comp]["filters"].append({seg["name"]: seg["id"]})
                     if recursive:
                         listRecusion.append(seg["id"])
         if self.loggingEnabled:
             self.logger.debug(f"Analyzing calculated metrics")
         for _, met in myMetrics.iterrows():
+            found = matcher.findAll(str(met["definition"]))
             for comp in components:
-                if re.search(f"{comp}", str(met["definition"])):
+                if comp in found:
                     returnObj[comp]["calculatedMetrics"].append(
                         {met["name"]: met["id"]}
                     )
@@ -1952,38 +2482,26 @@ class CJA:
         for proj in teeProjects[0]:
             ## mobile reports don't have dimensions.
             if proj["reportType"] == "desktop":
+                ## one entry per element of the project using the component
+                counts = matcher.countAll(
+                    proj["dimensions"]
+                    + proj["metrics"]
+                    + proj.get("filters", [])
+                    + proj.get("calculatedMetrics", [])
+                )
                 for comp in components:
-                    for element in proj["dimensions"]:
-                        if re.search(f"{comp}", element):
-                            returnObj[comp]["projects"].append(
-                                {proj["name"]: proj["id"]}
-                            )
-                    for element in proj["metrics"]:
-                        if re.search(f"{comp}", element):
-                            returnObj[comp]["projects"].append(
-                                {proj["name"]: proj["id"]}
-                            )
-                    for element in proj.get("filters", []):
-                        if re.search(f"{comp}", element):
-                            returnObj[comp]["projects"].append(
-                                {proj["name"]: proj["id"]}
-                            )
-                    for element in proj.get("calculatedMetrics", []):
-                        if re.search(f"{comp}", element):
-                            returnObj[comp]["projects"].append(
-                                {proj["name"]: proj["id"]}
-                            )
+                    returnObj[comp]["projects"] += [
+                        {proj["name"]: proj["id"]} for _ in range(counts[comp])
+                    ]
         if recursive:
             if self.loggingEnabled:
                 self.logger.debug(f"recursive option checked")
-            for proj in teeProjects[1]:
-                for rec in listRecusion:
-                    for element in proj.get("filters", []):
-                        if re.search(f"{rec}", element):
-                            recurseObj[rec].append({proj["name"]: proj["id"]})
-                    for element in proj.get("calculatedMetrics", []):
-                        if re.search(f"{rec}", element):
-                            recurseObj[rec].append({proj["name"]: proj["id"]})
+            ## dependency graph of the filters, calculated metrics and projects scanned
+            recursionIndex = ComponentUsageIndex()
+            recursionIndex.build(myFilters, myMetrics, list(teeProjects[1]))
+            recurseObj = self._getRecursiveUsage(
+                ComponentDependencyGraph(recursionIndex), listRecusion
+            )
         if recursive:
             returnObj["recursion"] = recurseObj
         return returnObj
@@ -1992,31 +2510,145 @@ class CJA:
         self,
         dataRows: list = None,
         reportType: str = "normal",
-    ) -> dict:
+        nbMetrics: int = None,
+    ) -> pd.DataFrame:
         """
-        Read the data returned by the getReport and returns a dictionary used by the Workspace class.
+        Read the data returned by the getReport and returns the dataframe used by the Workspace class.
+        The dataframe is built by columns from the rows, without copying them: the itemId is categorical and the metrics are float64.
         Arguments:
             dataRows : REQUIRED : data rows data from CJA API getReport
             reportType : REQUIRED : "normal" or "static"
+            nbMetrics : OPTIONAL : number of metrics, to build the columns of an empty report
         """
         if dataRows is None:
             raise ValueError("Require dataRows")
-        data_rows = deepcopy(dataRows)
-        expanded_rows = {}
         if reportType == "normal":
-            for row in data_rows:
-                expanded_rows[row["itemId"]] = [row["value"]]
-                expanded_rows[row["itemId"]] += row["data"]
+            itemIds = [row["itemId"] for row in dataRows]
+            if len(set(itemIds)) != len(itemIds):
+                ## an item returned twice keeps its first position with its last values
+                lastIndex = {itemId: index for index, itemId in enumerate(itemIds)}
+                itemIds = list(dict.fromkeys(itemIds))
+                dataRows = [dataRows[lastIndex[itemId]] for itemId in itemIds]
+            labels = pd.Categorical(itemIds)
+            values = [row["value"] for row in dataRows]
+            metricsData = [row["data"] for row in dataRows]
+            columns = ["itemId", "value"]
         elif reportType == "static":
-            expanded_rows = data_rows
-        return expanded_rows
+            labels = list(dataRows.keys())
+            values = [row[0] for row in dataRows.values()]
+            metricsData = [row[1:] for row in dataRows.values()]
+            columns = ["FilterName", "FilterId"]
+        if len(metricsData) > 0:
+            nbMetrics = len(metricsData[0])
+        metricsArray = np.array(metricsData, dtype="float64").reshape(
+            len(metricsData), nbMetrics or 0
+        )
+        ## a single float64 block, the 2 first columns are inserted before it
+        df = pd.DataFrame(metricsArray, columns=range(2, 2 + metricsArray.shape[1]), copy=False)
+        df.insert(0, columns[0], labels)
+        df.insert(1, columns[1], values)
+        return df
+
+    def resolveComponentNames(
+        self, componentIds: list = None, chunkSize: int = 100, max_workers: int = 4
+    ) -> dict:
+        """
+        Return a dictionary with the name of the filters and calculated metrics IDs passed.
+        The components are retrieved in bulk, one request per type (filterByIds parameter), sent in parallel.
+        The other IDs are returned as they are.
+        Arguments:
+            componentIds : REQUIRED : list of filters or calculated metrics IDs
+            chunkSize : OPTIONAL : maximum number of IDs per bulk request (default 100)
+            max_workers : OPTIONAL : number of bulk requests sent at the same time (default 4)
+        """
+        if componentIds is None:
+            raise ValueError("Require a list of component IDs")
+        names = {}
+        filterIds, calcMetricIds = [], []
+        for componentId in dict.fromkeys(componentIds):  ## unique IDs, keeping the order
+            if str(componentId).startswith("cm"):
+                componentType, idList = "calculatedMetric", calcMetricIds
+            elif str(componentId).startswith("s") and "@AdobeOrg" in componentId:
+                componentType, idList = "filter", filterIds
+            else:
+                names[componentId] = componentId
+                continue
+            cached = self._getCachedComponent(
+                (componentType, componentId, False)
+            ) or self._getCachedComponent((componentType, componentId, True))
+            if cached is not None:
+                names[componentId] = cached.get("name", componentId)
+            else:
+                idList.append(componentId)
+        if len(filterIds) == 0 and len(calcMetricIds) == 0:
+            return names
+        if self.loggingEnabled:
+            self.logger.debug(
+                f"resolveComponentNames: {len(filterIds)} filters, {len(calcMetricIds)} calculated metrics"
+            )
+        bulkCalls = [
+            (self.getFilters, filterIds[i : i + chunkSize])
+            for i in range(0, len(filterIds), chunkSize)
+        ] + [
+            (self.getCalculatedMetrics, calcMetricIds[i : i + chunkSize])
+            for i in range(0, len(calcMetricIds), chunkSize)
+        ]
+
+        def fetch(call: tuple) -> list:
+            method, ids = call
+            return method(filterByIds=",".join(ids), output="raw", cache=False)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(bulkCalls)))) as executor:
+            for elements in executor.map(fetch, bulkCalls):
+                for element in elements:
+                    if isinstance(element, dict) and "id" in element:
+                        names[element["id"]] = element.get("name", element["id"])
+        ## components not returned by the list endpoints (hidden, not shared) are requested one by one
+        for componentId in filterIds + calcMetricIds:
+            if componentId in names:
+                continue
+            if componentId.startswith("cm"):
+                element = self.getCalculatedMetric(componentId)
+            else:
+                element = self.getFilter(componentId)
+            names[componentId] = element.get("name", componentId)
+        return names
+
+    def _getReportComponentIds(self, dataRequest: dict = None, resolveColumns: bool = True) -> list:
+        """
+        Return the list of the filters and calculated metrics IDs used in a report request.
+        Arguments:
+            dataRequest : REQUIRED : the request sent to the reporting API.
+            resolveColumns : OPTIONAL : include the metrics IDs
+        """
+        componentIds = [
+            filter["segmentId"]
+            for filter in dataRequest.get("globalFilters", [])
+            if filter.get("type") == "segment" and filter.get("segmentId") is not None
+        ]
+        componentIds += [
+            filter["segmentId"]
+            for filter in dataRequest["metricContainer"].get("metricFilters", [])
+            if filter.get("segmentId") is not None
+        ]
+        if resolveColumns:
+            componentIds += [
+                metric["id"] for metric in dataRequest["metricContainer"]["metrics"]
+            ]
+        return componentIds
 
     def _decrypteStaticData(
-        self, dataRequest: dict = None, response: dict = None
+        self, dataRequest: dict = None, response: dict = None, componentNames: dict = None
     ) -> dict:
         """
         From the request dictionary and the response, decrypte the data to standardise the reading.
+        Arguments:
+            dataRequest : REQUIRED : the request sent to the reporting API.
+            response : REQUIRED : the response returned by the reporting API.
+            componentNames : OPTIONAL : names of the components already resolved (see resolveComponentNames)
         """
+        if componentNames is None:
+            componentNames = {}
         dataRows = []
         ## retrieve StaticRow ID and segmentID
         if len([metric for metric in dataRequest['metricContainer'].get('metricFilters',[]) if metric.get('id','').startswith("STATIC_ROW_COMPONENT")])>0:
@@ -2066,7 +2698,9 @@ class CJA:
         staticRows = set(val for val in tableSegmentsRows.values())
         staticRowsNames = []
         for row in staticRows:
-            if row.startswith("s") and "@AdobeOrg" in row:
+            if row in componentNames:
+                staticRowsNames.append(componentNames[row])
+            elif row.startswith("s") and "@AdobeOrg" in row:
                 filter = self.getFilter(row)
                 staticRowsNames.append(filter["name"])
             else:
@@ -2088,53 +2722,25 @@ class CJA:
                 ## should ends like : {'segmentName' : ['STATIC',123,456]}
         return nb_columns, tableColumnIds, segmentApplied, filterRelations, dataRows
 
-    def getReport(
+    def _prepareReportRequest(
         self,
         request: Union[dict, IO] = None,
         limit: int = 20000,
-        n_results: Union[int, str] = "inf",
-        allowRemoteLoad: str = "default",
-        useCache: bool = True,
-        useResultsCache: bool = False,
-        includeOberonXml: bool = False,
-        includePredictiveObjects: bool = False,
         returnsNone: bool = None,
         countRepeatInstances: bool = None,
         ignoreZeroes: bool = None,
         dataViewId: str = None,
-        resolveColumns: bool = True,
-        save: bool = False,
-        returnClass: bool = True,
-    ) -> Union[Workspace, dict]:
+    ) -> dict:
         """
-        Return an instance of Workspace that contains the data requested.
-        Argumnents:
-            request : REQUIRED : either a dictionary of a JSON file that contains the request information.
-            limit : OPTIONAL : number of results per request (default 1000)
-            n_results : OPTIONAL : total number of results returns. Use "inf" to return everything (default "inf")
-            allowRemoteLoad : OPTIONAL : Controls if Oberon should remote load data. Default behavior is true with fallback to false if remote data does not exist
-            useCache : OPTIONAL : Use caching for faster requests (Do not do any report caching)
-            useResultsCache : OPTIONAL : Use results caching for faster reporting times (This is a pass through to Oberon which manages the Cache)
-            includeOberonXml : OPTIONAL : Controls if Oberon XML should be returned in the response - DEBUG ONLY
-            includePredictiveObjects : OPTIONAL : Controls if platform Predictive Objects should be returned in the response. Only available when using Anomaly Detection or Forecasting- DEBUG ONLY
+        Load the request passed to the getReport method and apply the settings on a copy of it.
+        Arguments:
+            request : REQUIRED : either a dictionary, a RequestCreator instance or a JSON file that contains the request information.
+            limit : OPTIONAL : number of results per request
             returnsNone : OPTIONAL: Overwritte the request setting to return None values.
             countRepeatInstances : OPTIONAL: Overwritte the request setting to count repeatInstances values.
             ignoreZeroes : OPTIONAL : Ignore zeros in the results
-            dataViewId : OPTIONAL : Overwrite the data View ID used for report. Only works if the same components are presents.
-            resolveColumns: OPTIONAL : automatically resolve columns from ID to name for calculated metrics & segments. Default True. (works on returnClass only)
-            save : OPTIONAL : If you want to save the data (in JSON or CSV, depending the class is used or not)
-            returnClass : OPTIONAL : return the class building dataframe and better comprehension of data. (default yes)
+            dataViewId : OPTIONAL : Overwrite the data View ID used for report.
         """
-        if self.loggingEnabled:
-            self.logger.debug(f"Start getReport")
-        path = "/reports"
-        params = {
-            "allowRemoteLoad": allowRemoteLoad,
-            "useCache": useCache,
-            "useResultsCache": useResultsCache,
-            "includeOberonXml": includeOberonXml,
-            "includePlatformPredictiveObjects": includePredictiveObjects,
-        }
         if type(request) == dict:
             dataRequest = deepcopy(request)
         elif type(request) == RequestCreator:
@@ -2161,96 +2767,136 @@ class CJA:
             dataRequest["statistics"]["ignoreZeroes"] = True
         else:
             dataRequest["statistics"]["ignoreZeroes"] = False
-        ### Request data
-        if self.loggingEnabled:
-            self.logger.debug(f"getReport request: {json.dumps(dataRequest,indent=4)}")
-        res = self.connector.postData(
-            self.endpoint + path, data=dataRequest, params=params
+        return dataRequest
+
+    def _getReportMetricColumns(
+        self, dataRequest: dict = None, componentNames: dict = None
+    ) -> tuple:
+        """
+        Return the metrics columns of a report with a dimension, as a dictionary of the columnId and metric ID
+        followed by its filters ("metricId:::filter1:::filter2"), and the dictionary of the filters names.
+        Arguments:
+            dataRequest : REQUIRED : the request sent to the reporting API.
+            componentNames : REQUIRED : names of the components (see resolveComponentNames)
+        """
+        ### create relation between metrics and filters applied
+        columnIdRelations = {
+            obj["columnId"]: obj["id"]
+            for obj in dataRequest["metricContainer"]["metrics"]
+        }
+        filterRelations = {
+            obj["columnId"]: obj["filters"]
+            for obj in dataRequest["metricContainer"]["metrics"]
+            if len(obj.get("filters", [])) > 0
+        }
+        metricFilters = {}
+        metricFilterTranslation = {}
+        for filter in dataRequest["metricContainer"].get("metricFilters", []):
+            filterId = filter["id"]
+            if filter["type"] == "breakdown":
+                filterValue = f"{filter['dimension']}:{filter['itemId']}"
+                metricFilters[filter["dimension"]] = filter["itemId"]
+            if filter["type"] == "dateRange":
+                filterValue = f"{filter['dateRange']}"
+                metricFilters[filterValue] = filterValue
+            if filter["type"] == "segment":
+                filterValue = f"{filter['segmentId']}"
+                if filterValue.startswith("s") and "@AdobeOrg" in filterValue:
+                    metricFilters[filterValue] = componentNames[filterValue]
+            metricFilterTranslation[filterId] = filterValue
+        metricColumns = {}
+        for colId in columnIdRelations.keys():
+            metricColumns[colId] = columnIdRelations[colId]
+            for element in filterRelations.get(colId, []):
+                metricColumns[colId] += f":::{metricFilterTranslation[element]}"
+        return metricColumns, metricFilters
+
+    def _getReportSinkColumns(
+        self,
+        dataRequest: dict = None,
+        response: dict = None,
+        resolveColumns: bool = True,
+    ) -> list:
+        """
+        Return the columns names of the rows written in a sink: itemId, the dimension and the metrics.
+        Arguments:
+            dataRequest : REQUIRED : the request sent to the reporting API.
+            response : REQUIRED : the first page returned by the reporting API.
+            resolveColumns : OPTIONAL : resolve the calculated metrics & segments names.
+        """
+        componentNames = self.resolveComponentNames(
+            self._getReportComponentIds(dataRequest, resolveColumns=resolveColumns)
         )
-        if "rows" in res.keys():
+        metricColumns, _ = self._getReportMetricColumns(dataRequest, componentNames)
+        columns = ["itemId", dataRequest["dimension"]]
+        for colId in response["columns"]["columnIds"]:
+            if resolveColumns:
+                columns.append(
+                    ":::".join(
+                        componentNames.get(metric, metric)
+                        for metric in metricColumns[colId].split(":::")
+                    )
+                )
+            else:
+                columns.append(metricColumns[colId])
+        return columns
+
+    def _buildWorkspace(
+        self,
+        dataRequest: dict = None,
+        response: dict = None,
+        dataRows: list = None,
+        resolveColumns: bool = True,
+    ) -> Workspace:
+        """
+        Build the Workspace instance from the request and the response of the reporting API.
+        Arguments:
+            dataRequest : REQUIRED : the request sent to the reporting API.
+            response : REQUIRED : the (first page) response returned by the reporting API.
+            dataRows : OPTIONAL : the rows of all pages retrieved, for normal report.
+            resolveColumns : OPTIONAL : resolve columns from ID to name for calculated metrics & segments.
+        """
+        ## all the components names are retrieved at once, in bulk
+        componentNames = self.resolveComponentNames(
+            self._getReportComponentIds(
+                dataRequest,
+                resolveColumns=resolveColumns or "rows" not in response.keys(),
+            )
+        )
+        if "rows" in response.keys():
             reportType = "normal"
             if self.loggingEnabled:
                 self.logger.debug(f"reportType: {reportType}")
-            dataRows = res.get("rows")
-            columns = res.get("columns")
-            summaryData = res.get("summaryData")
-            totalElements = res.get("numberOfElements")
-            lastPage = res.get("lastPage", True)
-            if float(len(dataRows)) >= float(n_results):
-                ## force end of loop when a limit is set on n_results
-                lastPage = True
-            while lastPage != True:
-                dataRequest["settings"]["page"] += 1
-                res = self.connector.postData(
-                    self.endpoint + path, data=dataRequest, params=params
-                )
-                dataRows += res.get("rows")
-                lastPage = res.get("lastPage", True)
-                totalElements += res.get("numberOfElements")
-                if float(len(dataRows)) >= float(n_results):
-                    ## force end of loop when a limit is set on n_results
-                    lastPage = True
-            if self.loggingEnabled:
-                self.logger.debug(f"loop for report over: {len(dataRows)} results")
-            if returnClass == False:
-                return dataRows
-            ### create relation between metrics and filters applied
-            columnIdRelations = {
-                obj["columnId"]: obj["id"]
-                for obj in dataRequest["metricContainer"]["metrics"]
-            }
-            filterRelations = {
-                obj["columnId"]: obj["filters"]
-                for obj in dataRequest["metricContainer"]["metrics"]
-                if len(obj.get("filters", [])) > 0
-            }
-            metricFilters = {}
-            metricFilterTranslation = {}
-            for filter in dataRequest["metricContainer"].get("metricFilters", []):
-                filterId = filter["id"]
-                if filter["type"] == "breakdown":
-                    filterValue = f"{filter['dimension']}:{filter['itemId']}"
-                    metricFilters[filter["dimension"]] = filter["itemId"]
-                if filter["type"] == "dateRange":
-                    filterValue = f"{filter['dateRange']}"
-                    metricFilters[filterValue] = filterValue
-                if filter["type"] == "segment":
-                    filterValue = f"{filter['segmentId']}"
-                    if filterValue.startswith("s") and "@AdobeOrg" in filterValue:
-                        seg = self.getFilter(filterValue)
-                        metricFilters[filterValue] = seg["name"]
-                metricFilterTranslation[filterId] = filterValue
-            metricColumns = {}
-            for colId in columnIdRelations.keys():
-                metricColumns[colId] = columnIdRelations[colId]
-                for element in filterRelations.get(colId, []):
-                    metricColumns[colId] += f":::{metricFilterTranslation[element]}"
+            columns = response.get("columns")
+            summaryData = response.get("summaryData")
+            metricColumns, metricFilters = self._getReportMetricColumns(
+                dataRequest, componentNames
+            )
         else:
-            if 'error-504' in res.keys():
-                raise TimeoutError(res['error-504'])
-            if returnClass == False:
-                return res
             reportType = "static"
             if self.loggingEnabled:
                 self.logger.debug(f"reportType: {reportType}")
             columns = None  ## no "columns" key in response
-            summaryData = res.get("summaryData")
+            summaryData = response.get("summaryData")
             (
                 nb_columns,
                 tableColumnIds,
                 segmentApplied,
                 filterRelations,
                 dataRows,
-            ) = self._decrypteStaticData(dataRequest=dataRequest, response=res)
+            ) = self._decrypteStaticData(
+                dataRequest=dataRequest,
+                response=response,
+                componentNames=componentNames,
+            )
             ### Findings metrics
             metricFilters = {}
             metricColumns = []
             for i in range(nb_columns):
-                metric: str = res["columns"]["columnIds"][i]
+                metric: str = response["columns"]["columnIds"][i]
                 metricName = metric.split(":::")[0]
                 if metricName.startswith("cm"):
-                    calcMetric = self.getCalculatedMetric(metricName)
-                    metricName = calcMetric["name"]
+                    metricName = componentNames[metricName]
                 correspondingStatic = tableColumnIds[metric]
                 ## if the static row has a filter
                 if correspondingStatic in list(filterRelations.keys()):
@@ -2260,33 +2906,620 @@ class CJA:
                         metricName += f":::{segId}"
                         metricFilters[segId] = segId
                         if segId.startswith("s") and "@AdobeOrg" in segId:
-                            seg = self.getFilter(segId)
-                            metricFilters[segId] = seg["name"]
+                            metricFilters[segId] = componentNames[segId]
                 metricColumns.append(metricName)
                 ### ending with ['metric1','metric2 + segId',...]
         ### preparing data points
         if self.loggingEnabled:
             self.logger.debug(f"preparing data")
-        preparedData = self._prepareData(dataRows, reportType=reportType)
-        if returnClass:
+        preparedData = self._prepareData(
+            dataRows,
+            reportType=reportType,
+            nbMetrics=len(columns["columnIds"]) if reportType == "normal" else len(metricColumns),
+        )
+        if self.loggingEnabled:
+            self.logger.debug(f"returning Workspace class")
+        ## Using the class
+        data = Workspace(
+            responseData=preparedData,
+            dataRequest=dataRequest,
+            columns=columns,
+            summaryData=summaryData,
+            cjaConnector=self,
+            reportType=reportType,
+            metrics=metricColumns,  ## for normal type   ## for staticReport
+            metricFilters=metricFilters,
+            resolveColumns=resolveColumns,
+            componentNames=componentNames,
+        )
+        return data
+
+    @staticmethod
+    def _getReportEndPage(
+        totalPages: int = None, limit: int = 20000, n_results: Union[int, str] = "inf"
+    ) -> int:
+        """
+        Return the page number after the last page to request, to retrieve n_results rows.
+        Arguments:
+            totalPages : REQUIRED : total number of pages of the report
+            limit : REQUIRED : number of rows per page
+            n_results : OPTIONAL : total number of results requested
+        """
+        if n_results == "inf" or float(n_results) == float("inf"):
+            return totalPages
+        return max(1, min(totalPages, ceil(float(n_results) / limit)))
+
+    @staticmethod
+    def _reportPageRequest(dataRequest: dict = None, page: int = 0) -> dict:
+        """
+        Return a copy of the report request for that page, the original request is not modified.
+        Arguments:
+            dataRequest : REQUIRED : the report request
+            page : REQUIRED : page number to request
+        """
+        pageRequest = deepcopy(dataRequest)
+        pageRequest["settings"]["page"] = page
+        return pageRequest
+
+    def _postReport(self, path: str = None, dataRequest: dict = None, params: dict = None) -> dict:
+        """
+        Send a report request and return its response, from the report cache when it is set and the response is cached.
+        Arguments:
+            path : REQUIRED : path of the reporting endpoint
+            dataRequest : REQUIRED : the report request (for one page)
+            params : REQUIRED : parameters of the request
+        """
+        if self.reportCache is not None:
+            res = self.reportCache.get(dataRequest, params)
+            if res is not None:
+                if self.loggingEnabled:
+                    self.logger.debug(f"report page {dataRequest['settings'].get('page')} returned from the report cache")
+                return res
+        res = self.connector.postData(self.endpoint + path, data=dataRequest, params=params)
+        if self.reportCache is not None:
+            self.reportCache.set(dataRequest, params, res)
+        return res
+
+    def _fetchReportPage(
+        self, path: str = None, dataRequest: dict = None, params: dict = None, page: int = 0
+    ) -> list:
+        """
+        Request a page of the report and return its rows.
+        Arguments:
+            path : REQUIRED : path of the reporting endpoint
+            dataRequest : REQUIRED : the report request
+            params : REQUIRED : parameters of the request
+            page : REQUIRED : page number to request
+        """
+        pageRequest = self._reportPageRequest(dataRequest, page)
+        res = self._postReport(path, pageRequest, params)
+        if "rows" not in res.keys():
+            if "error-504" in res.keys():
+                raise TimeoutError(res["error-504"])
+            raise ValueError(f"Issue retrieving the page {page} of the report: {res}")
+        return res["rows"]
+
+    def _iterReportPages(
+        self,
+        path: str = None,
+        dataRequest: dict = None,
+        params: dict = None,
+        firstResponse: dict = None,
+        n_results: Union[int, str] = "inf",
+        max_workers: int = 1,
+    ) -> Iterator[list]:
+        """
+        Generator yielding the rows of the report pages following the first one, in the page order.
+        When max_workers is above 1 and the first response provides the total number of pages,
+        the pages are requested concurrently, never holding more than max_workers pages in advance.
+        Arguments:
+            path : REQUIRED : path of the reporting endpoint
+            dataRequest : REQUIRED : the report request
+            params : REQUIRED : parameters of the request
+            firstResponse : REQUIRED : the response of the first page
+            n_results : OPTIONAL : stop requesting new pages once that number of results is reached (default "inf")
+            max_workers : OPTIONAL : number of pages requested at the same time (default 1, sequential)
+        """
+        nbResults = len(firstResponse.get("rows", []))
+        lastPage = firstResponse.get("lastPage", True)
+        if float(nbResults) >= float(n_results):
+            ## force end of loop when a limit is set on n_results
+            lastPage = True
+        if lastPage == True:
+            return
+        totalPages = firstResponse.get("totalPages")
+        if max_workers > 1 and totalPages is not None:
+            endPage = self._getReportEndPage(
+                totalPages, dataRequest["settings"]["limit"], n_results
+            )
+            if self.loggingEnabled:
+                self.logger.debug(
+                    f"fetching report pages 1 to {endPage-1} with {max_workers} workers"
+                )
+            pages = iter(range(1, endPage))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = deque(
+                    executor.submit(self._fetchReportPage, path, dataRequest, params, page)
+                    for page in islice(pages, max_workers)
+                )
+                while futures:
+                    rows = futures.popleft().result()
+                    for page in islice(pages, 1):
+                        futures.append(
+                            executor.submit(self._fetchReportPage, path, dataRequest, params, page)
+                        )
+                    yield rows
+            return
+        page = 1
+        while lastPage != True:
+            res = self._postReport(
+                path,
+                self._reportPageRequest(dataRequest, page),
+                params,
+            )
+            if "rows" not in res.keys():
+                if "error-504" in res.keys():
+                    raise TimeoutError(res["error-504"])
+                raise ValueError(f"Issue retrieving the page {page} of the report: {res}")
+            yield res["rows"]
+            nbResults += len(res["rows"])
+            lastPage = res.get("lastPage", True)
+            if float(nbResults) >= float(n_results):
+                ## force end of loop when a limit is set on n_results
+                lastPage = True
+            page += 1
+
+    def _writeReportSink(
+        self,
+        sink: str = None,
+        path: str = None,
+        dataRequest: dict = None,
+        params: dict = None,
+        firstResponse: dict = None,
+        n_results: Union[int, str] = "inf",
+        parallel_pages: int = 1,
+        resolveColumns: bool = True,
+    ) -> dict:
+        """
+        Write the rows of the report in the sink, page by page as they arrive, and return a summary of the export.
+        Arguments:
+            sink : REQUIRED : path of the file, the format is defined by the extension (.csv, .jsonl, .ndjson, .parquet)
+            path : REQUIRED : path of the reporting endpoint
+            dataRequest : REQUIRED : the report request
+            params : REQUIRED : parameters of the request
+            firstResponse : REQUIRED : the response of the first page
+            n_results : OPTIONAL : stop requesting new pages once that number of results is reached (default "inf")
+            parallel_pages : OPTIONAL : number of pages requested at the same time (default 1, sequential)
+            resolveColumns : OPTIONAL : resolve the calculated metrics & segments names in the header.
+        """
+        columns = self._getReportSinkColumns(
+            dataRequest, firstResponse, resolveColumns=resolveColumns
+        )
+        writer = getReportSink(sink, columns)
+        pages = 1
+        try:
+            writer.write(
+                [[row["itemId"], row["value"]] + row["data"] for row in firstResponse["rows"]]
+            )
+            for rows in self._iterReportPages(
+                path,
+                dataRequest,
+                params,
+                firstResponse,
+                n_results=n_results,
+                max_workers=parallel_pages,
+            ):
+                writer.write([[row["itemId"], row["value"]] + row["data"] for row in rows])
+                pages += 1
+        finally:
+            writer.close()
+        if self.loggingEnabled:
+            self.logger.debug(f"report written in {writer.path}: {writer.rows} rows")
+        return {
+            "sink": str(writer.path),
+            "format": writer.format,
+            "rows": writer.rows,
+            "pages": pages,
+            "totalPages": firstResponse.get("totalPages"),
+            "columns": writer.columns,
+            "summaryData": firstResponse.get("summaryData"),
+        }
+
+    def getReport(
+        self,
+        request: Union[dict, IO] = None,
+        limit: int = 20000,
+        n_results: Union[int, str] = "inf",
+        allowRemoteLoad: str = "default",
+        useCache: bool = True,
+        useResultsCache: bool = False,
+        includeOberonXml: bool = False,
+        includePredictiveObjects: bool = False,
+        returnsNone: bool = None,
+        countRepeatInstances: bool = None,
+        ignoreZeroes: bool = None,
+        dataViewId: str = None,
+        resolveColumns: bool = True,
+        save: bool = False,
+        returnClass: bool = True,
+        parallel_pages: int = 1,
+        sink: str = None,
+        shardBy: str = None,
+        parallel_shards: int = 4,
+        nonAdditiveMetrics: list = None,
+        shardResults: Union[int, str] = 50000,
+    ) -> Union[Workspace, dict]:
+        """
+        Return an instance of Workspace that contains the data requested.
+        Argumnents:
+            request : REQUIRED : either a dictionary of a JSON file that contains the request information.
+            limit : OPTIONAL : number of results per request (default 1000)
+            n_results : OPTIONAL : total number of results returns. Use "inf" to return everything (default "inf")
+            allowRemoteLoad : OPTIONAL : Controls if Oberon should remote load data. Default behavior is true with fallback to false if remote data does not exist
+            useCache : OPTIONAL : Use caching for faster requests (Do not do any report caching)
+            useResultsCache : OPTIONAL : Use results caching for faster reporting times (This is a pass through to Oberon which manages the Cache)
+            includeOberonXml : OPTIONAL : Controls if Oberon XML should be returned in the response - DEBUG ONLY
+            includePredictiveObjects : OPTIONAL : Controls if platform Predictive Objects should be returned in the response. Only available when using Anomaly Detection or Forecasting- DEBUG ONLY
+            returnsNone : OPTIONAL: Overwritte the request setting to return None values.
+            countRepeatInstances : OPTIONAL: Overwritte the request setting to count repeatInstances values.
+            ignoreZeroes : OPTIONAL : Ignore zeros in the results
+            dataViewId : OPTIONAL : Overwrite the data View ID used for report. Only works if the same components are presents.
+            resolveColumns: OPTIONAL : automatically resolve columns from ID to name for calculated metrics & segments. Default True. (works on returnClass only)
+            save : OPTIONAL : If you want to save the data (in JSON or CSV, depending the class is used or not)
+            returnClass : OPTIONAL : return the class building dataframe and better comprehension of data. (default yes)
+            parallel_pages : OPTIONAL : number of pages requested at the same time after the first one (default 1, sequential)
+                The number of pages is given by the first response, and only the pages needed for n_results are requested.
+            sink : OPTIONAL : path of a file (.csv, .jsonl, .ndjson or .parquet) where the rows are written page by page, as they arrive.
+                The rows are not kept in memory and a summary of the export is returned instead of the data.
+                Only for reports with a dimension, parquet requires the pyarrow library.
+            shardBy : OPTIONAL : split the dateRange of the request into "day", "week" or "month" sub-windows, requested concurrently.
+                The results are merged by itemId into a single Workspace, summing the metrics. Only for reports with a dimension.
+            parallel_shards : OPTIONAL : number of sub-windows requested at the same time (default 4)
+            nonAdditiveMetrics : OPTIONAL : list of metrics ID that cannot be summed over the sub-windows.
+                Their merged values are NaN and listed in the nonAdditiveColumns attribute.
+                Required when the request contains calculated metrics or the people metric (metrics/visitors): pass [] to sum them anyway.
+            shardResults : OPTIONAL : maximum number of rows requested per sub-window (default 50000).
+                Use "inf" to request every row. The sub-windows reaching that number are listed in the truncatedShards attribute.
+        """
+        if self.loggingEnabled:
+            self.logger.debug(f"Start getReport")
+        path = "/reports"
+        params = {
+            "allowRemoteLoad": allowRemoteLoad,
+            "useCache": useCache,
+            "useResultsCache": useResultsCache,
+            "includeOberonXml": includeOberonXml,
+            "includePlatformPredictiveObjects": includePredictiveObjects,
+        }
+        dataRequest = self._prepareReportRequest(
+            request,
+            limit=limit,
+            returnsNone=returnsNone,
+            countRepeatInstances=countRepeatInstances,
+            ignoreZeroes=ignoreZeroes,
+            dataViewId=dataViewId,
+        )
+        if shardBy is not None:
+            if sink is not None or returnClass == False:
+                raise ValueError("shardBy requires to return the Workspace (no sink, returnClass True)")
+            return self._getShardedReport(
+                dataRequest,
+                shardBy,
+                parallel_shards=parallel_shards,
+                nonAdditiveMetrics=nonAdditiveMetrics,
+                shardResults=shardResults,
+                limit=limit,
+                n_results=n_results,
+                allowRemoteLoad=allowRemoteLoad,
+                useCache=useCache,
+                useResultsCache=useResultsCache,
+                returnsNone=returnsNone,
+                countRepeatInstances=countRepeatInstances,
+                ignoreZeroes=ignoreZeroes,
+                resolveColumns=resolveColumns,
+                parallel_pages=parallel_pages,
+                save=save,
+            )
+        ### Request data
+        if self.loggingEnabled:
+            self.logger.debug(f"getReport request: {json.dumps(dataRequest,indent=4)}")
+        res = self._postReport(path, dataRequest, params)
+        firstResponse = res
+        dataRows = None
+        if sink is not None:
+            if "rows" not in res.keys():
+                if "error-504" in res.keys():
+                    raise TimeoutError(res["error-504"])
+                raise ValueError("The sink export requires a report with a dimension")
+            return self._writeReportSink(
+                sink,
+                path,
+                dataRequest,
+                params,
+                firstResponse,
+                n_results=n_results,
+                parallel_pages=parallel_pages,
+                resolveColumns=resolveColumns,
+            )
+        if "rows" in res.keys():
+            dataRows = res.get("rows")
+            for rows in self._iterReportPages(
+                path,
+                dataRequest,
+                params,
+                firstResponse,
+                n_results=n_results,
+                max_workers=parallel_pages,
+            ):
+                dataRows += rows
             if self.loggingEnabled:
-                self.logger.debug(f"returning Workspace class")
-            ## Using the class
-            data = Workspace(
-                responseData=preparedData,
+                self.logger.debug(f"loop for report over: {len(dataRows)} results")
+            if returnClass == False:
+                return dataRows
+        else:
+            if 'error-504' in res.keys():
+                raise TimeoutError(res['error-504'])
+            if returnClass == False:
+                return res
+        if returnClass:
+            data = self._buildWorkspace(
                 dataRequest=dataRequest,
-                columns=columns,
-                summaryData=summaryData,
-                cjaConnector=self,
-                reportType=reportType,
-                metrics=metricColumns,  ## for normal type   ## for staticReport
-                metricFilters=metricFilters,
+                response=firstResponse,
+                dataRows=dataRows,
                 resolveColumns=resolveColumns,
             )
             if save:
                 data.to_csv()
             return data
 
+    def _getShardedReport(
+        self,
+        dataRequest: dict = None,
+        shardBy: str = "month",
+        parallel_shards: int = 4,
+        nonAdditiveMetrics: list = None,
+        shardResults: Union[int, str] = 50000,
+        n_results: Union[int, str] = "inf",
+        save: bool = False,
+        **kwargs,
+    ) -> Workspace:
+        """
+        Request the report on each sub-window of its dateRange concurrently and merge the results by itemId.
+        Each sub-window is requested up to shardResults rows, the sort of the request and n_results are applied after the merge.
+        The additive metrics are summed, the non additive metrics passed are set to NaN.
+        The calculated metrics and the people metric cannot be summed safely: they need to be declared in nonAdditiveMetrics (or nonAdditiveMetrics=[]).
+        Returns a Workspace with the dateRange of the request.
+        Arguments:
+            dataRequest : REQUIRED : the request prepared by getReport
+            shardBy : REQUIRED : size of the sub-windows: "day", "week" or "month"
+            parallel_shards : OPTIONAL : number of sub-windows requested at the same time (default 4)
+            nonAdditiveMetrics : OPTIONAL : list of metrics ID that cannot be summed, required when the request contains calculated metrics or metrics/visitors
+            shardResults : OPTIONAL : maximum number of rows requested per sub-window (default 50000), "inf" for every row
+            n_results : OPTIONAL : number of results to return after the merge
+            save : OPTIONAL : save the merged result in a CSV
+            kwargs : parameters passed to getReport for each sub-window
+        """
+        if "dimension" not in dataRequest.keys():
+            raise ValueError("shardBy requires a report with a dimension")
+        ## non additive metrics need to be declared by the caller
+        metricIds = [metric["id"] for metric in dataRequest["metricContainer"]["metrics"]]
+        if nonAdditiveMetrics is None:
+            suspicious = [
+                metricId
+                for metricId in metricIds
+                if metricId == "metrics/visitors" or metricId.startswith("cm")
+            ]
+            if len(suspicious) > 0:
+                raise ValueError(
+                    f"The metrics {suspicious} may not be summed over the sub-windows. "
+                    "Pass the non additive ones in nonAdditiveMetrics (returned as NaN), or nonAdditiveMetrics=[] to sum them."
+                )
+        nonAdditive = set(nonAdditiveMetrics or [])
+        nonAdditiveIndexes = [
+            index for index, metricId in enumerate(metricIds) if metricId in nonAdditive
+        ]
+        if shardResults != "inf" and n_results != "inf" and float(n_results) > float(shardResults):
+            raise ValueError("n_results cannot be greater than shardResults")
+        shards = RequestCreator(dataRequest).splitDateRange(shardBy)
+        if self.loggingEnabled:
+            self.logger.debug(f"getReport split into {len(shards)} {shardBy} sub-windows")
+        with ThreadPoolExecutor(max_workers=max(1, min(parallel_shards, len(shards)))) as executor:
+            workspaces = list(
+                executor.map(
+                    ## an item outside the top of every sub-window can be in the top of the merge
+                    lambda shard: self.getReport(request=shard, n_results=shardResults, **kwargs),
+                    shards,
+                )
+            )
+        ## the sub-windows cut by shardResults can miss items of the merged ranking
+        truncatedShards = []
+        if shardResults != "inf":
+            truncatedShards = [
+                f"{shard.startDate}/{shard.endDate}"
+                for shard in workspaces
+                if shard.row_numbers >= float(shardResults)
+            ]
+            if len(truncatedShards) > 0 and self.loggingEnabled:
+                self.logger.warning(
+                    f"{len(truncatedShards)} sub-windows reached shardResults ({shardResults} rows), the merge can miss items"
+                )
+        workspace = workspaces[0]
+        columns = list(workspace.dataframe.columns)
+        df = pd.concat([shard.dataframe for shard in workspaces], ignore_index=True)
+        df.columns = range(len(columns))  ## the metrics names can be duplicated
+        df[0] = df[0].astype(object)
+        aggregation = {1: "first"}
+        aggregation.update({position: "sum" for position in range(2, len(columns))})
+        df_merged = df.groupby(0, sort=False).agg(aggregation).reset_index()
+        for index in nonAdditiveIndexes:
+            df_merged[index + 2] = np.nan
+        ## sort of the request: dimensionSort, otherwise the metric with a sort (the first metric by default)
+        dimensionSort = dataRequest.get("settings", {}).get("dimensionSort")
+        metricSorts = [
+            (index, metric["sort"])
+            for index, metric in enumerate(dataRequest["metricContainer"]["metrics"])
+            if metric.get("sort") in ("asc", "desc")
+        ]
+        if dimensionSort in ("asc", "desc"):
+            df_merged = df_merged.sort_values(1, ascending=dimensionSort == "asc", kind="stable")
+        elif len(columns) > 2:
+            sortIndex, sortOrder = metricSorts[0] if len(metricSorts) > 0 else (0, "desc")
+            if sortIndex not in nonAdditiveIndexes:
+                df_merged = df_merged.sort_values(
+                    sortIndex + 2, ascending=sortOrder == "asc", kind="stable"
+                )
+        if n_results != "inf":
+            df_merged = df_merged.head(int(n_results))
+        df_merged = df_merged.reset_index(drop=True)
+        df_merged[0] = pd.Categorical(df_merged[0])
+        df_merged.columns = columns
+        ## summary data
+        totals = {}
+        for key in ("totals", "filteredTotals"):
+            values = [shard.summaryData.get(key) for shard in workspaces if isinstance(shard.summaryData, dict)]
+            if len(values) == len(workspaces) and all(value is not None for value in values):
+                totals[key] = [
+                    None if index in nonAdditiveIndexes else sum(value[index] for value in values)
+                    for index in range(len(values[0]))
+                ]
+        ## the merged Workspace keeps the dateRange of the request
+        workspace.dataframe = df_merged
+        workspace.row_numbers = len(df_merged)
+        workspace.summaryData = totals
+        workspace.dataRequest = RequestCreator(dataRequest)
+        for filter in dataRequest["globalFilters"]:
+            if filter["type"] == "dateRange":
+                workspace.startDate, workspace.endDate = filter["dateRange"].split("/")
+                break
+        workspace.globalFilters = [
+            {**filter, "dateRange": f"{workspace.startDate}/{workspace.endDate}"}
+            if filter["type"] == "dateRange"
+            else filter
+            for filter in workspace.globalFilters
+        ]
+        workspace.nonAdditiveColumns = [columns[index + 2] for index in nonAdditiveIndexes]
+        workspace.truncatedShards = truncatedShards
+        if len(workspace.nonAdditiveColumns) > 0 and self.loggingEnabled:
+            self.logger.warning(
+                f"non additive metrics cannot be merged over the sub-windows: {workspace.nonAdditiveColumns}"
+            )
+        if save:
+            workspace.to_csv()
+        return workspace
+
+    def _getBreakdownReport(
+        self,
+        request: dict = None,
+        metrics: list = None,
+        parent: tuple = None,
+        n_results: Union[int, str] = None,
+        limit: Union[int, str] = None,
+        checkpoint: BreakdownCheckpoint = None,
+    ) -> dict:
+        """
+        Return the columns of the report breakdown by the items of the parent: {"itemId":[...],"value":[...],"data":array of the metrics}
+        Arguments:
+            request : REQUIRED : request of the level, without the breakdown filters
+            metrics : REQUIRED : list of the metrics ID
+            parent : REQUIRED : tuple of the breakdowns (dimension, itemId, value) applied to the metrics
+            n_results : REQUIRED : number of results to return
+            limit : REQUIRED : number of results per page
+            checkpoint : OPTIONAL : BreakdownCheckpoint where the result is read from, or saved to once returned
+        """
+        request = RequestCreator(request)
+        for dimension, itemId, _ in parent:
+            for metric in metrics:
+                request.addMetricFilter(metricId=metric, filterId=f"{dimension}:::{itemId}")
+        request = request.to_dict()
+        if checkpoint is not None:
+            key = checkpoint.getKey(request, n_results)
+            result = checkpoint.get(len(parent), key)
+            if result is not None:
+                return result
+        res = self.getReport(request=request, n_results=n_results, limit=limit)
+        dataframe = res.dataframe
+        result = {
+            "itemId": dataframe["itemId"].tolist(),
+            "value": dataframe.iloc[:, 1].tolist(),
+            "data": dataframe.iloc[:, -len(metrics) :].to_numpy(dtype="float64"),
+        }
+        if checkpoint is not None:
+            checkpoint.save(len(parent), key, result)
+        return result
+
+    def _getBreakdownLevel(
+        self,
+        request: dict = None,
+        levelResults: BreakdownLevel = None,
+        parents: list = None,
+        n_results: Union[int, str] = None,
+        limit: Union[int, str] = None,
+        max_workers: int = 4,
+        progress: Callable = None,
+        checkpoint: BreakdownCheckpoint = None,
+    ) -> list:
+        """
+        Request the breakdown of every parent of a level concurrently and add the results to the level, in the order of the parents.
+        Returns the list of the breakdowns that failed.
+        The first level is not isolated: its error is raised.
+        Arguments:
+            request : REQUIRED : request of the level, without the breakdown filters
+            levelResults : REQUIRED : BreakdownLevel instance accumulating the results of the level
+            parents : REQUIRED : list of the parents, tuples of the breakdowns (dimension, itemId, value)
+            n_results : REQUIRED : number of results to return per breakdown
+            limit : REQUIRED : number of results per page
+            max_workers : OPTIONAL : number of requests running at the same time (default 4)
+            progress : OPTIONAL : function called after each request with a dictionary {"level","dimension","done","total","errors"}
+            checkpoint : OPTIONAL : BreakdownCheckpoint of the job, the breakdowns already saved are not requested again
+        """
+        level, dimension, metrics = levelResults.level, levelResults.dimension, levelResults.metrics
+        if level == 0:
+            result = self._getBreakdownReport(
+                request, metrics, parents[0], n_results, limit, checkpoint
+            )
+            levelResults.add(parents[0], result)
+            if progress is not None:
+                progress({"level": level, "dimension": dimension, "done": 1, "total": 1, "errors": 0})
+            return []
+        results = [None] * len(parents)
+        errors = []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(parents)))) as executor:
+            futures = {
+                executor.submit(
+                    self._getBreakdownReport,
+                    request,
+                    metrics,
+                    parent,
+                    n_results,
+                    limit,
+                    checkpoint,
+                ): index
+                for index, parent in enumerate(parents)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as error:
+                    breakdown = [f"{dim}:::{itemId}" for dim, itemId, _ in parents[index]]
+                    if self.loggingEnabled:
+                        self.logger.error(f"breakdown {breakdown} failed: {error}")
+                    errors.append(
+                        {"level": level, "dimension": dimension, "breakdown": breakdown, "error": str(error)}
+                    )
+                if progress is not None:
+                    progress(
+                        {"level": level, "dimension": dimension, "done": done, "total": len(parents), "errors": len(errors)}
+                    )
+        if self.loggingEnabled:
+            self.logger.debug(
+                f"level {level} ({dimension}): {len(parents)} requests, {len(errors)} errors"
+            )
+        for parent, result in zip(parents, results):
+            if result is not None:
+                levelResults.add(parent, result)
+        return errors
+
     def getMultidimensionalReport(
         self,
         dimensions: list = None,
@@ -2297,10 +3530,17 @@ class CJA:
         metricFilters: dict = None,
         countRepeatInstances: bool = True,
         returnNones: bool = True,
+        max_workers: int = 4,
+        progress: Callable = None,
+        levelsPath: str = None,
+        levelsFormat: str = "csv",
+        checkpointPath: str = None,
     ) -> pd.DataFrame:
         """
         Realize a multi-level breakdown report from the elements provided.
-        Returns either
+        Each level is requested once the previous one is complete: the breakdowns of all the items of the previous level are requested concurrently.
+        A breakdown request that fails does not stop the others, the failures are available in the errors attribute of the Workspace returned.
+        Returns a Workspace instance, the dataframe contains the value of each previous dimension, the itemId and the value of the last dimension and the metrics.
         Arguments:
             dimensions : REQUIRED : list of the dimension to breakdown. In the order of the breakdown.
             dimensionLimit : REQUIRED : the number of results to return for each breakdown.
@@ -2314,6 +3554,15 @@ class CJA:
                 dictionnary like this : {"metric1":"segId1","metric":"segId2"}
             countRepeatInstances : OPTIONAL : set to count repeatInstances values (or not). True by default.
             returnNones : OPTIONAL : Set the behavior of the None values in that request. (True by default)
+            max_workers : OPTIONAL : number of breakdown requests running at the same time (default 4)
+            progress : OPTIONAL : function called after each breakdown request with a dictionary:
+                {"level","dimension","done","total","errors"}
+            levelsPath : OPTIONAL : folder where the dataframe of each level is written once the level is complete (level_<index>_<dimension>.csv).
+                Only the last level is returned, the previous levels are not kept in memory.
+            levelsFormat : OPTIONAL : format of the levels files, "csv" (default) or "parquet" (requires pyarrow)
+            checkpointPath : OPTIONAL : folder where each breakdown is saved once returned.
+                Running the same report again with that folder resumes it: the breakdowns already saved are not requested again.
+                The folder is removed when the report completes without error.
         """
         if dimensions is None:
             raise ValueError("Require a list of dimensions")
@@ -2325,6 +3574,8 @@ class CJA:
             raise ValueError("Require a list of metrics")
         if dataViewId is None:
             raise ValueError("Require a Data View ID")
+        if levelsFormat not in ("csv", "parquet"):
+            raise ValueError("levelsFormat can only be 'csv' or 'parquet'")
         if self.loggingEnabled:
             self.logger.debug(f"Starting getMultidimensionalReport")
         template = RequestCreator()
@@ -2344,15 +3595,12 @@ class CJA:
             self.logger.debug(
                 f"first request: {json.dumps(template.to_dict(),indent=2)}"
             )
-        level = 0
-        list_breakdown = deepcopy(
-            dimensions[1:]
-        )  ## use to assign the correct variable to the itemsId retrieved
-        dict_breakdown_itemId = defaultdict(list)  ## for dimension - itemId
-        dict_breakdown_relation = defaultdict(list)  ## for itemId - Sub itemId
-        translate_itemId_value = {}  ## for translation between itemId and Value
-        for dimension in dimensions:
-            df_final = pd.DataFrame()
+        checkpoint = None
+        if checkpointPath is not None:
+            checkpoint = BreakdownCheckpoint(checkpointPath)
+        errors = []
+        parents = [()]  ## breakdowns of the previous level: ((dimension, itemId, value), ...)
+        for level, dimension in enumerate(dimensions):
             template.setDimension(dimension)
             if float(dimensionLimit[dimension]) > 20000:
                 template.setLimit("20000")
@@ -2360,91 +3608,33 @@ class CJA:
             else:
                 template.setLimit(dimensionLimit[dimension])
                 limit = dimensionLimit[dimension]
-            ### if we need to add filters
-            if dimension == dimensions[0]:
-                if self.loggingEnabled:
-                    self.logger.debug(f"Starting first iteration: {dimension}")
-                request = template.to_dict()
-                res = self.getReport(
-                    request=request,
-                    n_results=dimensionLimit[dimension],
-                    limit=limit,
+            if self.loggingEnabled:
+                self.logger.debug(
+                    f"Starting level {level}: {dimension}, {len(parents)} requests"
                 )
-                dataframe = res.dataframe
-                dict_breakdown_itemId[list_breakdown[level]] = list(dataframe["itemId"])
-                ### ex : {'dimension1' : [itemID1,itemID2,...]}
-                translate_itemId_value[dimension] = {
-                    itemId: value
-                    for itemId, value in zip(
-                        list(dataframe["itemId"]), list(dataframe.iloc[:, 1])
-                    )
-                }  ### {"dimension1":{'itemIdValue':'realValue'}}
-            else:  ### starting breakdowns
+            levelResults = BreakdownLevel(level, dimensions, metrics)
+            errors += self._getBreakdownLevel(
+                template.to_dict(),
+                levelResults,
+                parents,
+                dimensionLimit[dimension],
+                limit,
+                max_workers,
+                progress,
+                checkpoint,
+            )
+            ## the dataframe is built once per level
+            if levelsPath is not None:
+                df_level = levelResults.to_dataframe()
+                filename = levelResults.save(levelsPath, levelsFormat, df_level)
                 if self.loggingEnabled:
-                    self.logger.debug(f"Starting breakdowns")
-                for itemId in dict_breakdown_itemId[dimension]:
-                    ### for each item in the previous element
-                    if level > 1:
-                        ## adding previous breakdown value to the metric filter
-                        original_filterId = dict_breakdown_relation[itemId]
-                        for metric in metrics:
-                            template.addMetricFilter(
-                                metricId=metric, filterId=original_filterId
-                            )
-                    filterId = f"{dimensions[level - 1]}:::{itemId}"
-                    for metric in metrics:
-                        template.addMetricFilter(metricId=metric, filterId=filterId)
-                    request = template.to_dict()
-                    if self.loggingEnabled:
-                        self.logger.info(json.dumps(request, indent=4))
-                    res = self.getReport(
-                        request=request,
-                        n_results=dimensionLimit[dimension],
-                        limit=limit,
-                    )
-                    ## cleaning breakdown filters
-                    template.removeMetricFilter(filterId=filterId)
-                    if level > 1:
-                        original_filterId = dict_breakdown_relation[itemId]
-                        template.removeMetricFilter(filterId=original_filterId)
-                    if self.loggingEnabled:
-                        self.logger.debug(json.dumps(template.to_dict(), indent=4))
-                    dataframe = res.dataframe
-                    list_itemIds = list(dataframe["itemId"])
-                    dict_breakdown_itemId[dimension] = list_itemIds
-                    ### ex : {'dimension2' : [itemID1,itemID2,...]}
-                    dict_breakdown_relation = {
-                        itemId: filterId for itemId in list_itemIds
-                    }
-                    ## translating itemId to value
-                    ## {'dimension1':{'itemId':'value'}}
-                    translate_itemId_value[dimension] = {
-                        itemId: value
-                        for itemId, value in zip(
-                            list(dataframe["itemId"]), list(dataframe.iloc[:, 1])
-                        )
-                    }
-                    ## in case breakdown doesn't have values.
-                    if dataframe.empty == False:
-                        nb_metrics = len(metrics)
-                        metricsCols = list(dataframe.columns[-nb_metrics:])
-                        dictReplace = {
-                            oldColName: newColName
-                            for oldColName, newColName in zip(metricsCols, metrics)
-                        }
-                        dataframe.rename(columns=dictReplace, inplace=True)
-                        columns_order = deque(dataframe.columns)
-                        for lvl in range(level):
-                            dataframe[dimensions[lvl]] = translate_itemId_value[
-                                dimensions[lvl]
-                            ].get(itemId, itemId)
-                            columns_order.appendleft(dimensions[lvl])
-                        if df_final.empty:
-                            df_final = dataframe
-                        else:
-                            df_final = df_final.append(dataframe, ignore_index=True)
-                    df_final = df_final[columns_order]
-            level += 1
+                    self.logger.debug(f"level {level} saved in {filename}")
+            ## each item of that level is a breakdown of the next level
+            parents = levelResults.getChildren()
+        if levelsPath is not None:
+            df_final = df_level
+        else:
+            df_final = levelResults.to_dataframe()
         workspace = Workspace(
             df_final,
             dataRequest=template.to_dict(),
@@ -2453,4 +3643,7 @@ class CJA:
             reportType="multi",
             metricFilters="notApplicable",
         )
+        workspace.errors = errors
+        if checkpoint is not None and len(errors) == 0:
+            checkpoint.clear()
         return workspace
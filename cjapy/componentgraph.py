@@ -0,0 +1,147 @@
+from collections import deque
+
+# Non standard libraries
+import pandas as pd
+
+from .componentindex import ComponentUsageIndex
+
+
+class ComponentDependencyGraph:
+    """
+    Dependency graph of the components, built on a ComponentUsageIndex.
+    Each reference is an edge from the component to the element using it, ex: metric -> calculated metric -> filter -> project.
+    The graph answers transitive queries by traversing these edges:
+        getDependents : everything affected by a component (ex: before deleting a dimension)
+        getDependencies : everything a filter, calculated metric or project relies on
+    The graph reads the index directly, so the updates of the index are taken into account.
+    """
+
+    def __init__(self, index: ComponentUsageIndex = None) -> None:
+        """
+        Instantiate the graph.
+        Arguments:
+            index : REQUIRED : the ComponentUsageIndex of the filters, calculated metrics and projects
+        """
+        if index is None:
+            raise ValueError("Require a ComponentUsageIndex")
+        self.index = index
+
+    def getType(self, component: str = None) -> str:
+        """
+        Return the type of a component ID: "filters", "calculatedMetrics", "projects", "dimensions", "metrics", "dataViews" or "others".
+        Arguments:
+            component : REQUIRED : ID of the component
+        """
+        for usageType in self.index.USAGE_TYPES:
+            if component in self.index.usages[usageType]:
+                return usageType
+        if component.startswith("variables/"):
+            return "dimensions"
+        if component.startswith("metrics/"):
+            return "metrics"
+        if component.startswith("dv_"):
+            return "dataViews"
+        return "others"
+
+    def _getName(self, component: str) -> str:
+        for usageType in self.index.USAGE_TYPES:
+            usage = self.index.usages[usageType].get(component)
+            if usage is not None:
+                return usage["name"]
+        return None
+
+    def _traverse(self, component: str, neighbours, maxDepth: int = None) -> list:
+        """
+        Breadth first traversal from the component, returns the list of the elements reached with their depth and the element they were reached from.
+        """
+        visited = {component}
+        elements = []
+        queue = deque([(component, 0)])
+        while len(queue) > 0:
+            current, depth = queue.popleft()
+            if maxDepth is not None and depth >= maxDepth:
+                continue
+            for neighbour in neighbours(current):
+                if neighbour in visited:
+                    continue
+                visited.add(neighbour)
+                elements.append(
+                    {
+                        "id": neighbour,
+                        "name": self._getName(neighbour),
+                        "type": self.getType(neighbour),
+                        "depth": depth + 1,
+                        "via": current,
+                    }
+                )
+                queue.append((neighbour, depth + 1))
+        return elements
+
+    def _getDependents(self, component: str) -> list:
+        usage = self.index.getUsage(component)
+        return [
+            elementId
+            for usageType in self.index.USAGE_TYPES
+            for element in usage[usageType]
+            for elementId in element.values()
+        ]
+
+    def _getDependencies(self, component: str) -> list:
+        for usageType in self.index.USAGE_TYPES:
+            if component in self.index.usages[usageType]:
+                return self.index.getComponents(usageType, component)
+        return []
+
+    @staticmethod
+    def _format(elements: list, output: str):
+        if output == "df":
+            return pd.DataFrame(elements, columns=["id", "name", "type", "depth", "via"])
+        if output == "raw":
+            return elements
+        result = {}
+        for element in elements:
+            ## dimensions and metrics have no name in the index
+            name = element["name"] if element["name"] is not None else element["id"]
+            result.setdefault(element["type"], []).append({name: element["id"]})
+        return result
+
+    def getDependents(self, component: str = None, maxDepth: int = None, output: str = "dict"):
+        """
+        Return all the filters, calculated metrics and projects that use the component, directly or through other components.
+        Arguments:
+            component : REQUIRED : ID of the component (dimension, metric, filter, calculated metric, data view)
+            maxDepth : OPTIONAL : number of levels to traverse (default None, the full transitive closure). 1 returns the direct usage.
+            output : OPTIONAL : "dict" (default) {type:[{name:id}]}, "df" or "raw" (list of {"id","name","type","depth","via"})
+        """
+        if component is None:
+            raise ValueError("Require a component ID")
+        return self._format(self._traverse(component, self._getDependents, maxDepth), output)
+
+    def getDependencies(self, component: str = None, maxDepth: int = None, output: str = "dict"):
+        """
+        Return all the components a filter, calculated metric or project relies on, directly or through other components.
+        Arguments:
+            component : REQUIRED : ID of the filter, calculated metric or project
+            maxDepth : OPTIONAL : number of levels to traverse (default None, the full transitive closure). 1 returns the direct dependencies.
+            output : OPTIONAL : "dict" (default) {type:[{name:id}]}, "df" or "raw" (list of {"id","name","type","depth","via"})
+        """
+        if component is None:
+            raise ValueError("Require a component ID")
+        return self._format(self._traverse(component, self._getDependencies, maxDepth), output)
+
+    def getImpact(self, components: list = None) -> pd.DataFrame:
+        """
+        Return a dataframe of all the elements affected by the components, one row per component and element affected.
+        Arguments:
+            components : REQUIRED : list of component IDs (ex: the dimensions to delete)
+        """
+        if components is None or type(components) != list:
+            raise ValueError("components must be present as a list")
+        frames = []
+        for component in components:
+            df = self.getDependents(component, output="df")
+            df.insert(0, "component", component)
+            frames.append(df)
+        if len(frames) == 0:
+            return pd.DataFrame(columns=["component", "id", "name", "type", "depth", "via"])
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,279 @@
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Union
+
+# Non standard libraries
+import pandas as pd
+
+from .projects import Project
+
+
+class ComponentUsageIndex:
+    """
+    Inverted index of the components usage: for each component ID (dimension, metric, filter, calculated metric, data view),
+    the filters, calculated metrics and projects that reference it.
+    The index is built once from the filters and calculated metrics definitions and the elements used by the projects,
+    then each filter, calculated metric or project can be updated (or removed) on its own.
+    It can be saved in a local JSON file and loaded back.
+    """
+
+    USAGE_TYPES = ("filters", "calculatedMetrics", "projects")
+    ## the values of the definitions that are component IDs
+    COMPONENT_ID_PATTERN = re.compile(
+        r"(?:variables|metrics)/[^\s\"',}\]]+|(?:s|cm)\d+_[0-9a-zA-Z_]+|dv_[0-9a-zA-Z_]+"
+    )
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Instantiate the index, loading the JSON file if it exists.
+        Arguments:
+            path : OPTIONAL : path of the JSON file of the index, used by the save method.
+        """
+        self.path = Path(path) if path is not None else None
+        self._lock = threading.Lock()
+        ## usage type -> usage ID -> {"name","components"}
+        self.usages = {usageType: {} for usageType in self.USAGE_TYPES}
+        ## component ID -> usage type -> {usage ID: usage name}
+        self._index = {}
+        if self.path is not None and self.path.exists():
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            for usageType in self.USAGE_TYPES:
+                for usageId, usage in data.get(usageType, {}).items():
+                    self._setUsage(usageType, usageId, usage["name"], usage["components"])
+
+    @classmethod
+    def extractComponents(cls, definition: Union[dict, list, str] = None) -> list:
+        """
+        Return the list of the component IDs referenced in a filter or calculated metric definition.
+        Arguments:
+            definition : REQUIRED : the definition (dictionary or its JSON string)
+        """
+        if isinstance(definition, str):
+            try:
+                definition = json.loads(definition)
+            except ValueError:
+                return list(dict.fromkeys(cls.COMPONENT_ID_PATTERN.findall(definition)))
+        components = []
+        elements = [definition]
+        while len(elements) > 0:
+            element = elements.pop()
+            if isinstance(element, dict):
+                elements += reversed(list(element.values()))
+            elif isinstance(element, list):
+                elements += reversed(element)
+            elif isinstance(element, str) and cls.COMPONENT_ID_PATTERN.fullmatch(element):
+                components.append(element)
+        return list(dict.fromkeys(components))
+
+    @staticmethod
+    def extractProjectComponents(project: Union[Project, dict] = None) -> list:
+        """
+        Return the list of the component IDs used in a project.
+        The elements with a data view suffix (::dvId) are indexed with and without the suffix.
+        Arguments:
+            project : REQUIRED : instance of the Project class (or the dictionary returned by its to_dict method)
+        """
+        if isinstance(project, Project):
+            ## mobile and unknown type projects have no elementsUsed
+            elements = getattr(project, "elementsUsed", {})
+        else:
+            elements = project
+        components = []
+        for key in ("dimensions", "metrics", "filters", "calculatedMetrics", "dataViewIds"):
+            for element in elements.get(key) or []:
+                ## guided analysis can return None for a missing dimensionId
+                if isinstance(element, str) == False or element == "":
+                    continue
+                components.append(element)
+                if "::" in element:
+                    components.append(element.split("::")[0])
+        return list(dict.fromkeys(components))
+
+    def _setUsage(self, usageType: str, usageId: str, name: str, components: list) -> None:
+        self._removeUsage(usageType, usageId)
+        self.usages[usageType][usageId] = {"name": name, "components": list(components)}
+        for component in components:
+            usages = self._index.setdefault(
+                component, {element: {} for element in self.USAGE_TYPES}
+            )
+            usages[usageType][usageId] = name
+
+    def _removeUsage(self, usageType: str, usageId: str) -> bool:
+        usage = self.usages[usageType].pop(usageId, None)
+        if usage is None:
+            return False
+        for component in usage["components"]:
+            usages = self._index.get(component)
+            if usages is None:
+                continue
+            usages[usageType].pop(usageId, None)
+            if all(len(usages[element]) == 0 for element in self.USAGE_TYPES):
+                del self._index[component]
+        return True
+
+    def updateFilter(self, filterDict: dict = None) -> None:
+        """
+        Add or update a filter in the index.
+        Arguments:
+            filterDict : REQUIRED : the filter, with its id, name and definition (getFilter with full=True)
+        """
+        if filterDict is None or "definition" not in filterDict:
+            raise ValueError("Require a filter with its definition")
+        with self._lock:
+            self._setUsage(
+                "filters",
+                filterDict["id"],
+                filterDict.get("name"),
+                self.extractComponents(filterDict["definition"]),
+            )
+
+    def updateCalculatedMetric(self, calculatedMetricDict: dict = None) -> None:
+        """
+        Add or update a calculated metric in the index.
+        Arguments:
+            calculatedMetricDict : REQUIRED : the calculated metric, with its id, name and definition (getCalculatedMetric with full=True)
+        """
+        if calculatedMetricDict is None or "definition" not in calculatedMetricDict:
+            raise ValueError("Require a calculated metric with its definition")
+        with self._lock:
+            self._setUsage(
+                "calculatedMetrics",
+                calculatedMetricDict["id"],
+                calculatedMetricDict.get("name"),
+                self.extractComponents(calculatedMetricDict["definition"]),
+            )
+
+    def updateProject(self, project: Union[Project, dict] = None) -> None:
+        """
+        Add or update a project in the index.
+        Arguments:
+            project : REQUIRED : instance of the Project class (or the dictionary returned by its to_dict method)
+        """
+        if project is None:
+            raise ValueError("Require a project")
+        if isinstance(project, Project):
+            projectId, name = project.id, project.name
+        else:
+            projectId, name = project["id"], project.get("name")
+        with self._lock:
+            self._setUsage("projects", projectId, name, self.extractProjectComponents(project))
+
+    def removeFilter(self, filterId: str = None) -> bool:
+        """
+        Remove a filter from the index. Returns True if it was indexed.
+        Arguments:
+            filterId : REQUIRED : ID of the filter
+        """
+        with self._lock:
+            return self._removeUsage("filters", filterId)
+
+    def removeCalculatedMetric(self, calculatedMetricId: str = None) -> bool:
+        """
+        Remove a calculated metric from the index. Returns True if it was indexed.
+        Arguments:
+            calculatedMetricId : REQUIRED : ID of the calculated metric
+        """
+        with self._lock:
+            return self._removeUsage("calculatedMetrics", calculatedMetricId)
+
+    def removeProject(self, projectId: str = None) -> bool:
+        """
+        Remove a project from the index. Returns True if it was indexed.
+        Arguments:
+            projectId : REQUIRED : ID of the project
+        """
+        with self._lock:
+            return self._removeUsage("projects", projectId)
+
+    def build(
+        self,
+        filters: Union[list, pd.DataFrame] = None,
+        calculatedMetrics: Union[list, pd.DataFrame] = None,
+        projects: list = None,
+    ) -> None:
+        """
+        Rebuild the index from the filters, calculated metrics and projects passed.
+        Arguments:
+            filters : OPTIONAL : list or dataframe returned by getFilters with full=True
+            calculatedMetrics : OPTIONAL : list or dataframe returned by getCalculatedMetrics with full=True
+            projects : OPTIONAL : list of instances of the Project class (or dictionary of projectId and Project)
+        """
+        self.clear()
+        if isinstance(filters, pd.DataFrame):
+            filters = filters.to_dict(orient="records")
+        if isinstance(calculatedMetrics, pd.DataFrame):
+            calculatedMetrics = calculatedMetrics.to_dict(orient="records")
+        if isinstance(projects, dict):
+            projects = list(projects.values())
+        for filterDict in filters or []:
+            self.updateFilter(filterDict)
+        for calculatedMetricDict in calculatedMetrics or []:
+            self.updateCalculatedMetric(calculatedMetricDict)
+        for project in projects or []:
+            self.updateProject(project)
+
+    def getUsage(self, component: str = None) -> dict:
+        """
+        Return the filters, calculated metrics and projects using that component:
+        {"filters":[{name:id}],"calculatedMetrics":[{name:id}],"projects":[{name:id}]}
+        Arguments:
+            component : REQUIRED : ID of the component (exact match)
+        """
+        if component is None:
+            raise ValueError("Require a component ID")
+        usages = self._index.get(component, {})
+        return {
+            usageType: [{name: usageId} for usageId, name in usages.get(usageType, {}).items()]
+            for usageType in self.USAGE_TYPES
+        }
+
+    def getComponents(self, usageType: str = None, usageId: str = None) -> list:
+        """
+        Return the components referenced by a filter, calculated metric or project of the index.
+        Arguments:
+            usageType : REQUIRED : "filters", "calculatedMetrics" or "projects"
+            usageId : REQUIRED : ID of the filter, calculated metric or project
+        """
+        if usageType not in self.USAGE_TYPES:
+            raise ValueError(f"usageType can only be one of {self.USAGE_TYPES}")
+        usage = self.usages[usageType].get(usageId)
+        if usage is None:
+            return []
+        return list(usage["components"])
+
+    def __contains__(self, component: str) -> bool:
+        return component in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def clear(self) -> None:
+        """
+        Remove all the elements of the index.
+        """
+        with self._lock:
+            self.usages = {usageType: {} for usageType in self.USAGE_TYPES}
+            self._index = {}
+
+    def save(self, path: str = None) -> str:
+        """
+        Write the index in a JSON file (atomically) and return the name of the file.
+        Arguments:
+            path : OPTIONAL : path of the file, default to the path of the index.
+        """
+        if path is not None:
+            self.path = Path(path)
+        if self.path is None:
+            raise ValueError("Require a path to save the index")
+        if self.path.parent != Path(""):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmpPath = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with self._lock:
+            with open(tmpPath, "w") as f:
+                json.dump(self.usages, f)
+        os.replace(tmpPath, self.path)
+        return str(self.path)
@@ -0,0 +1,69 @@
+import re
+from collections import Counter
+
+
+class ComponentMatcher:
+    """
+    Precompiled matcher of a list of components, used by findComponentsUsage.
+    The components are searched as regular expressions (same result as re.search for each component),
+    but all of them are combined in a single pattern, so a definition is scanned once for all the components.
+    """
+
+    def __init__(self, components: list = None) -> None:
+        """
+        Compile the matcher.
+        Arguments:
+            components : REQUIRED : list of the components (IDs or regular expressions) to look for
+        """
+        if components is None:
+            raise ValueError("Require a list of components")
+        self.components = list(dict.fromkeys(str(comp) for comp in components))
+        self._patterns = [re.compile(comp) for comp in self.components]
+        self._finder = None
+        self._lookahead = None
+        ## components with their own groups (backreferences) cannot be combined, they are searched one by one.
+        if len(self.components) > 0 and all(pattern.groups == 0 for pattern in self._patterns):
+            try:
+                self._finder = re.compile("|".join(f"(?:{comp})" for comp in self.components))
+                self._lookahead = re.compile(
+                    "".join(f"(?:(?=(?P<c{index}>{comp})))?" for index, comp in enumerate(self.components))
+                )
+            except re.error:
+                self._finder = None
+                self._lookahead = None
+
+    def findAll(self, text: str = None) -> set:
+        """
+        Return the set of components found in the text.
+        Arguments:
+            text : REQUIRED : the text to scan (definition of a component, element of a project)
+        """
+        if self._finder is None:
+            return {
+                comp
+                for comp, pattern in zip(self.components, self._patterns)
+                if pattern.search(text)
+            }
+        found = set()
+        match = self._finder.search(text)
+        while match is not None:
+            ## all the components matching at that position
+            groups = self._lookahead.match(text, match.start()).groupdict()
+            for name, value in groups.items():
+                if value is not None:
+                    found.add(self.components[int(name[1:])])
+            if len(found) == len(self.components) or match.start() >= len(text):
+                break
+            match = self._finder.search(text, match.start() + 1)
+        return found
+
+    def countAll(self, elements: list = None) -> Counter:
+        """
+        Return the number of elements of the list in which each component is found.
+        Arguments:
+            elements : REQUIRED : list of texts (ex: dimensions of a project)
+        """
+        counts = Counter()
+        for element in elements:
+            counts.update(self.findAll(element))
+        return counts
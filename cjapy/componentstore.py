@@ -0,0 +1,389 @@
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Non standard libraries
+import pandas as pd
+
+
+class ComponentStore:
+    """
+    Local SQLite store of the CJA components (filters, calculated metrics, data views, dimensions and metrics).
+    The store is synchronized incrementally with the sync method: only the components whose "modified" date changed
+    since the last synchronization are downloaded again.
+    Attach it to a CJA instance (componentStore parameter) to serve getFilter, getCalculatedMetric, getDimension
+    and getMetric from the store while it is fresh enough.
+    """
+
+    COMPONENT_TYPES = ("filter", "calculatedMetric", "dataView", "dimension", "metric")
+
+    def __init__(self, path: str = "cja_components.sqlite") -> None:
+        """
+        Open (or create) the store.
+        Arguments:
+            path : OPTIONAL : path of the SQLite database (default "cja_components.sqlite")
+        """
+        self.path = Path(path)
+        if self.path.parent != Path("."):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS components (
+                    type TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    name TEXT,
+                    modified TEXT,
+                    definition TEXT NOT NULL,
+                    full INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (type, scope, id)
+                )"""
+            )
+            ## stores created before the full column: their records are considered as summaries
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(components)")]
+            if "full" not in columns:
+                self._connection.execute(
+                    "ALTER TABLE components ADD COLUMN full INTEGER NOT NULL DEFAULT 0"
+                )
+            self._connection.execute(
+                """CREATE TABLE IF NOT EXISTS syncs (
+                    type TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    syncedAt REAL NOT NULL,
+                    PRIMARY KEY (type, scope)
+                )"""
+            )
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def getSyncDate(self, componentType: str = None, dataviewId: str = None) -> float:
+        """
+        Return the timestamp of the last synchronization of that component type, or None if never synchronized.
+        Arguments:
+            componentType : REQUIRED : one of "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            dataviewId : OPTIONAL : data view ID, for dimensions and metrics
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT syncedAt FROM syncs WHERE type = ? AND scope = ?",
+                (componentType, dataviewId or ""),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def getComponent(
+        self,
+        componentType: str = None,
+        componentId: str = None,
+        dataviewId: str = None,
+        maxAge: float = None,
+        full: bool = False,
+    ) -> dict:
+        """
+        Return the definition of a component, or None if it is not in the store
+        or if the last synchronization is older than maxAge seconds.
+        Arguments:
+            componentType : REQUIRED : one of "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            componentId : REQUIRED : ID of the component
+            dataviewId : OPTIONAL : data view ID, for dimensions and metrics
+            maxAge : OPTIONAL : maximum age in seconds of the last synchronization
+            full : OPTIONAL : only return the component if it was stored with all its details (default False)
+        """
+        if maxAge is not None:
+            syncedAt = self.getSyncDate(componentType, dataviewId)
+            if syncedAt is None or time.time() - syncedAt > maxAge:
+                return None
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT definition FROM components WHERE type = ? AND scope = ? AND id = ? AND full >= ?",
+                (componentType, dataviewId or "", componentId, int(bool(full))),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def getComponents(
+        self, componentType: str = None, dataviewId: str = None, output: str = "df"
+    ) -> list:
+        """
+        Return all the components of that type stored.
+        Arguments:
+            componentType : REQUIRED : one of "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            dataviewId : OPTIONAL : data view ID, for dimensions and metrics
+            output : OPTIONAL : "df" (default) or "raw" for a list of dictionaries
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT definition FROM components WHERE type = ? AND scope = ? ORDER BY rowid",
+                (componentType, dataviewId or ""),
+            ).fetchall()
+        data = [json.loads(row[0]) for row in rows]
+        if output == "df":
+            return pd.DataFrame(data)
+        return data
+
+    def removeComponents(
+        self, componentType: str = None, componentId: str = None, dataviewId: str = None
+    ) -> None:
+        """
+        Remove a component from the store, or all the components of that type for the data view when no ID is passed.
+        The component is requested to the API until the next synchronization.
+        Arguments:
+            componentType : REQUIRED : one of "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            componentId : OPTIONAL : ID of the component
+            dataviewId : OPTIONAL : data view ID, for dimensions and metrics
+        """
+        with self._lock, self._connection:
+            if componentId is None:
+                self._connection.execute(
+                    "DELETE FROM components WHERE type = ? AND scope = ?",
+                    (componentType, dataviewId or ""),
+                )
+            else:
+                self._connection.execute(
+                    "DELETE FROM components WHERE type = ? AND scope = ? AND id = ?",
+                    (componentType, dataviewId or "", componentId),
+                )
+
+    def _getModifiedDates(self, componentType: str, scope: str = "") -> dict:
+        """
+        Return a dictionary of the components ID and modified date stored.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, modified FROM components WHERE type = ? AND scope = ?",
+                (componentType, scope),
+            ).fetchall()
+        return {componentId: modified for componentId, modified in rows}
+
+    def _save(
+        self,
+        componentType: str,
+        elements: list,
+        scope: str = "",
+        removedIds: list = None,
+        replace: bool = False,
+        full: bool = True,
+    ) -> None:
+        """
+        Save the components, remove the deleted ones and set the synchronization date, in one transaction.
+        Arguments:
+            componentType : REQUIRED : type of components
+            elements : REQUIRED : list of components definition
+            scope : OPTIONAL : data view ID for dimensions and metrics
+            removedIds : OPTIONAL : IDs of the components to remove
+            replace : OPTIONAL : remove all the components of that type and scope before saving
+            full : OPTIONAL : the components definitions contain all the details (default True, the sync requests full=True)
+        """
+        with self._lock, self._connection:
+            if replace:
+                self._connection.execute(
+                    "DELETE FROM components WHERE type = ? AND scope = ?",
+                    (componentType, scope),
+                )
+            if removedIds:
+                self._connection.executemany(
+                    "DELETE FROM components WHERE type = ? AND scope = ? AND id = ?",
+                    [(componentType, scope, componentId) for componentId in removedIds],
+                )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO components (type, scope, id, name, modified, definition, full) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        componentType,
+                        scope,
+                        element["id"],
+                        element.get("name"),
+                        element.get("modified"),
+                        json.dumps(element),
+                        int(bool(full)),
+                    )
+                    for element in elements
+                    if isinstance(element, dict) and "id" in element
+                ],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO syncs (type, scope, syncedAt) VALUES (?, ?, ?)",
+                (componentType, scope, time.time()),
+            )
+
+    def _removeScope(self, scope: str) -> None:
+        """
+        Remove the dimensions and metrics of a data view that does not exist anymore.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM components WHERE scope = ?", (scope,))
+            self._connection.execute("DELETE FROM syncs WHERE scope = ?", (scope,))
+
+    @staticmethod
+    def _modifiedSince(modified: str = None, syncedAt: float = None) -> bool:
+        """
+        Return True if the modified date is after the synchronization date, or if one of them is unknown.
+        """
+        if modified is None or syncedAt is None:
+            return True
+        try:
+            return pd.Timestamp(modified).timestamp() >= syncedAt
+        except (TypeError, ValueError):
+            return True
+
+    def _syncIncremental(
+        self,
+        cja: object,
+        componentType: str,
+        listComponents: callable,
+        getComponents: callable,
+        chunkSize: int = 100,
+        max_workers: int = 4,
+    ) -> dict:
+        """
+        Compare the modified dates returned by a light listing with the stored ones
+        and download only the new or modified components, in bulk (filterByIds).
+        """
+        stored = self._getModifiedDates(componentType)
+        current = {
+            element["id"]: element.get("modified")
+            for element in listComponents()
+            if isinstance(element, dict) and "id" in element
+        }
+        changedIds = [
+            componentId
+            for componentId, modified in current.items()
+            if componentId not in stored or modified is None or stored[componentId] != modified
+        ]
+        removedIds = [componentId for componentId in stored if componentId not in current]
+        chunks = [changedIds[i : i + chunkSize] for i in range(0, len(changedIds), chunkSize)]
+        elements = []
+        if len(chunks) > 0:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+                for data in executor.map(lambda ids: getComponents(",".join(ids)), chunks):
+                    elements += data
+        self._save(componentType, elements, removedIds=removedIds)
+        if cja.loggingEnabled:
+            cja.logger.debug(
+                f"{componentType} store sync: {len(changedIds)} changed, {len(removedIds)} removed"
+            )
+        return {
+            "added": len([componentId for componentId in changedIds if componentId not in stored]),
+            "updated": len([componentId for componentId in changedIds if componentId in stored]),
+            "deleted": len(removedIds),
+        }
+
+    def sync(
+        self,
+        cja: object = None,
+        componentTypes: list = None,
+        chunkSize: int = 100,
+        max_workers: int = 4,
+    ) -> dict:
+        """
+        Synchronize the store with the CJA API and return the number of components added, updated and deleted per type.
+        Only the components whose modified date changed since the last synchronization are downloaded.
+        The dimensions and metrics are downloaded again only for the data views modified.
+        Arguments:
+            cja : REQUIRED : CJA instance used to request the API
+            componentTypes : OPTIONAL : list of the component types to synchronize (default all)
+                possible values: "filter", "calculatedMetric", "dataView", "dimension", "metric"
+            chunkSize : OPTIONAL : maximum number of components requested per bulk request (default 100)
+            max_workers : OPTIONAL : number of requests sent at the same time (default 4)
+        """
+        if cja is None:
+            raise ValueError("Require a CJA instance")
+        if componentTypes is None:
+            componentTypes = self.COMPONENT_TYPES
+        for componentType in componentTypes:
+            if componentType not in self.COMPONENT_TYPES:
+                raise ValueError(f"componentTypes possible values are {self.COMPONENT_TYPES}")
+        summary = {}
+        if "filter" in componentTypes:
+            summary["filter"] = self._syncIncremental(
+                cja,
+                "filter",
+                lambda: cja._getAllPages(
+                    "/filters",
+                    {"limit": 1000, "includeType": "all", "expansion": "modified", "page": 0},
+                    max_workers=max_workers,
+                ),
+                lambda ids: cja.getFilters(full=True, filterByIds=ids, output="raw", cache=False),
+                chunkSize=chunkSize,
+                max_workers=max_workers,
+            )
+        if "calculatedMetric" in componentTypes:
+            summary["calculatedMetric"] = self._syncIncremental(
+                cja,
+                "calculatedMetric",
+                lambda: cja._getAllPages(
+                    "/calculatedmetrics",
+                    {"limit": 1000, "includeType": "all", "expansion": "modified", "page": 0},
+                    max_workers=max_workers,
+                ),
+                lambda ids: cja.getCalculatedMetrics(
+                    full=True, filterByIds=ids, output="raw", cache=False
+                ),
+                chunkSize=chunkSize,
+                max_workers=max_workers,
+            )
+        if set(componentTypes) & {"dataView", "dimension", "metric"}:
+            ## the data views are few, they are always listed with all details
+            storedDataViews = self._getModifiedDates("dataView")
+            dataViews = cja.getDataViews(full=True, output="raw", max_workers=max_workers)
+            currentDataViews = {
+                dataView["id"]: dataView.get("modified")
+                for dataView in dataViews
+                if isinstance(dataView, dict) and "id" in dataView
+            }
+            removedDataViews = [dvId for dvId in storedDataViews if dvId not in currentDataViews]
+            changedDataViews = [
+                dvId
+                for dvId, modified in currentDataViews.items()
+                if dvId not in storedDataViews or modified is None or storedDataViews[dvId] != modified
+            ]
+            if "dataView" in componentTypes:
+                self._save("dataView", dataViews, replace=True)
+                summary["dataView"] = {
+                    "added": len([dvId for dvId in changedDataViews if dvId not in storedDataViews]),
+                    "updated": len([dvId for dvId in changedDataViews if dvId in storedDataViews]),
+                    "deleted": len(removedDataViews),
+                }
+            for dvId in removedDataViews:
+                self._removeScope(dvId)
+            for componentType, method in (("dimension", cja.getDimensions), ("metric", cja.getMetrics)):
+                if componentType not in componentTypes:
+                    continue
+                ## downloading the data views modified since the last synchronization of that type
+                dataViewIds = [
+                    dvId
+                    for dvId, modified in currentDataViews.items()
+                    if self._modifiedSince(modified, self.getSyncDate(componentType, dvId))
+                ]
+
+                def syncDataView(dvId: str) -> int:
+                    elements = method(dvId, full=True, output="raw")
+                    self._save(componentType, elements, scope=dvId, replace=True)
+                    return len(elements)
+
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(dataViewIds) or 1))) as executor:
+                    counts = list(executor.map(syncDataView, dataViewIds))
+                ## the data views not modified are marked as synchronized
+                for dvId in currentDataViews:
+                    if dvId not in dataViewIds:
+                        self._save(componentType, [], scope=dvId)
+                summary[componentType] = {"dataViews": len(dataViewIds), "components": sum(counts)}
+        return summary
@@ -1,18 +1,281 @@
+import asyncio
 import json
+import random
+import threading
 import time
+import warnings
+import weakref
 from copy import deepcopy
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
 # Non standard libraries
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
 from cjapy import config, token_provider
+from cjapy.tokencache import TokenCache
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter pacing the requests sent to the API.
+    A single instance can be shared between threads and between CJA instances, so they all respect the same quota.
+    By default, all the requests draw from a single "default" bucket of "requests" tokens, refilled over "period" seconds.
+    Limits per endpoint family (path prefix) are opt-in: requests to paths that do not match any family use the "default" family, if it is defined.
+    """
+
+    ## 12 requests per 6 seconds (120 requests per minute) is the documented CJA API throttle, for the whole organization.
+    DEFAULT_LIMITS = {
+        "default": {"requests": 12, "period": 6},
+    }
+    ## opt-in buckets per endpoint family, each family has its own quota.
+    FAMILY_LIMITS = {
+        "/reports": {"requests": 12, "period": 6},
+        "/filters": {"requests": 12, "period": 6},
+        "/projects": {"requests": 12, "period": 6},
+        "/auditlogs": {"requests": 12, "period": 6},
+        "default": {"requests": 12, "period": 6},
+    }
+    _shared = None
+    _sharedLock = threading.Lock()
+
+    def __init__(self, limits: dict = None, safetyMargin: float = 0.9) -> None:
+        """
+        Instantiate the rate limiter.
+        Arguments:
+            limits : OPTIONAL : dictionary of endpoint family (path prefix) and their limit.
+                Default to DEFAULT_LIMITS, a single bucket shared by all the endpoints. FAMILY_LIMITS defines a bucket per endpoint family.
+                example : {"/reports": {"requests": 12, "period": 6}, "default": {"requests": 20, "period": 6}}
+            safetyMargin : OPTIONAL : ratio of the quota actually used, to stay just under it (default 0.9)
+        """
+        if limits is None:
+            limits = self.DEFAULT_LIMITS
+        self.limits = deepcopy(limits)
+        self.safetyMargin = safetyMargin
+        self._buckets = {}
+        for family, limit in self.limits.items():
+            capacity = max(1.0, limit["requests"] * safetyMargin)
+            self._buckets[family] = {
+                "capacity": capacity,
+                "rate": capacity / limit["period"],
+                "tokens": capacity,
+                "timestamp": time.monotonic(),
+                "lock": threading.Lock(),
+            }
+
+    @classmethod
+    def shared(cls, limits: dict = None, safetyMargin: float = 0.9) -> "RateLimiter":
+        """
+        Return the rate limiter shared by the whole process, creating it on the first call.
+        Arguments:
+            limits : OPTIONAL : limits used when the shared instance is created.
+            safetyMargin : OPTIONAL : safety margin used when the shared instance is created.
+        """
+        with cls._sharedLock:
+            if cls._shared is None:
+                cls._shared = cls(limits=limits, safetyMargin=safetyMargin)
+            return cls._shared
+
+    def getFamily(self, endpoint: str = None) -> str:
+        """
+        Return the endpoint family used for the URL or path passed, None if no limit applies.
+        Arguments:
+            endpoint : REQUIRED : URL or path of the request.
+        """
+        path = urlparse(endpoint).path or endpoint
+        matches = [
+            family
+            for family in self._buckets
+            if family != "default" and path.startswith(family)
+        ]
+        if len(matches) > 0:
+            return max(matches, key=len)
+        if "default" in self._buckets:
+            return "default"
+        return None
+
+    def reserve(self, endpoint: str = None) -> float:
+        """
+        Take a token for the endpoint and return the time (in seconds) to wait before sending the request.
+        Arguments:
+            endpoint : REQUIRED : URL or path of the request.
+        """
+        family = self.getFamily(endpoint)
+        if family is None:
+            return 0
+        bucket = self._buckets[family]
+        with bucket["lock"]:
+            now = time.monotonic()
+            bucket["tokens"] = min(
+                bucket["capacity"],
+                bucket["tokens"] + (now - bucket["timestamp"]) * bucket["rate"],
+            )
+            bucket["timestamp"] = now
+            bucket["tokens"] -= 1
+            if bucket["tokens"] >= 0:
+                return 0
+            return -bucket["tokens"] / bucket["rate"]
+
+    def acquire(self, endpoint: str = None) -> float:
+        """
+        Wait until a request can be sent to the endpoint. Returns the time waited.
+        Arguments:
+            endpoint : REQUIRED : URL or path of the request.
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RetryPolicy:
+    """
+    Retry policy used by every request sent by the connectors.
+    Retries the throttled (429), unavailable (502, 503, 504) responses and the connection errors,
+    with an exponential backoff and full jitter, or the time given by the Retry-After header when the API provides it.
+    The requests that are not idempotent (POST, PATCH: ex createFilter) are only retried when throttled (429), as they are rejected before being processed.
+    The report requests (POST on /reports) only read data: they are retried, except on 504 (the report timed out, it fails fast).
+    """
+
+    NON_IDEMPOTENT_METHODS = ("POST", "PATCH")
+
+    def __init__(
+        self,
+        maxRetries: int = 8,
+        backoffFactor: float = 1,
+        maxBackoff: float = 60,
+        maxElapsed: float = 120,
+        statusCodes: tuple = (429, 502, 503, 504),
+        retryConnectionErrors: bool = True,
+        retryNonIdempotent: bool = False,
+        reportStatusCodes: tuple = (429, 502, 503),
+    ) -> None:
+        """
+        Instantiate the retry policy.
+        Arguments:
+            maxRetries : OPTIONAL : maximum number of retries for a request (default 8)
+            backoffFactor : OPTIONAL : base of the exponential backoff in seconds (default 1)
+                the wait time is a random value between 0 and backoffFactor * 2 ** attempt.
+            maxBackoff : OPTIONAL : maximum backoff in seconds between 2 retries (default 60)
+            maxElapsed : OPTIONAL : maximum time in seconds spent retrying a request (default 120)
+            statusCodes : OPTIONAL : status codes that are retried (default 429, 502, 503, 504)
+            retryConnectionErrors : OPTIONAL : retry when the connection is reset or cannot be established (default True)
+            retryNonIdempotent : OPTIONAL : also retry the POST and PATCH requests on statusCodes and connection errors (default False).
+                A retry can create the same component twice if the first request was processed.
+            reportStatusCodes : OPTIONAL : status codes that are retried for the report requests (default 429, 502, 503)
+        """
+        self.maxRetries = maxRetries
+        self.backoffFactor = backoffFactor
+        self.maxBackoff = maxBackoff
+        self.maxElapsed = maxElapsed
+        self.statusCodes = tuple(statusCodes)
+        self.retryConnectionErrors = retryConnectionErrors
+        self.retryNonIdempotent = retryNonIdempotent
+        self.reportStatusCodes = tuple(reportStatusCodes)
+
+    @staticmethod
+    def isReportRequest(method: str = "GET", endpoint: str = None) -> bool:
+        """
+        Return True if the request is a report request (POST on the /reports endpoint).
+        Arguments:
+            method : OPTIONAL : HTTP method
+            endpoint : OPTIONAL : URL of the request
+        """
+        if endpoint is None or str(method).upper() != "POST":
+            return False
+        return urlparse(str(endpoint)).path.rstrip("/").endswith("/reports")
+
+    def isIdempotent(self, method: str = "GET", endpoint: str = None) -> bool:
+        """
+        Return True if the request can be sent again without side effect.
+        Arguments:
+            method : OPTIONAL : HTTP method
+            endpoint : OPTIONAL : URL of the request
+        """
+        if str(method).upper() not in self.NON_IDEMPOTENT_METHODS:
+            return True
+        return self.isReportRequest(method, endpoint)
+
+    def isRetryable(
+        self,
+        statusCode: int = None,
+        errorCode: str = None,
+        method: str = "GET",
+        endpoint: str = None,
+    ) -> bool:
+        """
+        Return True if the response should be retried.
+        Arguments:
+            statusCode : OPTIONAL : status code of the response
+            errorCode : OPTIONAL : error_code returned in the response body ("429050" is a throttle error)
+            method : OPTIONAL : HTTP method of the request (default "GET")
+            endpoint : OPTIONAL : URL of the request
+        """
+        throttled = (statusCode == 429 and 429 in self.statusCodes) or str(errorCode) == "429050"
+        if throttled:
+            return True
+        if self.isReportRequest(method, endpoint):
+            return statusCode in self.reportStatusCodes
+        if self.isIdempotent(method, endpoint) == False and self.retryNonIdempotent == False:
+            return False
+        return statusCode in self.statusCodes
+
+    def canRetryConnectionError(self, method: str = "GET", endpoint: str = None) -> bool:
+        """
+        Return True if a connection error can be retried for that request.
+        Arguments:
+            method : OPTIONAL : HTTP method of the request (default "GET")
+            endpoint : OPTIONAL : URL of the request
+        """
+        if self.retryConnectionErrors == False:
+            return False
+        return self.retryNonIdempotent or self.isIdempotent(method, endpoint)
+
+    def canRetry(self, attempt: int = 0, elapsed: float = 0, wait: float = 0) -> bool:
+        """
+        Return True if another retry is allowed.
+        Arguments:
+            attempt : REQUIRED : number of retries already done
+            elapsed : REQUIRED : seconds spent since the first try
+            wait : OPTIONAL : seconds to wait before the next try
+        """
+        return attempt < self.maxRetries and elapsed + wait <= self.maxElapsed
+
+    def getWaitTime(self, attempt: int = 0, headers: dict = None) -> float:
+        """
+        Return the time to wait before the next try: the Retry-After header if provided, otherwise a full jitter backoff.
+        Arguments:
+            attempt : REQUIRED : number of retries already done
+            headers : OPTIONAL : headers of the response
+        """
+        retryAfter = None
+        if headers is not None:
+            retryAfter = headers.get("Retry-After")
+        if retryAfter is not None:
+            try:
+                return max(0, float(retryAfter))
+            except ValueError:
+                try:
+                    return max(0, parsedate_to_datetime(retryAfter).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return random.uniform(0, min(self.maxBackoff, self.backoffFactor * 2 ** attempt))
 
 
 class AdobeRequest:
     """
     Handle request to Audience Manager and taking care that the request have a valid token set each time.
+    The requests are sent through a pooled session, so the connections to the API are kept alive and reused.
     Attributes:
-        restTime : Time to rest before sending new request when reaching too many request status code.
+        retryPolicy : RetryPolicy applied to every request (throttling, unavailable API, connection errors).
+        session : the requests.Session holding the connection pool.
+        restTime : DEPRECATED : alias of retryPolicy.maxBackoff, the maximum time to wait between 2 tries.
     """
 
     loggingEnabled = False
@@ -25,6 +288,15 @@ class AdobeRequest:
         retry: int = 0,
         loggingEnabled: bool = False,
         logger: object = None,
+        poolSize: int = 10,
+        poolConnections: int = 10,
+        poolBlock: bool = False,
+        keepAlive: bool = True,
+        rateLimiter: RateLimiter = None,
+        retryPolicy: RetryPolicy = None,
+        backgroundRefresh: bool = False,
+        refreshMargin: float = 300,
+        tokenCache: TokenCache = None,
     ) -> None:
         """
         Set the connector to be used for handling request to AAM
@@ -32,9 +304,21 @@ class AdobeRequest:
             config_object : OPTIONAL : Require the importConfig file to have been used.
             header : OPTIONAL : header of the config modules
             verbose : OPTIONAL : display comment on the request.
-            retry : OPTIONAL : If you wish to retry failed GET requests
+            retry : OPTIONAL : If you wish to retry GET requests that did not return a JSON response
             loggingEnabled : OPTIONAL : if the logging is enable for that instance.
             logger : OPTIONAL : instance of the logger created
+            poolSize : OPTIONAL : maximum number of connections kept open per host (default 10)
+            poolConnections : OPTIONAL : number of different hosts to keep a connection pool for (default 10)
+            poolBlock : OPTIONAL : if set to True, a request waits for a free connection instead of opening
+                a new one when poolSize is reached, enforcing a hard limit per host. (default False)
+            keepAlive : OPTIONAL : keep the connections open between requests (default True)
+            rateLimiter : OPTIONAL : RateLimiter instance pacing the requests. Can be shared between instances.
+            retryPolicy : OPTIONAL : RetryPolicy instance used by all requests. A default RetryPolicy is used if not provided.
+            backgroundRefresh : OPTIONAL : start a daemon thread renewing the token before it expires,
+                so the requests never wait for a token refresh. (default False)
+            refreshMargin : OPTIONAL : number of seconds before the expiration when the background refresh happens (default 300)
+            tokenCache : OPTIONAL : TokenCache instance, to reuse the token retrieved by other processes.
+                Pass True to use the default cache file.
         """
         if config_object["org_id"] == "":
             raise Exception(
@@ -44,56 +328,263 @@ class AdobeRequest:
         self.header = deepcopy(header)
         self.loggingEnabled = loggingEnabled
         self.logger = logger
-        self.restTime = 30
         self.retry = retry
+        self.rateLimiter = rateLimiter
+        if tokenCache == True:
+            tokenCache = TokenCache()
+        self.tokenCache = tokenCache or None
+        if retryPolicy is None:
+            retryPolicy = RetryPolicy()
+        self.retryPolicy = retryPolicy
+        self.session = self._createSession(
+            poolSize=poolSize,
+            poolConnections=poolConnections,
+            poolBlock=poolBlock,
+            keepAlive=keepAlive,
+        )
+        self._tokenLock = threading.Lock()
+        self._stopRefresh = threading.Event()
+        self._refreshThread = None
+        self._finalizer = weakref.finalize(
+            self, AdobeRequest._closeResources, self.session, self._stopRefresh
+        )
+        if self.config["private_key"] is not None or self.config["pathToKey"] is not None:
+            self.connectionType = 'jwt'
+        elif self.config["scopes"] is not None:
+            self.connectionType = 'oauthV2'
         if self.config["token"] == "" or time.time() > self.config["date_limit"]:
-            if self.config["private_key"] is not None or self.config["pathToKey"] is not None:
-                self.connectionType = 'jwt'
-                token_and_expiry = token_provider.get_jwt_token_and_expiry_for_config(
-                    config=self.config, verbose=verbose
-                )
-                
-            elif self.config["scopes"] is not None:
-                self.connectionType = 'oauthV2'
-                token_and_expiry = token_provider.get_oauth_token_and_expiry_for_config(
-                    config=self.config,
-                    verbose=verbose
+            self._refreshToken(verbose=verbose)
+        else:
+            self.token = self.config["token"]
+            self.header.update({"Authorization": f"Bearer {self.token}"})
+        if backgroundRefresh:
+            self.startBackgroundRefresh(refreshMargin=refreshMargin)
+
+    @staticmethod
+    def _closeResources(session: requests.Session, stopRefresh: threading.Event) -> None:
+        """
+        Stop the background refresh and close the session. Called once, by close or when the instance is garbage collected.
+        """
+        stopRefresh.set()
+        session.close()
+
+    @property
+    def restTime(self) -> float:
+        """
+        DEPRECATED : the fixed pause on throttling is replaced by the RetryPolicy.
+        Returns the maximum time in seconds to wait between 2 tries (retryPolicy.maxBackoff).
+        """
+        warnings.warn(
+            "AdobeRequest.restTime is deprecated, use retryPolicy.maxBackoff",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.retryPolicy.maxBackoff
+
+    @restTime.setter
+    def restTime(self, value: float) -> None:
+        warnings.warn(
+            "AdobeRequest.restTime is deprecated, use retryPolicy.maxBackoff",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self.retryPolicy.maxBackoff = value
+
+    def _createSession(
+        self,
+        poolSize: int = 10,
+        poolConnections: int = 10,
+        poolBlock: bool = False,
+        keepAlive: bool = True,
+    ) -> requests.Session:
+        """
+        Create the session that holds the connection pool used by all the requests.
+        Arguments:
+            poolSize : OPTIONAL : maximum number of connections kept open per host
+            poolConnections : OPTIONAL : number of hosts to keep a connection pool for
+            poolBlock : OPTIONAL : wait for a free connection when the pool is full
+            keepAlive : OPTIONAL : keep the connections open between requests
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=poolConnections,
+            pool_maxsize=poolSize,
+            pool_block=poolBlock,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if keepAlive == False:
+            session.headers.update({"Connection": "close"})
+        return session
+
+    def _sendRequest(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send the request through the session, after waiting for the rate limiter if one is set.
+        The request is retried following the retry policy.
+        Arguments:
+            method : REQUIRED : HTTP method
+            endpoint : REQUIRED : URL of the request
+        possible kwargs:
+            any argument accepted by requests.Session.request
+        """
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            if self.rateLimiter is not None:
+                waited = self.rateLimiter.acquire(endpoint)
+                if waited > 0 and self.loggingEnabled:
+                    self.logger.debug(f"rate limiter waited {round(waited,2)} seconds")
+            try:
+                res = self.session.request(method, endpoint, **kwargs)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as error:
+                wait = self.retryPolicy.getWaitTime(attempt)
+                if not self.retryPolicy.canRetryConnectionError(
+                    method, endpoint
+                ) or not self.retryPolicy.canRetry(attempt, time.monotonic() - start, wait):
+                    raise
+                if self.loggingEnabled:
+                    self.logger.warning(
+                        f"{method} connection error: {error}. Retrying in {round(wait,2)} seconds"
+                    )
+            else:
+                errorCode = None
+                if res.status_code >= 400:
+                    try:
+                        errorCode = res.json().get("error_code")
+                    except (ValueError, AttributeError):
+                        pass
+                if not self.retryPolicy.isRetryable(res.status_code, errorCode, method, endpoint):
+                    return res
+                wait = self.retryPolicy.getWaitTime(attempt, res.headers)
+                if not self.retryPolicy.canRetry(attempt, time.monotonic() - start, wait):
+                    if self.loggingEnabled:
+                        self.logger.error(f"{method} retries exhausted, status: {res.status_code}")
+                    return res
+                if self.loggingEnabled:
+                    self.logger.info(
+                        f"{method} status {res.status_code}: retrying in {round(wait,2)} seconds"
+                    )
+            time.sleep(wait)
+            attempt += 1
+
+    def close(self) -> None:
+        """
+        Close the session and release all the connections of the pool.
+        The background token refresh is stopped as well.
+        """
+        if self.loggingEnabled:
+            self.logger.debug("closing the connection pool")
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _retrieveToken(self, verbose: bool = False) -> dict:
+        """
+        Request a new token to IMS and return the token with its expiry.
+        """
+        if self.connectionType == 'jwt':
+            return token_provider.get_jwt_token_and_expiry_for_config(
+                config=self.config, verbose=verbose
+            )
+        return token_provider.get_oauth_token_and_expiry_for_config(
+            config=self.config, verbose=verbose
+        )
+
+    def _refreshToken(self, verbose: bool = False, minValidity: float = 0) -> None:
+        """
+        Retrieve a new token if the current one expires in less than minValidity seconds.
+        Only one refresh happens at a time, the other threads are waiting for it and then use the new token.
+        Arguments:
+            verbose : OPTIONAL : display comment on the token retrieval.
+            minValidity : OPTIONAL : number of seconds the token needs to stay valid (default 0)
+        """
+        with self._tokenLock:
+            ## the token may have been refreshed by another thread while waiting for the lock
+            if self.config["token"] != "" and time.time() + minValidity <= self.config["date_limit"]:
+                return
+            if self.tokenCache is not None:
+                ## the cached token needs to be valid after the 500 seconds safety margin
+                token_with_expiry = self.tokenCache.getOrRetrieve(
+                    self.config,
+                    lambda: self._retrieveToken(verbose=verbose),
+                    minValidity=minValidity + 500,
                 )
-            token = token_and_expiry["token"]
-            expiry = token_and_expiry["expiry"]
+            else:
+                token_with_expiry = self._retrieveToken(verbose=verbose)
+            token = token_with_expiry["token"]
+            expiry = token_with_expiry["expiry"]
             if self.loggingEnabled:
-                self.logger.info(f"token retrieved: {token}")
+                self.logger.info(f"new token retrieved : {token}")
             self.token = token
             self.config["token"] = token
-            self.config["date_limit"] = time.time() + expiry - 500
             self.header.update({"Authorization": f"Bearer {token}"})
+            self.config["date_limit"] = time.time() + expiry - 500
 
     def _checkingDate(self) -> None:
         """
         Checking if the token is still valid
         """
-        now = time.time()
-        if now > self.config["date_limit"]:
+        if time.time() > self.config["date_limit"]:
             if self.loggingEnabled:
                 self.logger.warning("token expired. Trying to retrieve a new token")
-            if self.connectionType == 'jwt':
-                token_with_expiry = token_provider.get_jwt_token_and_expiry_for_config(
-                    config=self.config)
-            elif self.connectionType == 'oauthV2':
-                token_with_expiry = token_provider.get_oauth_token_and_expiry_for_config(
-                    config=self.config,
-                    connectionType=self.connectionType)
-            token = token_with_expiry["token"]
-            expiry = token_with_expiry["expiry"]
-            if self.loggingEnabled:
-                self.logger.info("new token retrieved : {token}")
-            self.config["token"] = token
-            self.config["date_limit"] = time.time() + expiry - 500
-            self.header.update({"Authorization": f"Bearer {token}"})
-            self.config["date_limit"] = (
-                time.time() + (token_with_expiry["expiry"]) - 500
-            )
-            
+            self._refreshToken()
+
+    def startBackgroundRefresh(self, refreshMargin: float = 300) -> None:
+        """
+        Start a daemon thread that renews the token refreshMargin seconds before it expires.
+        The thread is stopped when the connector is closed.
+        Arguments:
+            refreshMargin : OPTIONAL : number of seconds before the expiration when the token is renewed (default 300)
+        """
+        if self._refreshThread is not None and self._refreshThread.is_alive():
+            return
+        self._stopRefresh.clear()
+        self._refreshThread = threading.Thread(
+            target=AdobeRequest._backgroundRefresh,
+            args=(weakref.ref(self), self._stopRefresh, refreshMargin),
+            name="cjapy-token-refresh",
+            daemon=True,
+        )
+        self._refreshThread.start()
+
+    def stopBackgroundRefresh(self) -> None:
+        """
+        Stop the background refresh of the token.
+        """
+        self._stopRefresh.set()
+        if self._refreshThread is not None:
+            self._refreshThread.join()
+            self._refreshThread = None
+
+    @staticmethod
+    def _backgroundRefresh(
+        connectorRef: weakref.ref, stopRefresh: threading.Event, refreshMargin: float
+    ) -> None:
+        """
+        Loop of the background refresh thread. Only a weak reference to the connector is kept,
+        so the connector can still be garbage collected.
+        """
+        while not stopRefresh.is_set():
+            connector = connectorRef()
+            if connector is None:
+                return
+            try:
+                connector._refreshToken(minValidity=refreshMargin)
+                wait = connector.config["date_limit"] - refreshMargin - time.time()
+            except Exception as error:
+                if connector.loggingEnabled:
+                    connector.logger.error(f"background token refresh failed: {error}")
+                wait = 30
+            del connector
+            stopRefresh.wait(max(wait, 1))
+
     def getData(
         self,
         endpoint: str,
@@ -113,58 +604,39 @@ class AdobeRequest:
         self._checkingDate()
         if headers is None:
             headers = self.header
-        if params is None and data is None:
-            res = requests.get(endpoint, headers=headers)
-        elif params is not None and data is None:
-            res = requests.get(endpoint, headers=headers, params=params)
-        elif params is None and data is not None:
-            res = requests.get(endpoint, headers=headers, data=data)
-        elif params is not None and data is not None:
-            res = requests.get(endpoint, headers=headers, params=params, data=data)
-        if self.loggingEnabled:
-            self.logger.debug(f"request_URL : {res.request.url}")
-            self.logger.debug(f"header used: {json.dumps(headers)}")
-            self.logger.debug(f"status_code: {res.status_code}")
-            self.logger.debug(f"parameters used: {json.dumps(params)}")
-        try:
-            while str(res.status_code) == "429":
-                if self.loggingEnabled:
-                    self.logger.info(
-                        f"Too many requests: retrying in {self.restTime} seconds"
-                    )
-                time.sleep(self.restTime)
-                res = requests.get(endpoint, headers=headers, params=params, data=data)
-            res_json = res.json()
-        except:
-            ## handling 1.4
-            if kwargs.get("legacy", False):
-                try:
-                    return json.loads(res.text)
-                except:
-                    if self.loggingEnabled:
-                        self.logger.error(
-                            f"GET method failed: {res.status}, {res.status}"
-                        )
-                    return res.text
-            res_json = {"error": "Request Error"}
-            while internRetry > 0:
-                if self.loggingEnabled:
-                    self.logger.warning(f"Trying again with internal retry")
-                if kwargs.get("verbose", False):
-                    print("Retry parameter activated")
-                    print(f"{internRetry} retry left")
-                if "error" in res_json.keys():
-                    time.sleep(30)
-                    res_json = self.getData(
-                        endpoint,
-                        params=params,
-                        data=data,
-                        headers=headers,
-                        retry=internRetry - 1,
-                        **kwargs,
-                    )
-                    return res_json
-        return res_json
+        attempt = 0
+        while True:
+            res = self._sendRequest(
+                "GET", endpoint, headers=headers, params=params, data=data
+            )
+            if self.loggingEnabled:
+                self.logger.debug(f"request_URL : {res.request.url}")
+                self.logger.debug(f"header used: {json.dumps(headers)}")
+                self.logger.debug(f"status_code: {res.status_code}")
+                self.logger.debug(f"parameters used: {json.dumps(params)}")
+            try:
+                return res.json()
+            except ValueError:
+                ## handling 1.4
+                if kwargs.get("legacy", False):
+                    try:
+                        return json.loads(res.text)
+                    except:
+                        if self.loggingEnabled:
+                            self.logger.error(
+                                f"GET method failed: {res.status_code}, {res.text}"
+                            )
+                        return res.text
+            if attempt >= internRetry:
+                return {"error": "Request Error"}
+            wait = self.retryPolicy.getWaitTime(attempt, res.headers)
+            if self.loggingEnabled:
+                self.logger.warning(f"Trying again with internal retry in {round(wait,2)} seconds")
+            if kwargs.get("verbose", False):
+                print("Retry parameter activated")
+                print(f"{internRetry - attempt} retry left")
+            time.sleep(wait)
+            attempt += 1
 
     def postData(
         self,
@@ -184,29 +656,17 @@ class AdobeRequest:
         self._checkingDate()
         if headers is None:
             headers = self.header
-        if params is None and data is None:
-            res = requests.post(endpoint, headers=headers)
-        elif params is not None and data is None:
-            res = requests.post(endpoint, headers=headers, params=params)
-        elif params is None and data is not None:
-            res = requests.post(endpoint, headers=headers, data=json.dumps(data))
-        elif params is not None and data is not None:
-            res = requests.post(
-                endpoint, headers=headers, params=params, data=json.dumps(data)
-            )
+        if data is not None:
+            data = json.dumps(data)
+        res = self._sendRequest(
+            "POST", endpoint, headers=headers, params=params, data=data
+        )
         if self.loggingEnabled:
             self.logger.debug(f"request_URL : {res.request.url}")
             self.logger.debug(f"status_code: {res.status_code}")
         try:
-            while (
-                res.status_code == 429 or res.json().get("error_code", None) == "429050"
-            ):
-                if self.loggingEnabled:
-                    self.logger.warning(f"too many request: {res.status}, {res.text}")
-                time.sleep(30)
-                res = self.postData(endpoint, headers=headers, params=params, data=data)
             res_json = res.json()
-        except:
+        except ValueError:
             ## handling 1.4
             if kwargs.get("legacy", False):
                 try:
@@ -214,10 +674,10 @@ class AdobeRequest:
                 except:
                     if self.loggingEnabled:
                         self.logger.error(
-                            f"POST method failed: {res.status}, {res.text}"
+                            f"POST method failed: {res.status_code}, {res.text}"
                         )
                     return res.text
-            if res.status_code == '504':
+            if res.status_code == 504:
                 res_json = {"error-504": "504 Gateway Time-out"}
             else:
                 res_json = {"error": f"Request Error, status: {res.status_code}"}
@@ -238,29 +698,19 @@ class AdobeRequest:
         self._checkingDate()
         if headers is None:
             headers = self.header
-        if params is not None and data is None:
-            res = requests.patch(endpoint, headers=headers, params=params)
-        elif params is None and data is not None:
-            res = requests.patch(endpoint, headers=headers, data=json.dumps(data))
-        elif params is not None and data is not None:
-            res = requests.patch(
-                endpoint, headers=headers, params=params, data=json.dumps(data)
-            )
+        if data is not None:
+            data = json.dumps(data)
+        res = self._sendRequest(
+            "PATCH", endpoint, headers=headers, params=params, data=data
+        )
         if self.loggingEnabled:
             self.logger.debug(f"request_URL : {res.request.url}")
             self.logger.debug(f"status_code: {res.status_code}")
         try:
-            while str(res.status_code) == "429":
-                if kwargs.get("verbose", False):
-                    print(f"Too many requests: retrying in {self.restTime} seconds")
-                time.sleep(self.restTime)
-                res = requests.patch(
-                    endpoint, headers=headers, params=params, data=json.dumps(data)
-                )
             res_json = res.json()
-        except:
+        except ValueError:
             if self.loggingEnabled:
-                self.logger.error(f"PATCH method failed: {res.status}, {res.text}")
+                self.logger.error(f"PATCH method failed: {res.status_code}, {res.text}")
             res_json = {"error": "Request Error"}
         return res_json
 
@@ -282,26 +732,19 @@ class AdobeRequest:
         self._checkingDate()
         if headers is None:
             headers = self.header
-        if params is not None and data is None:
-            res = requests.put(endpoint, headers=headers, params=params)
-        elif params is None and data is not None:
-            res = requests.put(endpoint, headers=headers, data=json.dumps(data))
-        elif params is not None and data is not None:
-            res = requests.put(
-                endpoint, headers=headers, params=params, data=json.dumps(data)
-            )
-        elif params is None and data is None:
-            res = requests.put(
-                endpoint, headers=headers
-            )
+        if data is not None:
+            data = json.dumps(data)
+        res = self._sendRequest(
+            "PUT", endpoint, headers=headers, params=params, data=data
+        )
         if self.loggingEnabled:
             self.logger.debug(f"request_URL : {res.request.url}")
             self.logger.debug(f"status_code: {res.status_code}")
         try:
             status_code = res.json()
-        except:
+        except ValueError:
             if self.loggingEnabled:
-                self.logger.error(f"PUT method failed: {res.status}, {res.text}")
+                self.logger.error(f"PUT method failed: {res.status_code}, {res.text}")
             status_code = {"error": "Request Error"}
         return status_code
 
@@ -314,19 +757,268 @@ class AdobeRequest:
         self._checkingDate()
         if headers is None:
             headers = self.header
+        res = self._sendRequest("DELETE", endpoint, headers=headers, params=params)
+        if self.loggingEnabled:
+            self.logger.debug(f"request_URL : {res.request.url}")
+            self.logger.debug(f"status_code: {res.status_code}")
+        if res.status_code >= 400 and self.loggingEnabled:
+            self.logger.error(f"DELETE method failed: {res.status_code}, {res.text}")
+        return res.status_code
+
+
+class AsyncAdobeRequest:
+    """
+    Async twin of the AdobeRequest class, sending the requests with aiohttp.
+    The token, rate limiter and retry policy of the AdobeRequest instance passed are used, so they are shared with the sync requests.
+    The number of requests in flight at the same time is bounded by a semaphore.
+    """
+
+    def __init__(
+        self,
+        connector: AdobeRequest = None,
+        maxConcurrency: int = 10,
+        loggingEnabled: bool = False,
+        logger: object = None,
+        **kwargs,
+    ) -> None:
+        """
+        Set the async connector.
+        Arguments:
+            connector : OPTIONAL : the AdobeRequest instance handling the token. Created from the kwargs if not provided.
+            maxConcurrency : OPTIONAL : maximum number of requests sent at the same time (default 10)
+            loggingEnabled : OPTIONAL : if the logging is enable for that instance.
+            logger : OPTIONAL : instance of the logger created
+        possible kwargs:
+            any argument accepted by the AdobeRequest class, when no connector is passed.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "The aiohttp library is required for the async connector. You can install it with: pip install aiohttp"
+            )
+        if connector is None:
+            connector = AdobeRequest(loggingEnabled=loggingEnabled, logger=logger, **kwargs)
+        self.connector = connector
+        self.config = connector.config
+        self.loggingEnabled = loggingEnabled
+        self.logger = logger
+        self.retryPolicy = connector.retryPolicy
+        self.maxConcurrency = maxConcurrency
+        self._semaphore = None
+        self._session = None
+
+    @property
+    def header(self) -> dict:
+        """
+        Header used by the sync connector, containing the current token.
+        """
+        return self.connector.header
+
+    def _getSession(self) -> "aiohttp.ClientSession":
+        """
+        Return the aiohttp session, creating it in the running event loop on first usage.
+        """
+        if self._session is None or self._session.closed:
+            tcpConnector = aiohttp.TCPConnector(
+                limit=self.maxConcurrency, limit_per_host=self.maxConcurrency
+            )
+            self._session = aiohttp.ClientSession(connector=tcpConnector)
+        return self._session
+
+    def _getSemaphore(self) -> asyncio.Semaphore:
+        """
+        Return the semaphore bounding the concurrency, created in the running event loop on first usage.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.maxConcurrency)
+        return self._semaphore
+
+    async def close(self) -> None:
+        """
+        Close the aiohttp session.
+        """
+        if self._session is not None and self._session.closed == False:
+            if self.loggingEnabled:
+                self.logger.debug("closing the async session")
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def _checkingDate(self) -> None:
+        """
+        Checking if the token is still valid, the refresh is done by the sync connector outside of the event loop.
+        """
+        if time.time() > self.connector.config["date_limit"]:
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self.connector._checkingDate)
+
+    @staticmethod
+    def _formatParams(params: dict = None) -> dict:
+        """
+        aiohttp only accepts string or numbers as query parameters, the values are formatted the way requests does.
+        """
         if params is None:
-            res = requests.delete(endpoint, headers=headers)
-        elif params is not None:
-            res = requests.delete(endpoint, headers=headers, params=params)
-        try:
-            while str(res.status_code) == "429":
-                if kwargs.get("verbose", False):
-                    print(f"Too many requests: retrying in {self.restTime} seconds")
-                time.sleep(self.restTime)
-                res = requests.delete(endpoint, headers=headers, params=params)
-            status_code = res.status_code
-        except:
+            return None
+        return {
+            key: str(value) if type(value) == bool else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict = None,
+        data=None,
+        headers: dict = None,
+    ) -> tuple:
+        """
+        Send the request, retried following the retry policy of the connector.
+        Returns the status code and the JSON response (None if the response is not a JSON).
+        """
+        await self._checkingDate()
+        if headers is None:
+            headers = self.header
+        session = self._getSession()
+        start = time.monotonic()
+        attempt = 0
+        async with self._getSemaphore():
+            while True:
+                if self.connector.rateLimiter is not None:
+                    wait = self.connector.rateLimiter.reserve(endpoint)
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                try:
+                    async with session.request(
+                        method,
+                        endpoint,
+                        headers=headers,
+                        params=self._formatParams(params),
+                        data=data,
+                    ) as res:
+                        if self.loggingEnabled:
+                            self.logger.debug(f"request_URL : {res.url}")
+                            self.logger.debug(f"status_code: {res.status}")
+                        try:
+                            res_json = await res.json(content_type=None)
+                        except ValueError:
+                            res_json = None
+                        errorCode = None
+                        if res.status >= 400 and isinstance(res_json, dict):
+                            errorCode = res_json.get("error_code")
+                        if not self.retryPolicy.isRetryable(
+                            res.status, errorCode, method, endpoint
+                        ):
+                            return res.status, res_json
+                        wait = self.retryPolicy.getWaitTime(attempt, res.headers)
+                        if not self.retryPolicy.canRetry(
+                            attempt, time.monotonic() - start, wait
+                        ):
+                            return res.status, res_json
+                        if self.loggingEnabled:
+                            self.logger.info(
+                                f"{method} status {res.status}: retrying in {round(wait,2)} seconds"
+                            )
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                    wait = self.retryPolicy.getWaitTime(attempt)
+                    if not self.retryPolicy.canRetryConnectionError(
+                        method, endpoint
+                    ) or not self.retryPolicy.canRetry(attempt, time.monotonic() - start, wait):
+                        raise
+                    if self.loggingEnabled:
+                        self.logger.warning(
+                            f"{method} connection error: {error}. Retrying in {round(wait,2)} seconds"
+                        )
+                await asyncio.sleep(wait)
+                attempt += 1
+
+    async def getData(
+        self,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        headers: dict = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Abstraction for getting data
+        """
+        expansion = kwargs.get("expansion")
+        if expansion:
+            params["expansion"] = expansion
+        status, res_json = await self._request(
+            "GET", endpoint, params=params, data=data, headers=headers
+        )
+        if res_json is None:
             if self.loggingEnabled:
-                self.logger.error(f"DELETE method failed: {res.status}, {res.text}")
-            status_code = {"error": "Request Error"}
-        return status_code
+                self.logger.error(f"GET method failed: {status}")
+            res_json = {"error": "Request Error"}
+        return res_json
+
+    async def postData(
+        self,
+        endpoint: str,
+        params: dict = None,
+        data: dict = None,
+        headers: dict = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Abstraction for posting data
+        """
+        expansion = kwargs.get("expansion")
+        if expansion:
+            params["expansion"] = expansion
+        if data is not None:
+            data = json.dumps(data)
+        status, res_json = await self._request(
+            "POST", endpoint, params=params, data=data, headers=headers
+        )
+        if res_json is None:
+            if self.loggingEnabled:
+                self.logger.error(f"POST method failed: {status}")
+            if status == 504:
+                res_json = {"error-504": "504 Gateway Time-out"}
+            else:
+                res_json = {"error": f"Request Error, status: {status}"}
+        return res_json
+
+    async def putData(
+        self,
+        endpoint: str,
+        params: dict = None,
+        data=None,
+        headers: dict = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Abstraction for putting data
+        """
+        if data is not None:
+            data = json.dumps(data)
+        status, res_json = await self._request(
+            "PUT", endpoint, params=params, data=data, headers=headers
+        )
+        if res_json is None:
+            if self.loggingEnabled:
+                self.logger.error(f"PUT method failed: {status}")
+            res_json = {"error": "Request Error"}
+        return res_json
+
+    async def deleteData(
+        self, endpoint: str, params: dict = None, headers: dict = None, *args, **kwargs
+    ):
+        """
+        Abstraction for deleting data
+        """
+        status, _ = await self._request(
+            "DELETE", endpoint, params=params, headers=headers
+        )
+        return status
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 import json
+import os
+from pathlib import Path
 
 
 @dataclass
@@ -26,6 +28,8 @@ class Project:
         self.ownerEmail: int = projectDict["owner"].get("login", "")
         self.template: bool = projectDict.get("companyTemplate", False)
         self.type: str = projectDict.get('type',None)
+        self.modified: str = projectDict.get("modified", None)
+        self.dvIdSuffix: bool = dvIdSuffix
         self.version: str = None
         self.curation: bool = False
         self.reportType:str = None
@@ -277,3 +281,73 @@ class Project:
             }
         full_obj = {**obj, **add_object}
         return full_obj
+
+
+class ProjectSnapshot:
+    """
+    Local snapshot of the projects definitions, stored in a JSON file with their modified date.
+    It is used by getAllProjectDetails to retrieve only the projects created or modified since the last run.
+    """
+
+    def __init__(self, path: str = "cja_projects_snapshot.json") -> None:
+        """
+        Load the snapshot file, or start an empty snapshot if it does not exist.
+        Arguments:
+            path : OPTIONAL : path of the snapshot file (default "cja_projects_snapshot.json")
+        """
+        self.path = Path(path)
+        self.projects = {}
+        try:
+            with open(self.path, "r") as f:
+                self.projects = json.load(f).get("projects", {})
+        except (OSError, ValueError):
+            self.projects = {}
+
+    def getDefinition(self, projectId: str = None, modified: str = None) -> dict:
+        """
+        Return the project definition saved, or None if it is not in the snapshot or was modified since.
+        Arguments:
+            projectId : REQUIRED : ID of the project
+            modified : REQUIRED : modified date of the project returned by getProjects
+        """
+        element = self.projects.get(projectId)
+        if element is None or modified is None or element.get("modified") != modified:
+            return None
+        return element["definition"]
+
+    def setDefinition(self, projectDict: dict = None) -> None:
+        """
+        Save the project definition (returned by getProject) in the snapshot.
+        Arguments:
+            projectDict : REQUIRED : the dictionary of the project
+        """
+        self.projects[projectDict["id"]] = {
+            "modified": projectDict.get("modified"),
+            "definition": projectDict,
+        }
+
+    def keep(self, projectIds: list = None) -> list:
+        """
+        Remove the projects that are not in the list (deleted projects) and return their IDs.
+        Arguments:
+            projectIds : REQUIRED : IDs of the existing projects
+        """
+        projectIds = set(projectIds)
+        removed = [projectId for projectId in self.projects if projectId not in projectIds]
+        for projectId in removed:
+            del self.projects[projectId]
+        return removed
+
+    def save(self) -> None:
+        """
+        Write the snapshot file atomically.
+        """
+        if self.path.parent != Path(""):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmpPath = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmpPath, "w") as f:
+            json.dump({"projects": self.projects}, f)
+        os.replace(tmpPath, self.path)
+
+    def __len__(self) -> int:
+        return len(self.projects)
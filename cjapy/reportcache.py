@@ -0,0 +1,325 @@
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+
+
+class MemoryReportBackend:
+    """
+    In-memory backend of the ReportCache.
+    The responses are kept serialized in JSON, so the responses returned can be modified without altering the cache.
+    The least recently used responses are evicted when maxSize is reached.
+    """
+
+    def __init__(self, maxSize: int = 100) -> None:
+        """
+        Instantiate the backend.
+        Arguments:
+            maxSize : OPTIONAL : maximum number of responses kept (default 100)
+        """
+        self.maxSize = maxSize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str = None) -> str:
+        """
+        Return the response saved for that key, or None if it is not saved or expired.
+        Arguments:
+            key : REQUIRED : key of the response
+        """
+        with self._lock:
+            element = self._data.get(key)
+            if element is None:
+                return None
+            if element[0] < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return element[1]
+
+    def set(self, key: str = None, value: str = None, expiresAt: float = None) -> None:
+        """
+        Save the response for that key.
+        Arguments:
+            key : REQUIRED : key of the response
+            value : REQUIRED : the response serialized in JSON
+            expiresAt : REQUIRED : timestamp after which the response is expired
+        """
+        with self._lock:
+            self._data[key] = (expiresAt, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxSize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all the responses.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskReportBackend:
+    """
+    Disk backend of the ReportCache: one JSON file per response in a folder, shared between the processes.
+    The number of files is tracked, the least recently used responses are evicted (down to 90% of maxSize) only when maxSize is exceeded.
+    The expired responses are removed when they are read, and by a sweep of the folder every sweepEvery writes.
+    """
+
+    def __init__(self, path: str = None, maxSize: int = 1000, sweepEvery: int = 100) -> None:
+        """
+        Instantiate the backend.
+        Arguments:
+            path : OPTIONAL : folder of the cache (default: report_cache in a .cjapy folder of the home directory)
+            maxSize : OPTIONAL : maximum number of responses kept (default 1000)
+            sweepEvery : OPTIONAL : number of writes between 2 removals of the expired responses (default 100)
+        """
+        if path is None:
+            path = Path.home() / ".cjapy" / "report_cache"
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.maxSize = maxSize
+        self.sweepEvery = sweepEvery
+        self._lock = threading.Lock()
+        self._count = None  ## number of files, counted on the first write
+        self._writes = 0
+
+    def get(self, key: str = None) -> str:
+        """
+        Return the response saved for that key, or None if it is not saved or expired.
+        Arguments:
+            key : REQUIRED : key of the response
+        """
+        filename = self.path / f"{key}.json"
+        try:
+            with open(filename, "r") as f:
+                expiresAt = float(f.readline())
+                if expiresAt < time.time():
+                    value = None
+                else:
+                    value = f.read()
+        except (OSError, ValueError):
+            return None
+        if value is None:
+            try:
+                filename.unlink()
+            except OSError:
+                return None
+            with self._lock:
+                if self._count is not None:
+                    self._count -= 1
+            return None
+        os.utime(filename)  ## the last access date is used for the eviction
+        return value
+
+    def set(self, key: str = None, value: str = None, expiresAt: float = None) -> None:
+        """
+        Save the response for that key, the file is written atomically.
+        Arguments:
+            key : REQUIRED : key of the response
+            value : REQUIRED : the response serialized in JSON
+            expiresAt : REQUIRED : timestamp after which the response is expired
+        """
+        filename = self.path / f"{key}.json"
+        tmpFile = self.path / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        exists = filename.exists()
+        with open(tmpFile, "w") as f:
+            f.write(f"{expiresAt}\n")
+            f.write(value)
+        os.replace(tmpFile, filename)
+        with self._lock:
+            if self._count is None:
+                self._count = sum(1 for _ in self.path.glob("*.json"))
+            elif exists == False:
+                self._count += 1
+            self._writes += 1
+            sweep = self.sweepEvery > 0 and self._writes % self.sweepEvery == 0
+            evict = self._count > self.maxSize
+        if sweep:
+            self._removeExpired()
+        elif evict:
+            self._evict()
+
+    def _removeExpired(self) -> None:
+        """
+        Remove the expired responses, then evict the least recently used ones if maxSize is still exceeded.
+        """
+        now = time.time()
+        for filename in self.path.glob("*.json"):
+            try:
+                with open(filename, "r") as f:
+                    expiresAt = float(f.readline())
+                if expiresAt < now:
+                    filename.unlink()
+            except (OSError, ValueError):
+                continue
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Count the files (without reading them) and remove the least recently used ones, down to 90% of maxSize, when maxSize is exceeded.
+        """
+        files = []
+        for filename in self.path.glob("*.json"):
+            try:
+                files.append((filename.stat().st_mtime, filename))
+            except OSError:
+                continue
+        count = len(files)
+        if count > self.maxSize:
+            target = int(self.maxSize * 0.9)
+            for _, filename in sorted(files)[: count - target]:
+                try:
+                    filename.unlink()
+                    count -= 1
+                except OSError:
+                    pass
+        with self._lock:
+            self._count = count
+
+    def clear(self) -> None:
+        """
+        Remove all the responses.
+        """
+        for filename in self.path.glob("*.json"):
+            try:
+                filename.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._count = 0
+
+    def __len__(self) -> int:
+        return len(list(self.path.glob("*.json")))
+
+
+class ReportCache:
+    """
+    Cache of the getReport responses, keyed by the fingerprint of the request (canonical request definition, including the dataId, and the query parameters).
+    The responses of closed date ranges are kept for ttl seconds, the ones including today (or later) only for ttlToday seconds.
+    Only the successful responses are cached.
+    """
+
+    def __init__(
+        self,
+        backend: Union[str, object] = "memory",
+        ttl: float = 86400,
+        ttlToday: float = 300,
+        maxSize: int = 100,
+        path: str = None,
+    ) -> None:
+        """
+        Instantiate the report cache.
+        Arguments:
+            backend : OPTIONAL : "memory" (default), "disk" or an instance with the get, set and clear methods (see MemoryReportBackend)
+            ttl : OPTIONAL : number of seconds the responses of closed date ranges are kept (default 86400)
+            ttlToday : OPTIONAL : number of seconds the responses of date ranges including today are kept (default 300)
+            maxSize : OPTIONAL : maximum number of responses kept (default 100)
+            path : OPTIONAL : folder of the disk backend (default: report_cache in a .cjapy folder of the home directory)
+        """
+        if backend == "memory":
+            backend = MemoryReportBackend(maxSize=maxSize)
+        elif backend == "disk":
+            backend = DiskReportBackend(path=path, maxSize=maxSize)
+        elif isinstance(backend, str):
+            raise ValueError("backend can only be 'memory', 'disk' or a backend instance")
+        self.backend = backend
+        self.ttl = ttl
+        self.ttlToday = ttlToday
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def getKey(request: dict = None, params: dict = None) -> str:
+        """
+        Return the fingerprint of a report request.
+        Arguments:
+            request : REQUIRED : the request sent to the reporting API (with its dataId and page)
+            params : OPTIONAL : the query parameters of the request
+        """
+        definition = json.dumps(
+            {"request": request, "params": params or {}},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(definition.encode("utf-8")).hexdigest()
+
+    def getTTL(self, request: dict = None) -> float:
+        """
+        Return the number of seconds the response of that request can be kept:
+        ttlToday if one of its dateRange includes today (or cannot be read), ttl otherwise.
+        Arguments:
+            request : REQUIRED : the request sent to the reporting API
+        """
+        today = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        dateRanges = [
+            filter.get("dateRange")
+            for filter in request.get("globalFilters", [])
+            if filter.get("type") == "dateRange"
+        ]
+        if len(dateRanges) == 0:
+            return self.ttlToday
+        for dateRange in dateRanges:
+            try:
+                end = datetime.datetime.fromisoformat(dateRange.split("/")[1])
+            except (AttributeError, IndexError, ValueError):
+                return self.ttlToday
+            if end.replace(tzinfo=None) > today:
+                return self.ttlToday
+        return self.ttl
+
+    def get(self, request: dict = None, params: dict = None) -> dict:
+        """
+        Return the response cached for that request, or None.
+        Arguments:
+            request : REQUIRED : the request sent to the reporting API
+            params : OPTIONAL : the query parameters of the request
+        """
+        value = self.backend.get(self.getKey(request, params))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, request: dict = None, params: dict = None, response: dict = None) -> None:
+        """
+        Cache the response of that request, if it is a successful response.
+        Arguments:
+            request : REQUIRED : the request sent to the reporting API
+            params : OPTIONAL : the query parameters of the request
+            response : REQUIRED : the response of the reporting API
+        """
+        if isinstance(response, dict) == False or "errorCode" in response.keys():
+            return
+        if any(str(key).startswith("error") for key in response.keys()):
+            return
+        ttl = self.getTTL(request)
+        if ttl <= 0:
+            return
+        self.backend.set(
+            self.getKey(request, params), json.dumps(response), time.time() + ttl
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all the responses and reset the counters.
+        """
+        self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Return the number of responses cached, hits and misses.
+        """
+        return {"size": len(self.backend), "hits": self.hits, "misses": self.misses}
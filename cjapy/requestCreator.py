@@ -401,6 +401,49 @@ class RequestCreator:
         else:  ## in case there is no dateRange already
             self.__request["globalFilters"][pos].append(newDef)
 
+    def splitDateRange(self, frequency: str = "month") -> list:
+        """
+        Split the dateRange filter of the globalFilter list into consecutive sub-windows and return a request definition for each of them.
+        The first and last windows are cut to the dateRange of the request.
+        Arguments:
+            frequency : OPTIONAL : size of the sub-windows: "day", "week" or "month" (default)
+        """
+        if frequency not in ("day", "week", "month"):
+            raise ValueError("frequency can only be 'day', 'week' or 'month'")
+        dateRanges = [
+            filter["dateRange"]
+            for filter in self.__request["globalFilters"]
+            if filter["type"] == "dateRange"
+        ]
+        if len(dateRanges) == 0:
+            raise ValueError("Require a dateRange in the globalFilters to split")
+        start, end = dateRanges[0].split("/")
+        start = datetime.datetime.fromisoformat(start)
+        end = datetime.datetime.fromisoformat(end)
+        requests = []
+        windowStart = start
+        while windowStart < end:
+            if frequency == "day":
+                windowEnd = (windowStart + datetime.timedelta(days=1)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            elif frequency == "week":
+                windowEnd = (windowStart + datetime.timedelta(days=7)).replace(
+                    hour=0, minute=0, second=0, microsecond=0
+                )
+            else:
+                windowEnd = (windowStart.replace(day=28) + datetime.timedelta(days=4)).replace(
+                    day=1, hour=0, minute=0, second=0, microsecond=0
+                )
+            windowEnd = min(windowEnd, end)
+            shard = RequestCreator(self.__request)
+            shard.updateDateRange(
+                dateRange=f"{windowStart.isoformat(timespec='milliseconds')}/{windowEnd.isoformat(timespec='milliseconds')}"
+            )
+            requests.append(shard.to_dict())
+            windowStart = windowEnd
+        return requests
+
     def removeGlobalFilter(self, index: int = None, filterId: str = None) -> None:
         """
         Remove a specific filter from the globalFilter list.
@@ -0,0 +1,162 @@
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+class ReportSink(ABC):
+    """
+    Abstract base class of the writers used by getReport to stream the report rows to a file, page by page.
+    The subclasses implement the write and close methods.
+    A row is a list: [itemId, value, metric1, metric2, ...]
+    """
+
+    format = None
+
+    def __init__(self, path: str = None, columns: list = None) -> None:
+        """
+        Open the file and prepare the writer.
+        Arguments:
+            path : REQUIRED : path of the file to write.
+            columns : REQUIRED : list of the columns names.
+        """
+        if path is None:
+            raise ValueError("Require a path for the sink")
+        if columns is None:
+            raise ValueError("Require the list of columns")
+        self.path = Path(path)
+        ## the columns names need to be unique for the JSON and Parquet formats
+        self.columns = []
+        for col in columns:
+            name, index = col, 1
+            while name in self.columns:
+                name = f"{col}.{index}"
+                index += 1
+            self.columns.append(name)
+        self.rows = 0
+
+    @abstractmethod
+    def write(self, rows: list = None) -> None:
+        """
+        Write the rows of a page.
+        Arguments:
+            rows : REQUIRED : list of rows ([itemId, value, metric1, ...])
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class CSVSink(ReportSink):
+    """
+    Write the report rows in a CSV file, with a header line.
+    """
+
+    format = "csv"
+
+    def __init__(self, path: str = None, columns: list = None, delimiter: str = ",") -> None:
+        super().__init__(path, columns)
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, delimiter=delimiter)
+        self._writer.writerow(self.columns)
+
+    def write(self, rows: list = None) -> None:
+        self._writer.writerows(rows)
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class JSONLinesSink(ReportSink):
+    """
+    Write the report rows in a JSON Lines file, one JSON object per row.
+    """
+
+    format = "jsonl"
+
+    def __init__(self, path: str = None, columns: list = None) -> None:
+        super().__init__(path, columns)
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, rows: list = None) -> None:
+        self._file.writelines(
+            json.dumps(dict(zip(self.columns, row))) + "\n" for row in rows
+        )
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(ReportSink):
+    """
+    Write the report rows in a Parquet file, one row group per page.
+    The itemId and dimension value are stored as strings, the metrics as float64.
+    Requires the pyarrow library.
+    """
+
+    format = "parquet"
+
+    def __init__(self, path: str = None, columns: list = None) -> None:
+        if pyarrow is None:
+            raise ImportError(
+                "The Parquet sink requires the optional pyarrow library: pip install cjapy[parquet] (or pip install pyarrow)"
+            )
+        super().__init__(path, columns)
+        self.schema = pyarrow.schema(
+            [pyarrow.field(self.columns[0], pyarrow.string()), pyarrow.field(self.columns[1], pyarrow.string())]
+            + [pyarrow.field(col, pyarrow.float64()) for col in self.columns[2:]]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(str(self.path), self.schema)
+
+    def write(self, rows: list = None) -> None:
+        if len(rows) == 0:
+            return
+        arrays = [
+            pyarrow.array([row[index] for row in rows], type=field.type)
+            for index, field in enumerate(self.schema)
+        ]
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+SINKS = {
+    ".csv": CSVSink,
+    ".jsonl": JSONLinesSink,
+    ".ndjson": JSONLinesSink,
+    ".parquet": ParquetSink,
+}
+
+
+def getReportSink(sink: str = None, columns: list = None) -> ReportSink:
+    """
+    Return the writer for the sink passed, based on the file extension (.csv, .jsonl, .ndjson or .parquet).
+    Arguments:
+        sink : REQUIRED : path of the file.
+        columns : REQUIRED : list of the columns names.
+    """
+    suffix = Path(sink).suffix.lower()
+    if suffix not in SINKS:
+        raise ValueError(
+            f"sink format not supported, possible extensions are {list(SINKS.keys())}"
+        )
+    return SINKS[suffix](sink, columns)
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  ## Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenCache:
+    """
+    On-disk cache of the IMS tokens, shared between the processes running on the same machine.
+    The tokens are stored with their expiration date and keyed by org_id, client_id and scopes.
+    The cache file is locked during read and refresh, so only one process retrieves a new token at a time.
+    """
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Instantiate the token cache.
+        Arguments:
+            path : OPTIONAL : path of the cache file (default: token_cache.json in a .cjapy folder of the home directory)
+        """
+        if path is None:
+            path = Path.home() / ".cjapy" / "token_cache.json"
+        self.path = Path(path)
+        self.lockPath = self.path.with_name(self.path.name + ".lock")
+
+    @staticmethod
+    def getKey(config: dict) -> str:
+        """
+        Return the key of the token for that configuration.
+        Arguments:
+            config : REQUIRED : configuration object of the connection.
+        """
+        identity = "|".join(
+            [
+                str(config.get("org_id", "")),
+                str(config.get("client_id", "")),
+                str(config.get("scopes", "")),
+            ]
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Context manager holding an exclusive lock on the cache file between processes.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lockPath, "a+") as lockFile:
+            if fcntl is not None:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX)
+            else:
+                lockFile.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lockFile.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:  ## LK_LOCK gives up after 10 seconds
+                        continue
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+                else:
+                    lockFile.seek(0)
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self) -> dict:
+        """
+        Read the cache file, returns an empty cache if it does not exist or is not readable.
+        """
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if isinstance(data, dict) == False:
+            return {}
+        return data
+
+    def _write(self, data: dict) -> None:
+        """
+        Write the cache file atomically, readable only by the current user.
+        """
+        tmpPath = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmpPath, self.path)
+
+    def getToken(self, config: dict, minValidity: float = 0) -> dict:
+        """
+        Return the cached token and its remaining validity in seconds ({"token","expiry"}),
+        or None if there is no token valid for at least minValidity seconds.
+        Arguments:
+            config : REQUIRED : configuration object of the connection.
+            minValidity : OPTIONAL : number of seconds the token needs to stay valid (default 0)
+        """
+        element = self._read().get(self.getKey(config))
+        if element is None:
+            return None
+        expiry = element.get("expiry_date", 0) - time.time()
+        if expiry <= minValidity:
+            return None
+        return {"token": element["token"], "expiry": expiry}
+
+    def setToken(self, config: dict, token: str, expiry: float) -> None:
+        """
+        Save the token in the cache.
+        Arguments:
+            config : REQUIRED : configuration object of the connection.
+            token : REQUIRED : the token to save
+            expiry : REQUIRED : number of seconds the token is valid for
+        """
+        now = time.time()
+        data = {
+            key: value
+            for key, value in self._read().items()
+            if isinstance(value, dict) and value.get("expiry_date", 0) > now
+        }
+        data[self.getKey(config)] = {"token": token, "expiry_date": now + expiry}
+        self._write(data)
+
+    def getOrRetrieve(
+        self, config: dict, retrieve: Callable[[], dict], minValidity: float = 0
+    ) -> dict:
+        """
+        Return the cached token if valid for at least minValidity seconds, otherwise call retrieve and save its result.
+        The cache is locked during the retrieval, so the other processes wait for that token instead of requesting one.
+        Arguments:
+            config : REQUIRED : configuration object of the connection.
+            retrieve : REQUIRED : function returning a new token as {"token","expiry"}
+            minValidity : OPTIONAL : number of seconds the token needs to stay valid (default 0)
+        """
+        with self.lock():
+            cached = self.getToken(config, minValidity=minValidity)
+            if cached is not None:
+                return cached
+            token_with_expiry = retrieve()
+            self.setToken(config, token_with_expiry["token"], token_with_expiry["expiry"])
+            return token_with_expiry
+
+    def clear(self, config: dict = None) -> None:
+        """
+        Remove the token of that configuration from the cache, or all the tokens if no configuration is passed.
+        Arguments:
+            config : OPTIONAL : configuration object of the connection.
+        """
+        with self.lock():
+            if config is None:
+                self._write({})
+                return
+            data = self._read()
+            data.pop(self.getKey(config), None)
+            self._write(data)
@@ -3,6 +3,7 @@ import json
 from typing import Union, IO
 import time
 from .requestCreator import RequestCreator
+from .arrowutils import toArrowTable, writeParquet
 from copy import deepcopy
 
 
@@ -26,11 +27,12 @@ class Workspace:
         metrics: Union[dict, list] = None,  ## for normal type, static report
         metricFilters: dict = None,
         resolveColumns: bool = True,
+        componentNames: dict = None,
     ) -> None:
         """
         Setup the different values from the response of the getReport
         Argument:
-            responseData : REQUIRED : data returned & predigested by the getReport method.
+            responseData : REQUIRED : dataframe prepared by the getReport method (or dictionary of the rows)
             dataRequest : REQUIRED : dataRequest containing the request
             columns : REQUIRED : the columns element of the response.
             summaryData : REQUIRED : summary data containing total calculated by CJA
@@ -39,6 +41,8 @@ class Workspace:
             metrics : OPTIONAL : dictionary of the columns Id for normal report and list of columns name for Static report
             metricFilters : OPTIONAL : Filter name for the id of the filter
             resolveColumns : OPTIONAL :
+            componentNames : OPTIONAL : names of the filters and calculated metrics already resolved by the connector.
+                The components missing are resolved in bulk with the cjaConnector.
         """
         for filter in dataRequest["globalFilters"]:
             if filter["type"] == "dateRange":
@@ -52,14 +56,33 @@ class Workspace:
         self.summaryData = summaryData
         self.reportType = reportType
         self.cjaConnector = cjaConnector
+        componentNames = dict(componentNames or {})
+        ## resolving the components missing in one bulk call
+        missingIds = [
+            filter["segmentId"]
+            for filter in dataRequest["globalFilters"]
+            if filter["type"] == "segment" and filter.get("segmentId") is not None
+        ]
+        if resolveColumns and reportType == "normal" and "dimension" in dataRequest.keys():
+            missingIds += [
+                metric
+                for col in columns["columnIds"]
+                for metric in metrics[col].split(":::")
+            ]
+        missingIds = [
+            componentId
+            for componentId in missingIds
+            if componentId not in componentNames
+        ]
+        if len(missingIds) > 0 and cjaConnector is not None:
+            componentNames.update(cjaConnector.resolveComponentNames(missingIds))
         ## global filters resolution
         filters = []
         for filter in dataRequest["globalFilters"]:
             if filter["type"] == "segment":
                 segId = filter.get("segmentId",None)
                 if segId is not None:
-                    seg = cjaConnector.getFilter(filter["segmentId"])
-                    filter["segmentName"] = seg["name"]
+                    filter["segmentName"] = componentNames.get(segId, segId)
                 else:
                     context = filter.get('segmentDefinition',{}).get('container',{}).get('context')
                     description = filter.get('segmentDefinition',{}).get('container',{}).get('pred',{}).get('description')
@@ -71,8 +94,11 @@ class Workspace:
         self.globalFilters = filters
         self.metricFilters = metricFilters
         if reportType == "normal" or reportType == "static":
-            df_init = pd.DataFrame(responseData).T
-            df_init = df_init.reset_index()
+            if isinstance(responseData, pd.DataFrame):
+                df_init = responseData
+            else:  ## dictionary of rows
+                df_init = pd.DataFrame(responseData).T
+                df_init = df_init.reset_index()
         elif reportType == "multi":
             df_init = responseData
         if reportType == "normal":
@@ -90,16 +116,7 @@ class Workspace:
                 if resolveColumns:
                     metricResolvedName = []
                     for metric in metricListName:
-                        if metric.startswith("cm") and "@AdobeOrg" in metric:
-                            cm = cjaConnector.getCalculatedMetric(metric)
-                            metricName = cm["name"]
-                            metricResolvedName.append(metricName)
-                        elif metric.startswith("s") and "@AdobeOrg" in metric:
-                            seg = cjaConnector.getFilter(metric)
-                            segName = seg["name"]
-                            metricResolvedName.append(segName)
-                        else:
-                            metricResolvedName.append(metric)
+                        metricResolvedName.append(componentNames.get(metric, metric))
                     colName = ":::".join(metricResolvedName)
                     columns_data.append(colName)
                 else:
@@ -108,15 +125,13 @@ class Workspace:
             metrics: list = metrics  ## case when a list is used
             columns_data.append("FilterId")
             columns_data += metrics
-        if df_init.empty == False and (
-            reportType == "static" or reportType == "normal"
-        ):
+        if reportType == "static" or reportType == "normal":
+            if len(df_init.columns) != len(columns_data):
+                raise ValueError(
+                    f"The report returned {len(df_init.columns)} columns, expected {len(columns_data)}: {columns_data}"
+                )
             df_init.columns = columns_data
-            self.columns = list(df_init.columns)
-        elif reportType == "multi":
-            self.columns = list(df_init.columns)
-        else:
-            self.columns = list(df_init.columns)
+        self.columns = list(df_init.columns)
         self.row_numbers = len(df_init)
         self.dataframe = df_init
 
@@ -159,7 +174,7 @@ class Workspace:
         """
         if filename is None:
             filename = f"cjapy_{int(time.time())}.csv"
-        self.df_init.to_csv(filename, delimiter=delimiter, index=index)
+        self.dataframe.to_csv(filename, sep=delimiter, index=index)
 
     def to_json(self, filename: str = None, orient: str = "index") -> IO:
         """
@@ -170,7 +185,26 @@ class Workspace:
         """
         if filename is None:
             filename = f"cjapy_{int(time.time())}.json"
-        self.df_init.to_json(filename, orient=orient)
+        self.dataframe.to_json(filename, orient=orient)
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Return the result as an Arrow table, keeping the dtypes of the dataframe (the itemId stays a dictionary column).
+        Requires the pyarrow library.
+        """
+        return toArrowTable(self.dataframe)
+
+    def to_parquet(self, filename: str = None, compression: str = "snappy") -> str:
+        """
+        Save the result in a Parquet file and return the name of the file.
+        Requires the pyarrow library.
+        Arguments:
+            filename : OPTIONAL : name of the file
+            compression : OPTIONAL : compression codec (default "snappy")
+        """
+        if filename is None:
+            filename = f"cjapy_{int(time.time())}.parquet"
+        return writeParquet(self.to_arrow(), filename, compression=compression)
 
     def breakdown(
         self,
@@ -54,6 +54,7 @@ setup(
     include_package_data=True,
     install_requires=[
         "pandas",
+        "numpy",
         "pathlib2",
         "pathlib",
         "requests",
@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+import cjapy
+from cjapy import token_provider
+from cjapy.projects import Project
+
+
+OWNER = {"name": "owner", "imsUserId": "1", "login": "owner@example.com"}
+
+
+def desktopProject(projectId="p1", dimension="variables/page", metrics=("metrics/visits",), filters=(), calculatedMetrics=()):
+    nodes = [{"component": {"type": "Metric", "id": metric}, "nodes": []} for metric in metrics]
+    nodes += [{"component": {"type": "Segment", "id": filterId}, "nodes": []} for filterId in filters]
+    nodes += [{"component": {"type": "CalculatedMetric", "id": cm}, "nodes": []} for cm in calculatedMetrics]
+    return Project(
+        {
+            "id": projectId,
+            "name": f"Project {projectId}",
+            "owner": OWNER,
+            "type": "project",
+            "definition": {
+                "version": "1",
+                "workspaces": [
+                    {
+                        "id": "w1",
+                        "panels": [
+                            {
+                                "id": "panel1",
+                                "rsid": "dv_1",
+                                "subPanels": [
+                                    {
+                                        "reportlet": {
+                                            "type": "FreeformReportlet",
+                                            "freeformTable": {"dimension": {"id": dimension}, "staticRows": []},
+                                            "columnTree": {"nodes": nodes},
+                                        }
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+    )
+
+
+def mobileProject(projectId="p2"):
+    return Project(
+        {
+            "id": projectId,
+            "name": "Mobile",
+            "owner": OWNER,
+            "type": "project",
+            "definition": {"device": "cell", "version": "1"},
+        }
+    )
+
+
+def guidedAnalysisProject(projectId="p3"):
+    return Project(
+        {
+            "id": projectId,
+            "name": "Guided",
+            "owner": OWNER,
+            "type": "guidedAnalysis",
+            "definition": {
+                "version": "1",
+                "events": [
+                    {
+                        "metricId": "metrics/orders",
+                        "filters": [{"dimensionId": None}, {"dimensionId": "variables/product"}],
+                    }
+                ],
+                "peopleSegments": [{"id": "s300_people"}],
+            },
+        }
+    )
+
+
+class FakeResponse:
+    """
+    Response of the fake API, with the attributes read by the connector.
+    """
+
+    def __init__(self, payload, status_code: int = 200, headers: dict = None):
+        self.payload = payload
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+        self.headers = headers or {}
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def cja(monkeypatch):
+    """
+    CJA instance whose requests are answered by the handler set in cja.fakeApi: handler(method, path, params, body)
+    """
+    monkeypatch.setattr(
+        token_provider,
+        "get_oauth_token_and_expiry_for_config",
+        lambda config, verbose=False, **kwargs: {"token": "token", "expiry": 86400},
+    )
+    cjapy.configure(org_id="org", client_id="client", secret="secret", scopes="openid")
+    instance = cjapy.CJA()
+    instance.fakeApi = None
+
+    def request(method, url, **kwargs):
+        path = "/" + url.split("adobe.io/", 1)[-1]
+        body = json.loads(kwargs["data"]) if isinstance(kwargs.get("data"), str) else kwargs.get("json")
+        payload = instance.fakeApi(method, path, kwargs.get("params") or {}, body)
+        if isinstance(payload, FakeResponse):
+            return payload
+        return FakeResponse(payload)
+
+    instance.connector.session.request = request
+    return instance
@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from cjapy import arrowutils
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.parquet
+
+REQUEST = {
+    "dataId": "dv1",
+    "dimension": "variables/page",
+    "globalFilters": [],
+    "metricContainer": {
+        "metrics": [
+            {"columnId": "0", "id": "metrics/visits"},
+            {"columnId": "1", "id": "metrics/visits"},
+        ]
+    },
+    "settings": {"limit": 10},
+    "statistics": {},
+}
+
+
+def reportApi(method, path, params, body):
+    return {
+        "rows": [
+            {"itemId": "1", "value": "home", "data": [10, 1]},
+            {"itemId": "2", "value": "search", "data": [5.5, 2]},
+        ],
+        "columns": {"columnIds": ["0", "1"]},
+        "summaryData": {"totals": [15.5, 3]},
+        "lastPage": True,
+    }
+
+
+def test_workspace_to_arrow_keeps_the_dtypes(cja):
+    cja.fakeApi = reportApi
+    table = cja.getReport(REQUEST).to_arrow()
+    assert table.column_names == ["itemId", "variables/page", "metrics/visits", "metrics/visits.1"]
+    assert pyarrow.types.is_dictionary(table.schema.field("itemId").type)
+    assert table.schema.field("metrics/visits").type == pyarrow.float64()
+    assert table.column("metrics/visits").to_pylist() == [10.0, 5.5]
+
+
+def test_workspace_to_parquet(cja, tmp_path):
+    cja.fakeApi = reportApi
+    filename = cja.getReport(REQUEST).to_parquet(str(tmp_path / "report.parquet"))
+    df = pyarrow.parquet.read_table(filename).to_pandas()
+    assert df["metrics/visits.1"].tolist() == [1.0, 2.0]
+    assert df["variables/page"].tolist() == ["home", "search"]
+
+
+def test_nested_and_mixed_columns():
+    table = arrowutils.toArrowTable(
+        [{"id": "1", "tags": [{"name": "a"}], "value": 1}, {"id": "2", "tags": [], "value": "x"}]
+    )
+    assert table.column("tags").to_pylist() == ['[{"name": "a"}]', "[]"]
+    assert table.column("value").to_pylist() == ["1", "x"]
+
+
+def test_list_method_arrow_output(cja, tmp_path):
+    cja.fakeApi = lambda method, path, params, body: {
+        "content": [{"id": "s1", "name": "f1"}, {"id": "s2", "name": "f2"}],
+        "lastPage": True,
+    }
+    table = cja.getFilters(output="arrow")
+    assert isinstance(table, pyarrow.Table)
+    assert table.column("id").to_pylist() == ["s1", "s2"]
+    filename = cja.getFilters(output=str(tmp_path / "filters.parquet"))
+    assert pyarrow.parquet.read_table(filename).num_rows == 2
+
+
+def test_arrow_to_dataframe():
+    table = pyarrow.table({"id": ["a", "b"], "value": [1.0, 2.0]})
+    df = arrowutils.arrowToDataFrame(table)
+    assert isinstance(df["value"].dtype, pd.ArrowDtype)
+    assert arrowutils.arrowToDataFrame(table, zeroCopy=False)["value"].dtype == "float64"
+
+
+def test_missing_pyarrow_raises_a_clear_error(monkeypatch):
+    monkeypatch.setattr(arrowutils, "pyarrow", None)
+    with pytest.raises(ImportError, match=r"cjapy\[parquet\]"):
+        arrowutils.toArrowTable([{"id": "1"}])
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from cjapy.asynccja import AsyncCJA
+
+LOGS = [
+    {"id": "1", "user": {"id": "u1"}, "component": {"id": "c1", "idType": "FILTER", "name": "f1"}},
+    {"id": "2", "user": {"id": "u2"}, "component": {"id": "c2", "idType": "PROJECT", "name": "p2"}},
+    {"id": "3", "user": {"id": "u3"}, "component": {"id": "c3", "idType": "FILTER", "name": "f3"}},
+]
+
+
+def auditLogsApi(method, path, params, body):
+    page, size = params["pageNumber"], params["pageSize"]
+    content = LOGS[page * size : (page + 1) * size]
+    return {"content": content, "last": (page + 1) * size >= len(LOGS), "totalPages": 3}
+
+
+def asyncClient(cja, handler):
+    """
+    AsyncCJA whose requests are answered by the handler(method, path, params, body)
+    """
+    asyncCja = AsyncCJA(cja=cja)
+
+    async def getData(endpoint, params=None, **kwargs):
+        return handler("GET", endpoint, dict(params or {}), None)
+
+    async def postData(endpoint, data=None, params=None, **kwargs):
+        return handler("POST", endpoint, dict(params or {}), data)
+
+    asyncCja.connector.getData = getData
+    asyncCja.connector.postData = postData
+    return asyncCja
+
+
+@pytest.mark.parametrize("output", ["raw", "df"])
+@pytest.mark.parametrize("n_results", ["inf", 2])
+def test_audit_logs_match_the_sync_method(cja, output, n_results):
+    cja.fakeApi = auditLogsApi
+    asyncCja = asyncClient(cja, auditLogsApi)
+    expected = cja.getAuditLogs(pageSize=1, n_results=n_results, userType="USER", output=output)
+    result = asyncio.run(
+        asyncCja.getAuditLogs(pageSize=1, n_results=n_results, userType="USER", output=output)
+    )
+    if output == "raw":
+        assert isinstance(result, list)
+        assert result == expected
+    else:
+        assert result.equals(expected)
+        assert "componentType" in result.columns
+
+
+def test_audit_logs_send_the_user_type(cja):
+    calls = []
+
+    def fakeApi(method, path, params, body):
+        calls.append(params)
+        return auditLogsApi(method, path, params, body)
+
+    cja.fakeApi = fakeApi
+    cja.getAuditLogs(pageSize=10, userType="USER", output="raw")
+    assert calls[0]["userType"] == "USER"
+
+
+def test_projects_pages_stop_at_n_results(cja):
+    requested = []
+
+    def handler(method, path, params, body):
+        requested.append(params["page"])
+        return {"content": [{"id": f"p{params['page']}"}] * 2, "lastPage": params["page"] == 9}
+
+    asyncCja = asyncClient(cja, handler)
+    data = asyncio.run(asyncCja.getProjects(limit=2, n_results=3, output="raw"))
+    assert requested == [0, 1]
+    assert len(data) == 4
+
+
+def reportHandler(errorPage):
+    def handler(method, path, params, body):
+        page = body["settings"]["page"]
+        if page == 1:
+            return errorPage
+        return {"rows": [{"itemId": str(page), "value": "a", "data": [1]}], "lastPage": False, "totalPages": 3}
+
+    return handler
+
+
+REQUEST = {
+    "dataId": "dv_1",
+    "dimension": "variables/page",
+    "globalFilters": [],
+    "metricContainer": {"metrics": [{"columnId": "0", "id": "metrics/visits"}]},
+    "settings": {"limit": 1, "page": 0},
+    "statistics": {},
+}
+
+
+@pytest.mark.parametrize(
+    "errorPage, exception",
+    [({"error-504": "timeout"}, TimeoutError), ({"errorCode": "invalid"}, ValueError)],
+)
+def test_report_error_page_raises(cja, errorPage, exception):
+    asyncCja = asyncClient(cja, reportHandler(errorPage))
+    with pytest.raises(exception):
+        asyncio.run(asyncCja.getReport(REQUEST, limit=1, returnClass=False))
+
+
+@pytest.mark.parametrize("parallel_pages", [1, 2])
+def test_report_pages_are_in_order(cja, parallel_pages):
+    requested = []
+
+    def handler(method, path, params, body):
+        page = body["settings"]["page"]
+        requested.append(page)
+        rows = [{"itemId": str(page), "value": "a", "data": [1]}]
+        return {"rows": rows, "lastPage": page == 2, "totalPages": 3}
+
+    asyncCja = asyncClient(cja, handler)
+    request = {**REQUEST, "settings": dict(REQUEST["settings"])}
+    rows = asyncio.run(
+        asyncCja.getReport(request, limit=1, returnClass=False, parallel_pages=parallel_pages)
+    )
+    assert [row["itemId"] for row in rows] == ["0", "1", "2"]
+    assert sorted(requested) == [0, 1, 2]
+    assert request["settings"] == REQUEST["settings"]
+
+
+class RecordingCache:
+    def __init__(self):
+        self.threads = []
+        self.stored = {}
+
+    def get(self, dataRequest, params):
+        self.threads.append(threading.get_ident())
+        return self.stored.get(dataRequest["settings"]["page"])
+
+    def set(self, dataRequest, params, res):
+        self.threads.append(threading.get_ident())
+        self.stored[dataRequest["settings"]["page"]] = res
+
+
+def test_report_cache_runs_outside_the_event_loop(cja):
+    cja.reportCache = RecordingCache()
+    asyncCja = AsyncCJA(cja=cja)
+    posted = []
+
+    async def postData(endpoint, data=None, params=None, **kwargs):
+        posted.append(data)
+        return {"rows": []}
+
+    asyncCja.connector.postData = postData
+
+    async def run():
+        request = {"settings": {"page": 0}}
+        first = await asyncCja._postReport("/reports", request, {})
+        second = await asyncCja._postReport("/reports", request, {})
+        return first, second, threading.get_ident()
+
+    first, second, loopThread = asyncio.run(run())
+    assert first == second == {"rows": []}
+    assert len(posted) == 1
+    assert len(cja.reportCache.threads) == 3
+    assert loopThread not in cja.reportCache.threads
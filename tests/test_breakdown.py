@@ -0,0 +1,148 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from cjapy.breakdown import BreakdownCheckpoint, BreakdownLevel
+
+DIMENSIONS = ["variables/a", "variables/b"]
+METRICS = ["metrics/visits", "metrics/pageviews"]
+ARGS = (DIMENSIONS, {"variables/a": 2, "variables/b": 2}, METRICS, "dv_1", [])
+
+
+def breakdownApi(posts: list, failOn: str = None, delay: float = 0):
+    """
+    Report endpoint returning 2 items per request. The itemIds contain the breakdowns applied, to check the parent chain.
+    """
+    lock = threading.Lock()
+    running = [0, 0]  ## current, maximum
+
+    def api(method, path, params, body):
+        breakdowns = [f["itemId"] for f in body["metricContainer"].get("metricFilters", []) if f["type"] == "breakdown"]
+        prefix = "".join(sorted(set(breakdowns)))
+        with lock:
+            posts.append(prefix)
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(delay)
+        with lock:
+            running[0] -= 1
+        if failOn is not None and failOn in breakdowns:
+            raise RuntimeError("breakdown failed")
+        letter = body["dimension"][-1]
+        return {
+            "rows": [
+                {"itemId": f"{letter}{prefix}{k}", "value": f"{letter}-{prefix}{k}", "data": [k + 1, 2 * k + 1]}
+                for k in range(2)
+            ],
+            "lastPage": True,
+            "numberOfElements": 2,
+            "totalPages": 1,
+            "columns": {"columnIds": ["0", "1"]},
+            "summaryData": {"totals": [1, 2]},
+        }
+
+    api.maxRunning = lambda: running[1]
+    return api
+
+
+def test_breakdowns_of_a_level_run_concurrently(cja):
+    posts = []
+    cja.fakeApi = api = breakdownApi(posts, delay=0.05)
+    workspace = cja.getMultidimensionalReport(*ARGS, max_workers=2)
+    assert sorted(posts) == ["", "a0", "a1"]
+    assert api.maxRunning() == 2
+    df = workspace.dataframe
+    assert list(df.columns) == ["variables/a", "itemId", "variables/b"] + METRICS
+    ## the rows follow the order of the parents, whatever the order of completion
+    assert df["variables/a"].tolist() == ["a-0", "a-0", "a-1", "a-1"]
+    assert df["itemId"].tolist() == ["ba00", "ba01", "ba10", "ba11"]
+    assert workspace.errors == []
+
+
+def test_deep_breakdowns_filter_on_every_ancestor(cja):
+    posts = []
+    cja.fakeApi = breakdownApi(posts)
+    dimensions = DIMENSIONS + ["variables/c"]
+    limits = {dimension: 2 for dimension in dimensions}
+    workspace = cja.getMultidimensionalReport(dimensions, limits, METRICS, "dv_1", [])
+    ## the third level is filtered on the item of the first and second levels
+    assert sorted(prefix for prefix in posts if len(prefix) > 2) == ["a0ba00", "a0ba01", "a1ba10", "a1ba11"]
+    assert len(workspace.dataframe) == 8
+    assert workspace.dataframe.iloc[0][["variables/a", "variables/b"]].tolist() == ["a-0", "b-a00"]
+
+
+def test_failed_breakdown_does_not_stop_the_others(cja):
+    posts = []
+    cja.fakeApi = breakdownApi(posts, failOn="a0")
+    workspace = cja.getMultidimensionalReport(*ARGS, max_workers=2)
+    assert len(workspace.errors) == 1
+    assert workspace.errors[0]["level"] == 1
+    assert workspace.errors[0]["breakdown"] == ["variables/a:::a0"]
+    assert workspace.dataframe["variables/a"].tolist() == ["a-1", "a-1"]
+
+
+def test_progress_callback(cja):
+    events = []
+    cja.fakeApi = breakdownApi([])
+    cja.getMultidimensionalReport(*ARGS, max_workers=2, progress=events.append)
+    assert [(event["level"], event["total"]) for event in events] == [(0, 1), (1, 2), (1, 2)]
+    assert events[-1]["done"] == 2
+
+
+def test_level_dataframe():
+    level = BreakdownLevel(1, DIMENSIONS, METRICS)
+    level.add((("variables/a", "1", "A1"),), {"itemId": ["10", "11"], "value": ["B10", "B11"], "data": np.array([[1, 2], [3, 4]])})
+    level.add((("variables/a", "2", "A2"),), {"itemId": [], "value": [], "data": np.empty((0, 2))})
+    df = level.to_dataframe()
+    assert list(df.columns) == ["variables/a", "itemId", "variables/b"] + METRICS
+    assert df["variables/a"].tolist() == ["A1", "A1"]
+    assert df[METRICS].dtypes.tolist() == [np.float64, np.float64]
+    assert level.getChildren() == [
+        (("variables/a", "1", "A1"), ("variables/b", "10", "B10")),
+        (("variables/a", "1", "A1"), ("variables/b", "11", "B11")),
+    ]
+
+
+def test_levels_are_written_to_disk(cja, tmp_path):
+    cja.fakeApi = breakdownApi([])
+    workspace = cja.getMultidimensionalReport(*ARGS, levelsPath=tmp_path)
+    first = pd.read_csv(tmp_path / "level_0_variables_a.csv")
+    assert first["itemId"].tolist() == ["a0", "a1"]
+    last = pd.read_csv(tmp_path / "level_1_variables_b.csv", dtype={"itemId": str})
+    assert last["itemId"].tolist() == workspace.dataframe["itemId"].tolist()
+    assert last[METRICS].values.tolist() == workspace.dataframe[METRICS].values.tolist()
+
+
+def test_checkpoint_save_and_get(tmp_path):
+    checkpoint = BreakdownCheckpoint(tmp_path / "checkpoint")
+    key = checkpoint.getKey({"dimension": "variables/a"}, 10)
+    assert key == checkpoint.getKey({"dimension": "variables/a"}, "10")
+    assert checkpoint.get(1, key) is None
+    checkpoint.save(1, key, {"itemId": ["1"], "value": ["x"], "data": np.array([[1.0, 2.0]])})
+    result = checkpoint.get(1, key)
+    assert result["itemId"] == ["1"]
+    assert result["data"].dtype == np.float64
+    assert result["data"].tolist() == [[1.0, 2.0]]
+    assert list((tmp_path / "checkpoint" / "level_1").glob("*.tmp")) == []
+    checkpoint.clear()
+    assert (tmp_path / "checkpoint").exists() == False
+
+
+def test_checkpoint_resume(cja, tmp_path):
+    checkpointPath = tmp_path / "checkpoint"
+    posts = []
+    cja.fakeApi = breakdownApi(posts, failOn="a0")
+    first = cja.getMultidimensionalReport(*ARGS, checkpointPath=checkpointPath)
+    assert len(first.errors) == 1
+    assert checkpointPath.exists()
+    ## the rerun only requests the breakdown that failed
+    posts.clear()
+    cja.fakeApi = breakdownApi(posts)
+    resumed = cja.getMultidimensionalReport(*ARGS, checkpointPath=checkpointPath)
+    assert posts == ["a0"]
+    assert resumed.errors == []
+    assert checkpointPath.exists() == False
+    full = cja.getMultidimensionalReport(*ARGS)
+    assert resumed.dataframe.equals(full.dataframe)
@@ -0,0 +1,86 @@
+import time
+
+from cjapy.cache import MetadataCache
+
+
+def test_get_returns_a_copy():
+    cache = MetadataCache()
+    cache.set(("filter", "s1", False), {"id": "s1", "tags": []})
+    cache.get(("filter", "s1", False))["tags"].append("changed")
+    assert cache.get(("filter", "s1", False)) == {"id": "s1", "tags": []}
+
+
+def test_ttl(monkeypatch):
+    cache = MetadataCache(ttl=10)
+    cache.set(("filter", "s1"), {"id": "s1"})
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get(("filter", "s1")) is None
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = MetadataCache(maxSize=2)
+    cache.set(("filter", "a"), {"id": "a"})
+    cache.set(("filter", "b"), {"id": "b"})
+    cache.get(("filter", "a"))
+    cache.set(("filter", "c"), {"id": "c"})
+    assert cache.get(("filter", "b")) is None
+    assert cache.get(("filter", "a")) == {"id": "a"}
+    assert cache.get(("filter", "c")) == {"id": "c"}
+
+
+def test_invalidate_by_prefix():
+    cache = MetadataCache()
+    cache.set(("filter", "s1", True), {"id": "s1"})
+    cache.set(("filter", "s1", False), {"id": "s1"})
+    cache.set(("filter", "s2", False), {"id": "s2"})
+    assert cache.invalidate("filter", "s1") == 2
+    assert cache.get(("filter", "s2", False)) == {"id": "s2"}
+
+
+def test_disabled_cache():
+    cache = MetadataCache(ttl=0)
+    cache.set(("filter", "s1"), {"id": "s1"})
+    assert cache.get(("filter", "s1")) is None
+    assert len(cache) == 0
+
+
+def test_stats():
+    cache = MetadataCache()
+    cache.get(("filter", "s1"))
+    cache.set(("filter", "s1"), {"id": "s1"})
+    cache.get(("filter", "s1"))
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+    cache.clear()
+    assert cache.stats() == {"size": 0, "hits": 0, "misses": 0}
+
+
+def test_getter_is_served_from_the_cache(cja):
+    calls = []
+
+    def api(method, path, params, body):
+        calls.append(path)
+        return {"id": "s1", "name": "Filter 1", "definition": {}}
+
+    cja.fakeApi = api
+    cja.metadataCache.ttl = 300
+    assert cja.getFilter("s1", full=True)["name"] == "Filter 1"
+    assert cja.getFilter("s1", full=True)["name"] == "Filter 1"
+    assert calls == ["/filters/s1"]
+    cja.getFilter("s1", full=True, useMetadataCache=False)
+    assert calls == ["/filters/s1", "/filters/s1"]
+
+
+def test_metadata_cache_is_disabled_by_default(cja):
+    calls = []
+
+    def api(method, path, params, body):
+        calls.append(path)
+        return {"id": "s1", "name": "Filter 1", "definition": {}}
+
+    cja.fakeApi = api
+    assert cja.metadataCache.enabled == False
+    cja.getFilter("s1", full=True)
+    cja.getFilter("s1", full=True)
+    assert calls == ["/filters/s1", "/filters/s1"]
@@ -0,0 +1,95 @@
+import pytest
+
+from cjapy.componentgraph import ComponentDependencyGraph
+from cjapy.componentindex import ComponentUsageIndex
+
+from conftest import desktopProject
+
+FILTERS = [
+    {"id": "s300_a", "name": "Filter A", "definition": {"func": "attr", "name": "variables/page"}},
+    {"id": "s300_b", "name": "Filter B", "definition": {"func": "segment-ref", "id": "cm300_x"}},
+]
+CALCULATED_METRICS = [
+    {
+        "id": "cm300_x",
+        "name": "CM X",
+        "definition": {"formula": {"segment_id": "s300_a", "metric": {"name": "metrics/visits"}}},
+    }
+]
+PROJECTS = [
+    {"id": "p1", "name": "Project 1", "calculatedMetrics": ["cm300_x"]},
+    {"id": "p2", "name": "Project 2", "filters": ["s300_b"], "dimensions": ["variables/product"]},
+]
+
+
+@pytest.fixture
+def graph():
+    index = ComponentUsageIndex()
+    index.build(FILTERS, CALCULATED_METRICS, PROJECTS)
+    return ComponentDependencyGraph(index)
+
+
+def test_transitive_dependents(graph):
+    elements = graph.getDependents("variables/page", output="raw")
+    assert [(element["id"], element["depth"], element["via"]) for element in elements] == [
+        ("s300_a", 1, "variables/page"),
+        ("cm300_x", 2, "s300_a"),
+        ("s300_b", 3, "cm300_x"),
+        ("p1", 3, "cm300_x"),
+        ("p2", 4, "s300_b"),
+    ]
+
+
+def test_max_depth(graph):
+    assert graph.getDependents("variables/page", maxDepth=1) == {"filters": [{"Filter A": "s300_a"}]}
+
+
+def test_dependencies(graph):
+    dependencies = graph.getDependencies("p2")
+    assert dependencies["filters"] == [{"Filter B": "s300_b"}, {"Filter A": "s300_a"}]
+    assert dependencies["calculatedMetrics"] == [{"CM X": "cm300_x"}]
+    assert {"variables/page": "variables/page"} in dependencies["dimensions"]
+
+
+def test_cycle_is_traversed_once():
+    index = ComponentUsageIndex()
+    index.build(
+        [
+            {"id": "s300_a", "name": "A", "definition": {"id": "cm300_b"}},
+            {"id": "s300_c", "name": "C", "definition": {"name": "variables/page"}},
+        ],
+        [{"id": "cm300_b", "name": "B", "definition": {"segment_id": "s300_a", "other": "s300_c"}}],
+        [{"id": "p1", "name": "P", "filters": ["s300_a"]}],
+    )
+    graph = ComponentDependencyGraph(index)
+    dependents = graph.getDependents("variables/page", output="raw")
+    assert sorted(element["id"] for element in dependents) == ["cm300_b", "p1", "s300_a", "s300_c"]
+    dependencies = graph.getDependencies("s300_a", output="raw")
+    assert sorted(element["id"] for element in dependencies) == ["cm300_b", "s300_c", "variables/page"]
+
+
+def test_graph_follows_index_updates(graph):
+    graph.index.removeCalculatedMetric("cm300_x")
+    assert graph.getDependents("variables/page") == {"filters": [{"Filter A": "s300_a"}]}
+
+
+def test_impact(graph):
+    df = graph.getImpact(["variables/page", "metrics/visits"])
+    assert list(df.columns) == ["component", "id", "name", "type", "depth", "via"]
+    assert set(df[df["component"] == "metrics/visits"]["id"]) == {"cm300_x", "s300_b", "p1", "p2"}
+    assert len(graph.getImpact([])) == 0
+
+
+def test_find_components_usage_recursion_is_transitive(cja):
+    result = cja.findComponentsUsage(
+        ["variables/page"],
+        projectDetails=[
+            desktopProject("p1", dimension="variables/product", metrics=(), calculatedMetrics=("cm300_x",)),
+            desktopProject("p2", dimension="variables/product", metrics=(), filters=("s300_b",)),
+        ],
+        filters=FILTERS,
+        calculatedMetrics=CALCULATED_METRICS,
+        recursive=True,
+    )
+    assert result["variables/page"]["filters"] == [{"Filter A": "s300_a"}]
+    assert result["recursion"]["s300_a"] == [{"Project p1": "p1"}, {"Project p2": "p2"}]
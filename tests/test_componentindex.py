@@ -0,0 +1,78 @@
+import pytest
+
+from cjapy.componentindex import ComponentUsageIndex
+
+from conftest import desktopProject, guidedAnalysisProject, mobileProject
+
+FILTERS = [
+    {"id": "s300_a", "name": "Filter A", "definition": {"func": "attr", "name": "variables/page"}},
+    {"id": "s300_b", "name": "Filter B", "definition": {"func": "segment-ref", "id": "cm300_x"}},
+]
+CALCULATED_METRICS = [
+    {
+        "id": "cm300_x",
+        "name": "CM X",
+        "definition": {"formula": {"func": "segment", "segment_id": "s300_a", "metric": {"name": "metrics/visits"}}},
+    }
+]
+
+
+def test_extract_project_components_all_project_types():
+    assert ComponentUsageIndex.extractProjectComponents(mobileProject()) == []
+    guided = ComponentUsageIndex.extractProjectComponents(guidedAnalysisProject())
+    assert None not in guided
+    assert set(guided) == {"metrics/orders", "variables/product", "s300_people"}
+    desktop = ComponentUsageIndex.extractProjectComponents(desktopProject(filters=("s300_a",)))
+    assert {"variables/page", "metrics/visits", "s300_a", "dv_1"} <= set(desktop)
+
+
+def test_build_with_desktop_mobile_and_guided_analysis_projects():
+    index = ComponentUsageIndex()
+    index.build(FILTERS, CALCULATED_METRICS, [desktopProject(), mobileProject(), guidedAnalysisProject()])
+    assert index.getUsage("variables/page") == {
+        "filters": [{"Filter A": "s300_a"}],
+        "calculatedMetrics": [],
+        "projects": [{"Project p1": "p1"}],
+    }
+    assert index.getUsage("variables/product")["projects"] == [{"Guided": "p3"}]
+    assert index.getComponents("projects", "p2") == []
+
+
+def test_data_view_suffix_is_indexed_with_and_without_suffix():
+    index = ComponentUsageIndex()
+    project = desktopProject()
+    project.elementsUsed["dimensions"] = ["variables/page::dv_1"]
+    index.updateProject(project)
+    assert index.getUsage("variables/page::dv_1")["projects"] == [{"Project p1": "p1"}]
+    assert index.getUsage("variables/page")["projects"] == [{"Project p1": "p1"}]
+
+
+def test_incremental_update_and_remove():
+    index = ComponentUsageIndex()
+    index.build(FILTERS, CALCULATED_METRICS, [desktopProject()])
+    index.updateFilter({"id": "s300_a", "name": "Filter A", "definition": {"func": "attr", "name": "variables/browser"}})
+    assert index.getUsage("variables/page")["filters"] == []
+    assert index.getUsage("variables/browser")["filters"] == [{"Filter A": "s300_a"}]
+    assert index.removeProject("p1")
+    assert index.removeProject("p1") == False
+    assert "variables/page" not in index
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "index.json"
+    index = ComponentUsageIndex(path)
+    index.build(FILTERS, CALCULATED_METRICS, [desktopProject(), mobileProject()])
+    index.save()
+    loaded = ComponentUsageIndex(path)
+    assert len(loaded) == len(index)
+    assert loaded.getUsage("metrics/visits") == index.getUsage("metrics/visits")
+
+
+def test_extract_components_from_string_definition():
+    assert ComponentUsageIndex.extractComponents('{"name": "variables/page"}') == ["variables/page"]
+    assert ComponentUsageIndex.extractComponents("not json variables/page s300_a") == ["variables/page", "s300_a"]
+
+
+def test_update_filter_requires_definition():
+    with pytest.raises(ValueError):
+        ComponentUsageIndex().updateFilter({"id": "s300_a"})
@@ -0,0 +1,70 @@
+import random
+import re
+
+import pytest
+
+from cjapy.componentmatcher import ComponentMatcher
+
+IDS = [
+    "variables/page",
+    "page",
+    "variables/pagename",
+    "metrics/visits",
+    "metrics/visitor",
+    "s300_abc",
+    "s300_abc_2",
+    "cm300_x",
+    "pa",
+    "e",
+]
+
+
+def searchEach(components, text):
+    """Previous behavior of findComponentsUsage: one re.search per component."""
+    return {comp for comp in components if re.search(f"{comp}", text)}
+
+
+@pytest.mark.parametrize(
+    "components",
+    [
+        ["variables/page", "page", "pa", "metrics/visit", "v.s", "s300_abc", "e"],
+        ["p.ge", "^var", "page$", "visit(s|or)"],
+        ["(pa)ge", r"vis\w+"],
+        ["page", "page"],
+        ["x*"],
+        ["(?i)PAGE"],
+    ],
+)
+def test_same_result_as_re_search(components):
+    random.seed(42)
+    matcher = ComponentMatcher(components)
+    for _ in range(300):
+        text = " ".join(random.sample(IDS + ["zzz"] * 5, 4))
+        assert matcher.findAll(text) == searchEach(components, text)
+
+
+def test_overlapping_components_at_the_same_position():
+    matcher = ComponentMatcher(["variables/page", "variables/pagename", "variables", "page"])
+    assert matcher.findAll("{'name': 'variables/pagename'}") == {
+        "variables/page",
+        "variables/pagename",
+        "variables",
+        "page",
+    }
+
+
+def test_count_all_counts_the_elements():
+    matcher = ComponentMatcher(["page", "visits"])
+    counts = matcher.countAll(["variables/page", "variables/pagename", "metrics/visits"])
+    assert counts["page"] == 2
+    assert counts["visits"] == 1
+    assert counts["other"] == 0
+
+
+def test_empty_components():
+    assert ComponentMatcher([]).findAll("variables/page") == set()
+
+
+def test_invalid_regex_raises_like_re_search():
+    with pytest.raises(re.error):
+        ComponentMatcher(["a(b"])
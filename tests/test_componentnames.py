@@ -0,0 +1,90 @@
+FILTERS = {
+    "s1@AdobeOrg_1": "Visitors from France",
+    "s1@AdobeOrg_2": "Mobile visits",
+}
+CALCULATED_METRICS = {
+    "cm1_1": "Conversion rate",
+    "cm1_2": "Bounce rate",
+}
+
+
+def componentsApi(calls, hidden=()):
+    def fakeApi(method, path, params, body):
+        calls.append((method, path))
+        if path in ("/filters", "/calculatedmetrics"):
+            components = FILTERS if path == "/filters" else CALCULATED_METRICS
+            ids = params["filterByIds"].split(",")
+            content = [
+                {"id": componentId, "name": components[componentId]}
+                for componentId in ids
+                if componentId in components and componentId not in hidden
+            ]
+            return {"content": content, "lastPage": True}
+        if path.startswith("/filters/"):
+            componentId = path.split("/")[-1]
+            return {"id": componentId, "name": FILTERS[componentId]}
+        if path.startswith("/calculatedmetrics/"):
+            componentId = path.split("/")[-1]
+            return {"id": componentId, "name": CALCULATED_METRICS[componentId]}
+        if path == "/reports":
+            return {
+                "rows": [{"itemId": "1", "value": "home", "data": [10, 0.5]}],
+                "lastPage": True,
+                "numberOfElements": 1,
+                "totalPages": 1,
+                "columns": {"columnIds": ["0", "1"]},
+                "summaryData": {"totals": [10, 0.5], "filteredTotals": [10, 0.5]},
+            }
+        raise AssertionError(f"unexpected request {method} {path}")
+
+    return fakeApi
+
+
+def test_one_bulk_request_per_type(cja):
+    calls = []
+    cja.fakeApi = componentsApi(calls)
+    names = cja.resolveComponentNames(
+        list(FILTERS) + list(CALCULATED_METRICS) + ["metrics/visits", "s1@AdobeOrg_1"]
+    )
+    assert names == {**FILTERS, **CALCULATED_METRICS, "metrics/visits": "metrics/visits"}
+    assert sorted(path for _, path in calls) == ["/calculatedmetrics", "/filters"]
+
+
+def test_chunks(cja):
+    calls = []
+    cja.fakeApi = componentsApi(calls)
+    cja.resolveComponentNames(list(FILTERS), chunkSize=1)
+    assert [path for _, path in calls] == ["/filters", "/filters"]
+
+
+def test_missing_components_are_requested_one_by_one(cja):
+    calls = []
+    cja.fakeApi = componentsApi(calls, hidden={"s1@AdobeOrg_2"})
+    names = cja.resolveComponentNames(list(FILTERS))
+    assert names == FILTERS
+    assert ("GET", "/filters/s1@AdobeOrg_2") in calls
+
+
+def test_report_resolves_the_names_in_bulk(cja):
+    calls = []
+    cja.fakeApi = componentsApi(calls)
+    request = {
+        "dataId": "dv_1",
+        "dimension": "variables/page",
+        "globalFilters": [
+            {"type": "segment", "segmentId": "s1@AdobeOrg_1"},
+            {"type": "dateRange", "dateRange": "2023-01-01T00:00:00.000/2023-02-01T00:00:00.000"},
+        ],
+        "settings": {},
+        "statistics": {},
+        "metricContainer": {
+            "metrics": [
+                {"columnId": "0", "id": "metrics/visits"},
+                {"columnId": "1", "id": "cm1_1"},
+            ]
+        },
+    }
+    workspace = cja.getReport(request)
+    assert "Conversion rate" in workspace.dataframe.columns
+    single = [path for _, path in calls if path.count("/") > 1]
+    assert single == []
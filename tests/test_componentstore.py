@@ -0,0 +1,43 @@
+import sqlite3
+
+from cjapy.componentstore import ComponentStore
+
+
+def test_full_read_skips_summary_records(cja, tmp_path):
+    store = ComponentStore(tmp_path / "store.sqlite")
+    store._save("filter", [{"id": "s1", "name": "summary"}], full=False)
+    cja.componentStore = store
+    calls = []
+
+    def fakeApi(method, path, params, body):
+        calls.append(params)
+        return {"id": "s1", "name": "api", "definition": {}}
+
+    cja.fakeApi = fakeApi
+    assert cja.getFilter("s1", full=False)["name"] == "summary"
+    assert cja.getFilter("s1", full=True)["name"] == "api"
+    assert len(calls) == 1 and "expansion" in calls[0]
+
+
+def test_full_records_serve_both_reads(tmp_path):
+    store = ComponentStore(tmp_path / "store.sqlite")
+    store._save("filter", [{"id": "s1", "definition": {}}])
+    assert store.getComponent("filter", "s1", full=True) == {"id": "s1", "definition": {}}
+    assert store.getComponent("filter", "s1", full=False) == {"id": "s1", "definition": {}}
+
+
+def test_store_without_full_column_is_migrated(tmp_path):
+    path = tmp_path / "store.sqlite"
+    connection = sqlite3.connect(str(path))
+    connection.execute(
+        "CREATE TABLE components (type TEXT NOT NULL, scope TEXT NOT NULL, id TEXT NOT NULL, "
+        "name TEXT, modified TEXT, definition TEXT NOT NULL, PRIMARY KEY (type, scope, id))"
+    )
+    connection.execute(
+        "INSERT INTO components VALUES ('filter', '', 's1', 'old', NULL, '{\"id\": \"s1\"}')"
+    )
+    connection.commit()
+    connection.close()
+    store = ComponentStore(path)
+    assert store.getComponent("filter", "s1", full=True) is None
+    assert store.getComponent("filter", "s1") == {"id": "s1"}
@@ -0,0 +1,40 @@
+import cjapy
+from cjapy import token_provider
+
+
+def test_requests_share_the_pooled_session(cja):
+    calls = []
+
+    def fakeApi(method, path, params, body):
+        calls.append(method)
+        return {"id": "s1"}
+
+    cja.fakeApi = fakeApi
+    session = cja.connector.session
+    cja.getFilter("s1")
+    cja.connector.postData(cja.endpoint + "/filters", data={"name": "f"})
+    cja.connector.putData(cja.endpoint + "/filters/s1", data={"name": "f"})
+    assert [method.upper() for method in calls] == ["GET", "POST", "PUT"]
+    assert cja.connector.session is session
+
+
+def test_pool_settings(monkeypatch):
+    monkeypatch.setattr(
+        token_provider,
+        "get_oauth_token_and_expiry_for_config",
+        lambda config, verbose=False, **kwargs: {"token": "token", "expiry": 86400},
+    )
+    cjapy.configure(org_id="org", client_id="client", secret="secret", scopes="openid")
+    instance = cjapy.CJA(poolSize=3, poolBlock=True)
+    adapter = instance.connector.session.get_adapter("https://cja.adobe.io")
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block == True
+    instance.close()
+
+
+def test_context_manager_closes_the_pool(cja):
+    with cja:
+        assert cja.connector._finalizer.alive
+    assert cja.connector._finalizer.alive == False
+    ## closing twice is harmless
+    cja.close()
@@ -0,0 +1,46 @@
+def pagedApi(calls, nbPages=3, pageKey="page", lastKey="lastPage"):
+    def fakeApi(method, path, params, body):
+        page = params[pageKey]
+        calls.append(page)
+        return {"content": [{"id": f"{page}-{i}"} for i in range(2)], lastKey: page == nbPages - 1}
+
+    return fakeApi
+
+
+def test_iter_is_lazy(cja):
+    calls = []
+    cja.fakeApi = pagedApi(calls)
+    filters = cja.getFilters(output="iter")
+    assert calls == []
+    assert next(filters) == {"id": "0-0"}
+    assert calls == [0]
+    next(filters)
+    next(filters)
+    assert calls == [0, 1]
+    assert [element["id"] for element in filters] == ["1-1", "2-0", "2-1"]
+    assert calls == [0, 1, 2]
+
+
+def test_iter_projects_stop_at_n_results(cja):
+    calls = []
+    cja.fakeApi = pagedApi(calls, nbPages=10)
+    projects = list(cja.getProjects(limit=2, n_results=3, output="iter"))
+    assert calls == [0, 1]
+    assert len(projects) == 4
+
+
+def test_iter_audit_logs(cja):
+    calls = []
+    cja.fakeApi = pagedApi(calls, pageKey="pageNumber", lastKey="last")
+    logs = cja.getAuditLogs(pageSize=2, output="iter")
+    assert [log["id"] for log in logs] == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+
+
+def test_iter_concurrent_pages_in_order(cja):
+    def fakeApi(method, path, params, body):
+        page = params["page"]
+        return {"content": [{"id": page}], "lastPage": page == 5, "totalPages": 6}
+
+    cja.fakeApi = fakeApi
+    annotations = cja.getAnnotations(output="iter", max_workers=3)
+    assert [annotation["id"] for annotation in annotations] == [0, 1, 2, 3, 4, 5]
@@ -0,0 +1,50 @@
+def test_audit_logs_estimate_pages_with_the_page_size(cja):
+    requested = []
+
+    def fakeApi(method, path, params, body):
+        requested.append(params["pageNumber"])
+        ## the first page is not full, the estimate must rely on the pageSize requested
+        size = 1 if params["pageNumber"] == 0 else params["pageSize"]
+        return {"content": [{"id": str(i)} for i in range(size)], "last": False, "totalPages": 10}
+
+    cja.fakeApi = fakeApi
+    logs = cja.getAuditLogs(pageSize=5, n_results=10, max_workers=4, output="raw")
+    assert sorted(requested) == [0, 1]
+    assert len(logs) == 6
+
+
+def test_list_endpoints_estimate_pages_with_the_limit(cja):
+    requested = []
+
+    def fakeApi(method, path, params, body):
+        requested.append(params["page"])
+        size = 1 if params["page"] == 0 else params["limit"]
+        return {"content": [{"id": str(i)} for i in range(size)], "lastPage": False, "totalPages": 10}
+
+    cja.fakeApi = fakeApi
+    data = cja._getAllPages("/annotations", {"limit": 5, "page": 0}, n_results=10, max_workers=4)
+    assert sorted(requested) == [0, 1]
+    assert len(data) == 6
+
+
+def test_concurrent_pages_keep_the_page_order(cja):
+    def fakeApi(method, path, params, body):
+        page = params["page"]
+        return {"content": [{"id": f"s{page}"}], "lastPage": page == 4, "totalPages": 5}
+
+    cja.fakeApi = fakeApi
+    filters = cja.getFilters(max_workers=3, output="raw")
+    assert [element["id"] for element in filters] == ["s0", "s1", "s2", "s3", "s4"]
+
+
+def test_annotations_send_the_limit(cja):
+    calls = []
+
+    def fakeApi(method, path, params, body):
+        calls.append(dict(params))
+        return {"content": [{"id": str(params["page"])}] * 2, "lastPage": params["page"] == 1, "totalPages": 2}
+
+    cja.fakeApi = fakeApi
+    annotations = cja.getAnnotations(limit=2, max_workers=2)
+    assert len(annotations) == 4
+    assert all(call["limit"] == 2 for call in calls)
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+
+OWNER = {"name": "owner", "imsUserId": "1", "login": "owner@example.com"}
+
+
+def projectsApi(failOn: str = None, delay: float = 0):
+    """
+    Projects endpoint returning a mobile project for each ID, slower for the first projects so they complete out of order.
+    """
+    lock = threading.Lock()
+    running = [0, 0]  ## current, maximum
+
+    def api(method, path, params, body):
+        projectId = path.rsplit("/", 1)[-1]
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(delay * (5 - int(projectId[1:])))
+        with lock:
+            running[0] -= 1
+        if projectId == failOn:
+            raise RuntimeError("project failed")
+        return {
+            "id": projectId,
+            "name": f"Project {projectId}",
+            "owner": OWNER,
+            "type": "project",
+            "definition": {"device": "cell", "version": "1"},
+        }
+
+    api.maxRunning = lambda: running[1]
+    return api
+
+
+PROJECTS = [{"id": f"p{index}", "name": f"Project p{index}", "owner": OWNER} for index in range(1, 5)]
+
+
+def test_projects_are_retrieved_concurrently_in_order(cja):
+    cja.fakeApi = api = projectsApi(delay=0.02)
+    details = cja.getAllProjectDetails(PROJECTS, max_workers=4)
+    assert list(details.keys()) == ["p1", "p2", "p3", "p4"]
+    assert details["p3"].name == "Project p3"
+    assert api.maxRunning() > 1
+    assert cja.projectsDetails == details
+
+
+def test_failed_project_does_not_stop_the_others(cja):
+    events = []
+    cja.fakeApi = projectsApi(failOn="p2")
+    details = cja.getAllProjectDetails(PROJECTS, max_workers=2, progress=events.append, output="list")
+    assert [project.id for project in details] == ["p1", "p3", "p4"]
+    assert list(cja.projectsDetailsErrors.keys()) == ["p2"]
+    assert len(events) == 4
+    assert events[-1]["done"] == 4 and events[-1]["errors"] == 1
+
+
+def test_list_of_project_ids(cja):
+    cja.fakeApi = projectsApi()
+    details = cja.getAllProjectDetails(["p4", "p1"])
+    assert list(details.keys()) == ["p4", "p1"]
+
+
+def snapshotApi(catalog: dict, fetched: list):
+    """
+    Projects endpoints: the list of projects with their modified date, and the details of each project.
+    """
+
+    def api(method, path, params, body):
+        if path.endswith("/projects"):
+            return [
+                {"id": projectId, "name": f"Project {projectId}", "owner": OWNER, "modified": modified}
+                for projectId, modified in catalog.items()
+            ]
+        projectId = path.rsplit("/", 1)[-1]
+        fetched.append(projectId)
+        return {
+            "id": projectId,
+            "name": f"Project {projectId}",
+            "owner": OWNER,
+            "type": "project",
+            "modified": catalog[projectId],
+            "definition": {"device": "cell", "version": "1"},
+        }
+
+    return api
+
+
+def test_snapshot_refreshes_only_the_modified_projects(cja, tmp_path):
+    snapshotPath = tmp_path / "snapshot.json"
+    catalog = {"p1": "2026-01-01", "p2": "2026-01-01", "p3": "2026-01-01"}
+    fetched = []
+    cja.fakeApi = snapshotApi(catalog, fetched)
+    cja.getAllProjectDetails(snapshot=snapshotPath, useAttribute=False)
+    assert sorted(fetched) == ["p1", "p2", "p3"]
+    ## p2 modified, p3 deleted, p4 created
+    catalog.update({"p2": "2026-02-01", "p4": "2026-02-01"})
+    del catalog["p3"]
+    fetched.clear()
+    cja.projectsDetails = {}  ## a new session: only the snapshot is available
+    details = cja.getAllProjectDetails(snapshot=snapshotPath, useAttribute=False)
+    assert sorted(fetched) == ["p2", "p4"]
+    assert list(details.keys()) == ["p1", "p2", "p4"]
+    assert details["p2"].modified == "2026-02-01"
+    saved = json.loads(snapshotPath.read_text())["projects"]
+    assert sorted(saved.keys()) == ["p1", "p2", "p4"]
+
+
+def test_unchanged_projects_are_reused_from_the_instance(cja, tmp_path):
+    catalog = {"p1": "2026-01-01"}
+    fetched = []
+    cja.fakeApi = snapshotApi(catalog, fetched)
+    first = cja.getAllProjectDetails(snapshot=tmp_path / "snapshot.json", useAttribute=False)
+    second = cja.getAllProjectDetails(snapshot=tmp_path / "snapshot.json", useAttribute=False)
+    assert fetched == ["p1"]
+    assert second["p1"] is first["p1"]
@@ -0,0 +1,59 @@
+import time
+
+from cjapy.connector import RateLimiter
+
+
+def test_default_bucket_is_shared_by_all_families(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    limiter = RateLimiter()
+    endpoints = ["/reports", "/filters", "/projects", "/auditlogs/api/v1/auditlogs", "/dataviews"] * 2
+    assert [limiter.reserve(endpoint) for endpoint in endpoints] == [0] * 10
+    ## 12 requests per 6 seconds with the 0.9 safety margin: 10.8 tokens for the whole organization
+    assert limiter.reserve("/calculatedmetrics") > 0
+    assert {limiter.getFamily(endpoint) for endpoint in endpoints} == {"default"}
+
+
+def test_family_limits_are_opt_in(monkeypatch):
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    limiter = RateLimiter(RateLimiter.FAMILY_LIMITS)
+    assert limiter.getFamily("https://cja.adobe.io/reports") == "/reports"
+    assert all(limiter.reserve("/reports") == 0 for _ in range(10))
+    assert limiter.reserve("/reports") > 0
+    assert limiter.reserve("/filters") == 0
+
+
+def test_tokens_refill_over_the_period(monkeypatch):
+    clock = [time.monotonic()]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    limiter = RateLimiter({"default": {"requests": 2, "period": 2}}, safetyMargin=1)
+    assert limiter.reserve("/filters") == 0
+    assert limiter.reserve("/filters") == 0
+    assert limiter.reserve("/filters") == 1
+    clock[0] += 3
+    assert limiter.reserve("/filters") == 0
+
+
+def test_no_default_family():
+    limiter = RateLimiter({"/reports": {"requests": 1, "period": 60}})
+    assert limiter.getFamily("/filters") is None
+    assert all(limiter.reserve("/filters") == 0 for _ in range(5))
+
+
+def test_connector_acquires_before_each_request(cja):
+    endpoints = []
+
+    class Limiter:
+        def acquire(self, endpoint):
+            endpoints.append(endpoint)
+            return 0
+
+    cja.connector.rateLimiter = Limiter()
+    cja.fakeApi = lambda method, path, params, body: {"id": "s1"}
+    cja.getFilter("s1")
+    assert len(endpoints) == 1 and endpoints[0].endswith("/filters/s1")
+
+
+def test_shared_instance():
+    assert RateLimiter.shared() is RateLimiter.shared()
@@ -0,0 +1,133 @@
+import datetime
+import os
+import time
+
+import pytest
+
+from cjapy.reportcache import DiskReportBackend, MemoryReportBackend, ReportCache
+
+
+def reportRequest(end: datetime.datetime):
+    start = end - datetime.timedelta(days=7)
+    return {
+        "dataId": "dv_1",
+        "dimension": "variables/page",
+        "globalFilters": [{"type": "dateRange", "dateRange": f"{start.isoformat()}/{end.isoformat()}"}],
+        "metricContainer": {"metrics": [{"columnId": "0", "id": "metrics/visits"}]},
+    }
+
+
+CLOSED = reportRequest(datetime.datetime(2020, 2, 1))
+OPEN = reportRequest(datetime.datetime.now() + datetime.timedelta(days=1))
+
+
+def test_key_does_not_depend_on_the_keys_order():
+    reordered = dict(reversed(list(CLOSED.items())))
+    assert ReportCache.getKey(CLOSED, {"a": 1}) == ReportCache.getKey(reordered, {"a": 1})
+    assert ReportCache.getKey(CLOSED) != ReportCache.getKey(CLOSED, {"page": 1})
+
+
+def test_ttl_of_closed_and_open_date_ranges():
+    cache = ReportCache(ttl=100, ttlToday=5)
+    assert cache.getTTL(CLOSED) == 100
+    assert cache.getTTL(OPEN) == 5
+    assert cache.getTTL({"globalFilters": []}) == 5
+    assert cache.getTTL({"globalFilters": [{"type": "dateRange", "dateRange": "invalid"}]}) == 5
+
+
+def test_errors_are_not_cached():
+    cache = ReportCache()
+    cache.set(CLOSED, None, {"errorCode": "400"})
+    cache.set(CLOSED, None, {"error-504": "504 Gateway Time-out"})
+    assert cache.get(CLOSED) is None
+    cache.set(CLOSED, None, {"rows": []})
+    assert cache.get(CLOSED) == {"rows": []}
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_cached_response_is_a_copy():
+    cache = ReportCache()
+    cache.set(CLOSED, None, {"rows": [1]})
+    cache.get(CLOSED)["rows"].append(2)
+    assert cache.get(CLOSED) == {"rows": [1]}
+
+
+def test_memory_backend_ttl(monkeypatch):
+    backend = MemoryReportBackend()
+    backend.set("a", "1", time.time() + 10)
+    assert backend.get("a") == "1"
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+
+def test_memory_backend_lru():
+    backend = MemoryReportBackend(maxSize=2)
+    expiresAt = time.time() + 60
+    backend.set("a", "1", expiresAt)
+    backend.set("b", "2", expiresAt)
+    backend.get("a")
+    backend.set("c", "3", expiresAt)
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+
+
+def test_disk_backend_ttl(tmp_path, monkeypatch):
+    backend = DiskReportBackend(tmp_path)
+    backend.set("a", '{"rows": []}', time.time() + 10)
+    assert backend.get("a") == '{"rows": []}'
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert backend.get("a") is None
+    assert len(backend) == 0
+
+
+def test_disk_backend_lru(tmp_path):
+    backend = DiskReportBackend(tmp_path, maxSize=10)
+    expiresAt = time.time() + 60
+    for index in range(10):
+        backend.set(f"k{index}", "{}", expiresAt)
+        os.utime(tmp_path / f"k{index}.json", (index, index))
+    ## k0 is read: it becomes the most recently used
+    assert backend.get("k0") == "{}"
+    backend.set("k10", "{}", expiresAt)
+    ## evicted down to 90% of maxSize: the 2 least recently used are removed
+    assert len(backend) == 9
+    assert backend.get("k1") is None
+    assert backend.get("k2") is None
+    assert backend.get("k0") == "{}"
+    assert backend.get("k10") == "{}"
+
+
+def test_disk_backend_does_not_scan_the_folder_on_each_write(tmp_path, monkeypatch):
+    backend = DiskReportBackend(tmp_path, maxSize=50, sweepEvery=0)
+    scans = []
+    monkeypatch.setattr(backend, "_evict", lambda: scans.append(1))
+    expiresAt = time.time() + 60
+    for index in range(50):
+        backend.set(f"k{index}", "{}", expiresAt)
+    ## rewriting an existing response does not change the number of files
+    backend.set("k0", "{}", expiresAt)
+    assert scans == []
+    backend.set("k50", "{}", expiresAt)
+    assert scans == [1]
+
+
+def test_disk_backend_sweeps_expired_responses(tmp_path):
+    backend = DiskReportBackend(tmp_path, sweepEvery=3)
+    backend.set("old1", "{}", time.time() - 1)
+    backend.set("old2", "{}", time.time() - 1)
+    backend.set("new", "{}", time.time() + 60)
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["new.json"]
+
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    ReportCache(backend="disk", path=tmp_path).set(CLOSED, None, {"rows": [1]})
+    assert ReportCache(backend="disk", path=tmp_path).get(CLOSED) == {"rows": [1]}
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError):
+        ReportCache(backend="redis")
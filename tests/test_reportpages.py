@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+REQUEST = {
+    "dataId": "dv1",
+    "dimension": "variables/page",
+    "settings": {"limit": 2},
+    "statistics": {},
+    "metricContainer": {"metrics": [{"columnId": "0", "id": "metrics/visits"}]},
+}
+
+
+def reportApi(totalPages=4, pageSize=2, errorPage=None):
+    """
+    Report endpoint answering pageSize rows per page, slower for the first pages so the pages complete out of order.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def api(method, path, params, body):
+        page = body["settings"]["page"]
+        with lock:
+            calls.append(page)
+        time.sleep(0.01 * (totalPages - page))
+        if page == errorPage:
+            return {"errorCode": "500", "errorDescription": "failed"}
+        rows = [
+            {"itemId": f"{page}.{i}", "value": f"p{page}r{i}", "data": [page]}
+            for i in range(pageSize)
+        ]
+        return {
+            "rows": rows,
+            "totalPages": totalPages,
+            "numberOfElements": pageSize,
+            "lastPage": page == totalPages - 1,
+        }
+
+    return api, calls
+
+
+@pytest.mark.parametrize("parallel_pages", [1, 3])
+def test_pages_are_concatenated_in_order(cja, parallel_pages):
+    cja.fakeApi, calls = reportApi()
+    rows = cja.getReport(REQUEST, limit=2, returnClass=False, parallel_pages=parallel_pages)
+    assert [row["itemId"] for row in rows] == [f"{p}.{i}" for p in range(4) for i in range(2)]
+    assert sorted(calls) == [0, 1, 2, 3]
+
+
+def test_each_page_is_requested_once(cja):
+    cja.fakeApi, calls = reportApi(totalPages=8)
+    cja.getReport(REQUEST, limit=2, returnClass=False, parallel_pages=4)
+    assert sorted(calls) == list(range(8))
+
+
+def test_the_request_is_not_modified(cja):
+    cja.fakeApi, calls = reportApi()
+    request = {**REQUEST, "settings": dict(REQUEST["settings"])}
+    cja.getReport(request, limit=2, returnClass=False, parallel_pages=3)
+    cja.getReport(request, limit=2, returnClass=False)
+    assert request["settings"] == {"limit": 2}
+
+
+def test_n_results_limits_the_pages(cja):
+    cja.fakeApi, calls = reportApi(totalPages=10)
+    rows = cja.getReport(REQUEST, limit=2, n_results=5, returnClass=False, parallel_pages=4)
+    assert sorted(calls) == [0, 1, 2]
+    assert len(rows) == 6
+
+
+def test_failed_page_raises(cja):
+    cja.fakeApi, calls = reportApi(errorPage=2)
+    with pytest.raises(ValueError):
+        cja.getReport(REQUEST, limit=2, returnClass=False, parallel_pages=3)
@@ -0,0 +1,98 @@
+import pytest
+import requests
+
+from cjapy.connector import RetryPolicy
+
+from conftest import FakeResponse
+
+ENDPOINT = "https://cja.adobe.io"
+
+
+@pytest.mark.parametrize(
+    "method, path, statusCode, expected",
+    [
+        ("GET", "/filters", 503, True),
+        ("GET", "/filters", 504, True),
+        ("POST", "/filters", 503, False),
+        ("POST", "/filters", 504, False),
+        ("PATCH", "/filters/s1", 502, False),
+        ("POST", "/filters", 429, True),
+        ("PUT", "/filters/s1", 503, True),
+        ("DELETE", "/filters/s1", 503, True),
+        ("POST", "/reports", 503, True),
+        ("POST", "/reports", 504, False),
+        ("POST", "/reports", 429, True),
+    ],
+)
+def test_is_retryable(method, path, statusCode, expected):
+    assert RetryPolicy().isRetryable(statusCode, None, method, ENDPOINT + path) == expected
+
+
+def test_throttle_error_code_is_always_retried():
+    assert RetryPolicy().isRetryable(400, "429050", "POST", ENDPOINT + "/projects")
+
+
+def test_non_idempotent_retries_are_opt_in():
+    policy = RetryPolicy(retryNonIdempotent=True)
+    assert policy.isRetryable(503, None, "POST", ENDPOINT + "/filters")
+    assert policy.canRetryConnectionError("POST", ENDPOINT + "/filters")
+    assert RetryPolicy().canRetryConnectionError("POST", ENDPOINT + "/filters") == False
+    assert RetryPolicy().canRetryConnectionError("POST", ENDPOINT + "/reports")
+    assert RetryPolicy().canRetryConnectionError("GET", ENDPOINT + "/filters")
+
+
+def test_default_max_elapsed_is_short():
+    assert RetryPolicy().maxElapsed <= 120
+
+
+def sendRequests(cja, method, path, responses):
+    calls = []
+
+    def request(requestMethod, url, **kwargs):
+        calls.append(requestMethod)
+        response = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    cja.connector.retryPolicy = RetryPolicy(backoffFactor=0)
+    cja.connector.session.request = request
+    res = cja.connector._sendRequest(method, cja.endpoint + path)
+    return res, calls
+
+
+def test_create_is_not_sent_twice_after_an_error(cja):
+    res, calls = sendRequests(cja, "POST", "/filters", [FakeResponse({}, 503), FakeResponse({"id": "s1"})])
+    assert res.status_code == 503
+    assert len(calls) == 1
+
+
+def test_create_is_not_sent_twice_after_a_connection_error(cja):
+    with pytest.raises(requests.exceptions.ConnectionError):
+        sendRequests(cja, "POST", "/filters", [requests.exceptions.ConnectionError("reset")])
+
+
+def test_throttled_create_is_retried(cja):
+    res, calls = sendRequests(cja, "POST", "/filters", [FakeResponse({}, 429), FakeResponse({"id": "s1"})])
+    assert res.status_code == 200
+    assert len(calls) == 2
+
+
+def test_report_fails_fast_on_504(cja):
+    res, calls = sendRequests(cja, "POST", "/reports", [FakeResponse({}, 504), FakeResponse({"rows": []})])
+    assert res.status_code == 504
+    assert len(calls) == 1
+
+
+def test_get_is_retried(cja):
+    res, calls = sendRequests(cja, "GET", "/filters", [FakeResponse({}, 504), FakeResponse({"content": []})])
+    assert res.status_code == 200
+    assert len(calls) == 2
+
+
+def test_rest_time_is_a_deprecated_alias(cja):
+    with pytest.warns(DeprecationWarning):
+        cja.connector.restTime = 5
+    assert cja.connector.retryPolicy.maxBackoff == 5
+    with pytest.warns(DeprecationWarning):
+        assert cja.connector.restTime == 5
@@ -0,0 +1,96 @@
+import pytest
+
+JANUARY = {"A": 100, "B": 90, "C": 80}
+FEBRUARY = {"C": 100, "D": 95, "A": 1}
+
+
+def reportRequest(sort: dict = None, dimensionSort: str = None):
+    metric = {"columnId": "0", "id": "metrics/visits"}
+    metric.update(sort or {})
+    return {
+        "dataId": "dv_1",
+        "dimension": "variables/page",
+        "globalFilters": [
+            {"type": "dateRange", "dateRange": "2023-01-01T00:00:00.000/2023-03-01T00:00:00.000"}
+        ],
+        "settings": {"dimensionSort": dimensionSort} if dimensionSort else {},
+        "statistics": {},
+        "metricContainer": {"metrics": [metric]},
+    }
+
+
+def shardsApi(method, path, params, body):
+    assert method == "POST" and path == "/reports"
+    dateRange = [f["dateRange"] for f in body["globalFilters"] if f["type"] == "dateRange"][0]
+    items = JANUARY if dateRange.startswith("2023-01") else FEBRUARY
+    ## the API returns the shard ranked by visits, one page of "limit" rows
+    limit, page = body["settings"]["limit"], body["settings"].get("page", 0)
+    ranked = sorted(items.items(), key=lambda item: item[1], reverse=True)
+    rows = ranked[page * limit : (page + 1) * limit]
+    totalPages = -(-len(ranked) // limit)
+    return {
+        "rows": [{"itemId": key, "value": key, "data": [value]} for key, value in rows],
+        "lastPage": page + 1 >= totalPages,
+        "numberOfElements": len(rows),
+        "totalPages": totalPages,
+        "columns": {"columnIds": ["0"]},
+        "summaryData": {"totals": [sum(items.values())], "filteredTotals": [sum(items.values())]},
+    }
+
+
+def test_shards_with_different_top_items(cja):
+    cja.fakeApi = shardsApi
+    workspace = cja.getReport(reportRequest(), shardBy="month", n_results=2, limit=2)
+    df = workspace.dataframe
+    ## C is 3rd in January and 1st in February: 180 over the 2 months
+    assert df.iloc[:, 1].tolist() == ["C", "A"]
+    assert df.iloc[:, 2].tolist() == [180, 101]
+    assert workspace.summaryData["totals"] == [sum(JANUARY.values()) + sum(FEBRUARY.values())]
+
+
+def test_shards_use_the_metric_sort_of_the_request(cja):
+    cja.fakeApi = shardsApi
+    workspace = cja.getReport(reportRequest(sort={"sort": "asc"}), shardBy="month")
+    assert workspace.dataframe.iloc[:, 1].tolist() == ["B", "D", "A", "C"]
+
+
+def test_shards_use_the_dimension_sort_of_the_request(cja):
+    cja.fakeApi = shardsApi
+    workspace = cja.getReport(reportRequest(dimensionSort="desc"), shardBy="month", n_results=3)
+    assert workspace.dataframe.iloc[:, 1].tolist() == ["D", "C", "B"]
+
+
+def test_shards_refuse_undeclared_non_additive_metrics(cja):
+    cja.fakeApi = shardsApi
+    request = reportRequest()
+    request["metricContainer"]["metrics"][0]["id"] = "metrics/visitors"
+    with pytest.raises(ValueError):
+        cja.getReport(request, shardBy="month")
+    workspace = cja.getReport(request, shardBy="month", nonAdditiveMetrics=["metrics/visitors"])
+    assert workspace.nonAdditiveColumns == ["metrics/visitors"]
+    assert workspace.dataframe.iloc[:, 2].isna().all()
+    summed = cja.getReport(request, shardBy="month", nonAdditiveMetrics=[])
+    assert summed.nonAdditiveColumns == []
+    assert summed.dataframe.iloc[:, 2].tolist()[0] == 180
+
+
+def test_shards_are_capped_by_shard_results(cja):
+    posts = []
+
+    def api(method, path, params, body):
+        posts.append(body["settings"]["page"])
+        return shardsApi(method, path, params, body)
+
+    cja.fakeApi = api
+    workspace = cja.getReport(reportRequest(), shardBy="month", limit=2, shardResults=2)
+    ## one page of 2 rows per month instead of the 2 pages
+    assert posts == [0, 0]
+    assert workspace.truncatedShards == [
+        "2023-01-01T00:00:00.000/2023-02-01T00:00:00.000",
+        "2023-02-01T00:00:00.000/2023-03-01T00:00:00.000",
+    ]
+    full = cja.getReport(reportRequest(), shardBy="month", limit=2, shardResults="inf")
+    assert full.truncatedShards == []
+    assert len(full.dataframe) == 4
+    with pytest.raises(ValueError):
+        cja.getReport(reportRequest(), shardBy="month", n_results=10, shardResults=5)
@@ -0,0 +1,94 @@
+import json
+
+import pandas as pd
+import pytest
+
+from cjapy.sinks import CSVSink, JSONLinesSink, ReportSink, getReportSink
+
+COLUMNS = ["itemId", "variables/page", "metrics/visits", "metrics/visits"]
+PAGES = [
+    [["1", "home", 10.0, 1.0], ["2", "search, results", 5.5, 2.0]],
+    [],
+    [["3", 'quote "page"', 0.0, 3.0]],
+]
+EXPECTED = pd.DataFrame(
+    [row for page in PAGES for row in page],
+    columns=["itemId", "variables/page", "metrics/visits", "metrics/visits.1"],
+)
+
+
+def writePages(sink):
+    with sink:
+        for page in PAGES:
+            sink.write(page)
+    return sink
+
+
+def test_duplicated_columns_get_a_suffix(tmp_path):
+    sink = writePages(CSVSink(tmp_path / "report.csv", COLUMNS))
+    assert sink.columns == list(EXPECTED.columns)
+    assert sink.rows == 3
+
+
+def test_csv_round_trip(tmp_path):
+    writePages(getReportSink(str(tmp_path / "report.csv"), COLUMNS))
+    df = pd.read_csv(tmp_path / "report.csv", dtype={"itemId": str})
+    pd.testing.assert_frame_equal(df, EXPECTED)
+
+
+def test_jsonl_round_trip(tmp_path):
+    writePages(getReportSink(str(tmp_path / "report.jsonl"), COLUMNS))
+    with open(tmp_path / "report.jsonl") as f:
+        rows = [json.loads(line) for line in f]
+    pd.testing.assert_frame_equal(pd.DataFrame(rows), EXPECTED)
+    assert isinstance(JSONLinesSink(tmp_path / "other.jsonl", COLUMNS), JSONLinesSink)
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    writePages(getReportSink(str(tmp_path / "report.parquet"), COLUMNS))
+    df = pd.read_parquet(tmp_path / "report.parquet")
+    pd.testing.assert_frame_equal(df, EXPECTED)
+    assert df["metrics/visits"].dtype == "float64"
+
+
+def test_sink_must_implement_write_and_close(tmp_path):
+    class IncompleteSink(ReportSink):
+        def write(self, rows=None):
+            self.rows += len(rows)
+
+    with pytest.raises(TypeError):
+        IncompleteSink(str(tmp_path / "report.txt"), COLUMNS)
+
+
+def test_unknown_extension(tmp_path):
+    with pytest.raises(ValueError):
+        getReportSink(str(tmp_path / "report.xlsx"), COLUMNS)
+
+
+def test_get_report_streams_pages_to_the_sink(cja, tmp_path):
+    def api(method, path, params, body):
+        page = body["settings"].get("page", 0)
+        return {
+            "rows": [{"itemId": f"{page}{k}", "value": f"p{page}-{k}", "data": [k]} for k in range(2)],
+            "lastPage": page == 2,
+            "numberOfElements": 2,
+            "totalPages": 3,
+            "columns": {"columnIds": ["0"]},
+            "summaryData": {"totals": [6]},
+        }
+
+    cja.fakeApi = api
+    request = {
+        "dataId": "dv_1",
+        "dimension": "variables/page",
+        "globalFilters": [{"type": "dateRange", "dateRange": "2023-01-01T00:00:00.000/2023-02-01T00:00:00.000"}],
+        "settings": {},
+        "statistics": {},
+        "metricContainer": {"metrics": [{"columnId": "0", "id": "metrics/visits"}]},
+    }
+    summary = cja.getReport(request, sink=str(tmp_path / "report.csv"), limit=2)
+    assert summary["rows"] == 6
+    assert summary["pages"] == 3
+    df = pd.read_csv(tmp_path / "report.csv", dtype={"itemId": str})
+    assert df["itemId"].tolist() == ["00", "01", "10", "11", "20", "21"]
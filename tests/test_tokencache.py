@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+
+from cjapy.tokencache import TokenCache
+
+CONFIG = {"org_id": "org", "client_id": "client", "scopes": "openid"}
+OTHER_CONFIG = {"org_id": "org", "client_id": "other", "scopes": "openid"}
+
+
+def test_set_and_get(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    assert cache.getToken(CONFIG) is None
+    cache.setToken(CONFIG, "token1", 3600)
+    token = cache.getToken(CONFIG)
+    assert token["token"] == "token1"
+    assert 3590 < token["expiry"] <= 3600
+    assert cache.getToken(OTHER_CONFIG) is None
+
+
+def test_min_validity(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    cache.setToken(CONFIG, "token1", 60)
+    assert cache.getToken(CONFIG, minValidity=120) is None
+    assert cache.getToken(CONFIG, minValidity=30)["token"] == "token1"
+
+
+def test_expired_tokens_are_removed(tmp_path, monkeypatch):
+    cache = TokenCache(tmp_path / "tokens.json")
+    cache.setToken(CONFIG, "token1", 10)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 20)
+    assert cache.getToken(CONFIG) is None
+    cache.setToken(OTHER_CONFIG, "token2", 10)
+    assert list(cache._read().keys()) == [cache.getKey(OTHER_CONFIG)]
+
+
+def test_file_is_private(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    cache.setToken(CONFIG, "token1", 60)
+    if os.name == "posix":
+        assert oct(os.stat(tmp_path / "tokens.json").st_mode & 0o777) == "0o600"
+
+
+def test_unreadable_file_is_an_empty_cache(tmp_path):
+    (tmp_path / "tokens.json").write_text("not json")
+    assert TokenCache(tmp_path / "tokens.json").getToken(CONFIG) is None
+
+
+def test_get_or_retrieve_retrieves_once(tmp_path):
+    calls = []
+
+    def retrieve():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"token": "token1", "expiry": 3600}
+
+    caches = [TokenCache(tmp_path / "tokens.json") for _ in range(4)]
+    results = []
+    threads = [
+        threading.Thread(target=lambda cache=cache: results.append(cache.getOrRetrieve(CONFIG, retrieve)))
+        for cache in caches
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert {result["token"] for result in results} == {"token1"}
+
+
+def test_clear(tmp_path):
+    cache = TokenCache(tmp_path / "tokens.json")
+    cache.setToken(CONFIG, "token1", 60)
+    cache.setToken(OTHER_CONFIG, "token2", 60)
+    cache.clear(CONFIG)
+    assert cache.getToken(CONFIG) is None
+    assert cache.getToken(OTHER_CONFIG)["token"] == "token2"
+    cache.clear()
+    assert cache.getToken(OTHER_CONFIG) is None
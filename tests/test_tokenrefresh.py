@@ -0,0 +1,61 @@
+import threading
+import time
+
+from cjapy import token_provider
+
+
+def countingProvider(monkeypatch, calls, delay=0):
+    def provider(config, verbose=False, **kwargs):
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return {"token": f"token{len(calls)}", "expiry": 86400}
+
+    monkeypatch.setattr(token_provider, "get_oauth_token_and_expiry_for_config", provider)
+
+
+def test_concurrent_refresh_is_single_flight(cja, monkeypatch):
+    calls = []
+    countingProvider(monkeypatch, calls, delay=0.05)
+    cja.connector.config["date_limit"] = 0
+    threads = [threading.Thread(target=cja.connector._checkingDate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert cja.connector.token == "token1"
+    assert cja.connector.header["Authorization"] == "Bearer token1"
+
+
+def test_valid_token_is_not_refreshed(cja, monkeypatch):
+    calls = []
+    countingProvider(monkeypatch, calls)
+    cja.connector._checkingDate()
+    cja.connector._refreshToken(minValidity=60)
+    assert calls == []
+
+
+def test_background_refresh(cja, monkeypatch):
+    calls = []
+    countingProvider(monkeypatch, calls)
+    ## a margin longer than the token validity forces a refresh on each loop
+    cja.connector.startBackgroundRefresh(refreshMargin=90000)
+    deadline = time.time() + 5
+    while len(calls) == 0 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(calls) >= 1
+    assert calls[0] != threading.get_ident()
+    thread = cja.connector._refreshThread
+    cja.close()
+    thread.join(timeout=5)
+    assert thread.is_alive() == False
+
+
+def test_stop_background_refresh(cja, monkeypatch):
+    countingProvider(monkeypatch, [])
+    cja.connector.startBackgroundRefresh()
+    thread = cja.connector._refreshThread
+    assert thread.daemon
+    cja.connector.stopBackgroundRefresh()
+    assert thread.is_alive() == False
+    assert cja.connector._refreshThread is None
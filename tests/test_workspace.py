@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+from cjapy.workspace import Workspace
+
+REQUEST = {
+    "dataId": "dv1",
+    "dimension": "variables/page",
+    "globalFilters": [{"type": "dateRange", "dateRange": "2026-01-01T00:00:00.000/2026-02-01T00:00:00.000"}],
+    "metricContainer": {
+        "metrics": [
+            {"columnId": "0", "id": "metrics/visits"},
+            {"columnId": "1", "id": "metrics/pageviews"},
+        ]
+    },
+    "settings": {"limit": 10},
+    "statistics": {},
+}
+
+
+def reportApi(rows):
+    def api(method, path, params, body):
+        return {
+            "rows": rows,
+            "columns": {"columnIds": ["0", "1"]},
+            "summaryData": {"totals": [0, 0]},
+            "lastPage": True,
+        }
+
+    return api
+
+
+def test_columns_dtypes(cja):
+    cja.fakeApi = reportApi(
+        [
+            {"itemId": "1", "value": "home", "data": [10, 20]},
+            {"itemId": "2", "value": "search", "data": [1.5, 3]},
+        ]
+    )
+    df = cja.getReport(REQUEST).dataframe
+    assert list(df.columns) == ["itemId", "variables/page", "metrics/visits", "metrics/pageviews"]
+    assert isinstance(df["itemId"].dtype, pd.CategoricalDtype)
+    assert df["metrics/visits"].dtype == "float64"
+    assert df["metrics/pageviews"].dtype == "float64"
+    assert df["metrics/visits"].tolist() == [10.0, 1.5]
+
+
+def test_duplicated_item_keeps_first_position_with_last_values(cja):
+    cja.fakeApi = reportApi(
+        [
+            {"itemId": "1", "value": "home", "data": [10, 20]},
+            {"itemId": "2", "value": "search", "data": [1, 2]},
+            {"itemId": "1", "value": "home", "data": [30, 40]},
+        ]
+    )
+    df = cja.getReport(REQUEST).dataframe
+    assert df["itemId"].tolist() == ["1", "2"]
+    assert df["metrics/visits"].tolist() == [30.0, 1.0]
+
+
+def test_empty_report_has_named_columns(cja):
+    cja.fakeApi = reportApi([])
+    df = cja.getReport(REQUEST).dataframe
+    assert len(df) == 0
+    assert list(df.columns) == ["itemId", "variables/page", "metrics/visits", "metrics/pageviews"]
+
+
+def test_columns_mismatch_raises():
+    data = pd.DataFrame([["1", "home", 10.0]], columns=range(3))
+    with pytest.raises(ValueError):
+        Workspace(
+            data,
+            dataRequest=dict(REQUEST, settings={"limit": 10, "page": 0}),
+            columns={"columnIds": ["0", "1"]},
+            metrics={"0": "metrics/visits", "1": "metrics/pageviews"},
+            resolveColumns=False,
+        )
+
+
+def test_multi_report_keeps_its_columns():
+    data = pd.DataFrame({"variables/page": ["home"], "metrics/visits": [1.0]})
+    workspace = Workspace(
+        data,
+        dataRequest=dict(REQUEST, settings={"limit": 10, "page": 0}),
+        reportType="multi",
+    )
+    assert workspace.columns == ["variables/page", "metrics/visits"]